@@ -1,25 +1,72 @@
-"""Public API for the Hybrid Verifier Toolkit."""
-
-from .registry import register_task, get_task_config
-from .orchestrator import HybridVerifier
-from .types import VerificationResult, Provenance
-from .builtins import register_builtin_tasks
-from .eval import evaluate_dataset, load_jsonl_dataset, EvalMetrics, EvalExample
-from .synlogic import (
-    SynLogicExample,
-    SynLogicTask,
-    default_tasks,
-    synthesize_dataset,
-    export_jsonl,
+"""Public API for the Hybrid Verifier Toolkit.
+
+Only the registry, task specs and shared types are imported eagerly; everything else
+(and with it NumPy/SymPy) is resolved on first attribute access via :func:`__getattr__`.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+from .registry import (
+    register_task,
+    register_task_spec,
+    get_task_config,
+    restore_registry,
+    snapshot_registry,
 )
-from .integrations import VerifierRewardAdapter, build_trl_reward_fn
+from .specs import ComponentSpec, JudgeStageSpec, TaskSpec
+from .types import JudgeStage, VerificationResult, Provenance
+
+if TYPE_CHECKING:
+    from .batch import VerificationBatchResult
+    from .orchestrator import HybridVerifier
+    from .multitask import MultiTaskVerifier
+    from .builtins import register_builtin_tasks
+    from .eval import evaluate_dataset, load_jsonl_dataset, EvalMetrics, EvalExample
+    from .synlogic import (
+        SynLogicExample,
+        SynLogicTask,
+        default_tasks,
+        synthesize_dataset,
+        export_jsonl,
+    )
+    from .integrations import VerifierRewardAdapter, build_trl_reward_fn
+
+_LAZY_ATTRS = {
+    "HybridVerifier": ".orchestrator",
+    "VerificationBatchResult": ".batch",
+    "MultiTaskVerifier": ".multitask",
+    "register_builtin_tasks": ".builtins",
+    "evaluate_dataset": ".eval",
+    "load_jsonl_dataset": ".eval",
+    "EvalMetrics": ".eval",
+    "EvalExample": ".eval",
+    "SynLogicExample": ".synlogic",
+    "SynLogicTask": ".synlogic",
+    "default_tasks": ".synlogic",
+    "synthesize_dataset": ".synlogic",
+    "export_jsonl": ".synlogic",
+    "VerifierRewardAdapter": ".integrations",
+    "build_trl_reward_fn": ".integrations",
+}
 
 __all__ = [
     "register_task",
+    "register_task_spec",
     "get_task_config",
+    "snapshot_registry",
+    "restore_registry",
+    "TaskSpec",
+    "ComponentSpec",
+    "JudgeStageSpec",
     "HybridVerifier",
+    "MultiTaskVerifier",
     "VerificationResult",
+    "VerificationBatchResult",
     "Provenance",
+    "JudgeStage",
     "register_builtin_tasks",
     "evaluate_dataset",
     "load_jsonl_dataset",
@@ -33,3 +80,16 @@ __all__ = [
     "VerifierRewardAdapter",
     "build_trl_reward_fn",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
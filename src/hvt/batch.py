@@ -0,0 +1,227 @@
+"""Columnar results for batch verification.
+
+:class:`VerificationBatchResult` keeps verdicts, scores and the per-item flags in
+typed ``array.array`` buffers and exposes them as read-only NumPy views, so reward
+and metric code can work on whole batches without touching per-item objects. The
+:class:`~hvt.types.VerificationResult`, :class:`~hvt.types.Provenance` and diagnostics
+dicts for an item are only built when that item is accessed.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Sequence as SequenceABC
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, overload
+
+from .types import Provenance, VerificationResult, Verdict
+
+if TYPE_CHECKING:
+    import numpy as np
+
+STAGES = ("cache_lookup", "rule", "judge", "calibration", "cache_write")
+_STAGE_INDEX = {stage: position for position, stage in enumerate(STAGES)}
+_PASS = Verdict.PASS.value
+_FAIL = Verdict.FAIL.value
+
+
+class VerificationBatchResult(SequenceABC):
+    """Results of one ``verify_batch`` call, stored column-wise.
+
+    Indexing returns a :class:`VerificationResult` materialized on first access (and
+    memoized, so mutations stick). The ``record_*`` methods are used by the verifier
+    while it fills the batch.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        task_name: str,
+        rule_name: str,
+        model_names: Sequence[str] = (),
+    ) -> None:
+        self.task_name = task_name
+        self.rule_name = rule_name
+        self.model_names = list(model_names)
+        self.timestamp = datetime.now(timezone.utc)
+        self._size = size
+        self._verdicts = array("b", [_FAIL]) * size
+        self._scores = array("d", [0.0]) * size
+        self._rule_passed = array("b", [0]) * size
+        self._judge_invoked = array("b", [0]) * size
+        self._cache_hit = array("b", [0]) * size
+        self._model_confidence = array("d", [math.nan]) * size
+        self._model_index = array("h", [0 if self.model_names else -1]) * size
+        self._timings = array("d", [math.nan]) * (size * len(STAGES))
+        self._rule_diagnostics: List[Optional[Dict[str, Any]]] = [None] * size
+        self._extras: Dict[int, Dict[str, Any]] = {}
+        self._items: List[Optional[VerificationResult]] = [None] * size
+
+    # -- filling ------------------------------------------------------------------
+
+    def record_cached(self, idx: int, result: VerificationResult) -> None:
+        provenance = result.provenance
+        provenance.cache_hit = True
+        self._items[idx] = result
+        self._verdicts[idx] = result.verdict.value
+        self._scores[idx] = result.score
+        self._rule_passed[idx] = provenance.rule_passed
+        self._judge_invoked[idx] = provenance.model_invoked
+        self._cache_hit[idx] = 1
+        if provenance.model_confidence is not None:
+            self._model_confidence[idx] = provenance.model_confidence
+
+    def record_rule(self, idx: int, passed: bool, diagnostics: Dict[str, Any]) -> None:
+        self._rule_passed[idx] = passed
+        self._rule_diagnostics[idx] = diagnostics
+        if passed:
+            self._verdicts[idx] = _PASS
+            self._scores[idx] = 1.0
+
+    def record_skip(self, idx: int, confidence: float) -> None:
+        self._extras.setdefault(idx, {}).update(judge_skipped=True, skip_confidence=confidence)
+
+    def record_judge(
+        self,
+        idx: int,
+        stage: int,
+        judge_score: float,
+        score: float,
+        passed: bool,
+        cascade: Optional[List[dict]] = None,
+    ) -> None:
+        self._judge_invoked[idx] = 1
+        self._model_index[idx] = stage
+        self._model_confidence[idx] = judge_score
+        self._scores[idx] = score
+        self._verdicts[idx] = _PASS if passed else _FAIL
+        if cascade is not None:
+            self._extras.setdefault(idx, {})["judge_cascade"] = cascade
+
+    def add_timing(self, idx: int, stage: str, seconds: float) -> None:
+        offset = idx * len(STAGES) + _STAGE_INDEX[stage]
+        current = self._timings[offset]
+        self._timings[offset] = seconds if math.isnan(current) else current + seconds
+        item = self._items[idx]
+        if item is not None:
+            item.provenance.extra["timings"] = self.timings(idx)
+
+    # -- columns ------------------------------------------------------------------
+
+    @staticmethod
+    def _view(buffer: array, dtype: str) -> "np.ndarray":
+        import numpy as np
+
+        view = np.frombuffer(buffer, dtype=dtype)
+        view.flags.writeable = False
+        return view
+
+    @property
+    def verdicts(self) -> "np.ndarray":
+        """``int8`` :class:`Verdict` values."""
+
+        return self._view(self._verdicts, "int8")
+
+    @property
+    def passed(self) -> "np.ndarray":
+        return self.verdicts == _PASS
+
+    @property
+    def scores(self) -> "np.ndarray":
+        return self._view(self._scores, "float64")
+
+    @property
+    def rule_passed(self) -> "np.ndarray":
+        return self._view(self._rule_passed, "bool")
+
+    @property
+    def judge_invoked(self) -> "np.ndarray":
+        return self._view(self._judge_invoked, "bool")
+
+    @property
+    def cache_hit(self) -> "np.ndarray":
+        return self._view(self._cache_hit, "bool")
+
+    @property
+    def model_confidence(self) -> "np.ndarray":
+        """Raw judge score of the deciding stage, ``nan`` where no judge decided."""
+
+        return self._view(self._model_confidence, "float64")
+
+    @property
+    def stage_seconds(self) -> "np.ndarray":
+        """``(len(self), len(STAGES))`` durations, ``nan`` for stages an item skipped."""
+
+        return self._view(self._timings, "float64").reshape(self._size, len(STAGES))
+
+    def stage_durations(self, stage: str) -> array:
+        """Durations of ``stage`` for every item (``nan`` where skipped), without NumPy."""
+
+        return self._timings[_STAGE_INDEX[stage] :: len(STAGES)]
+
+    # -- per-item access ----------------------------------------------------------
+
+    def timings(self, idx: int) -> Dict[str, float]:
+        offset = idx * len(STAGES)
+        return {
+            stage: seconds
+            for stage, seconds in zip(STAGES, self._timings[offset : offset + len(STAGES)])
+            if not math.isnan(seconds)
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    @overload
+    def __getitem__(self, idx: int) -> VerificationResult: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[VerificationResult]: ...
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[position] for position in range(*idx.indices(self._size))]
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError("batch index out of range")
+        item = self._items[idx]
+        if item is None:
+            item = self._items[idx] = self._materialize(idx)
+        return item
+
+    def provenance(self, idx: int) -> Provenance:
+        return self[idx].provenance
+
+    def diagnostics(self, idx: int) -> Dict[str, Any]:
+        return self[idx].diagnostics
+
+    def to_list(self) -> List[VerificationResult]:
+        return [self[idx] for idx in range(self._size)]
+
+    def _materialize(self, idx: int) -> VerificationResult:
+        extra: Dict[str, Any] = {"timings": self.timings(idx)}
+        extra.update(self._extras.get(idx, {}))
+        model_index = self._model_index[idx]
+        confidence = self._model_confidence[idx]
+        diagnostics: Dict[str, Any] = {"rule": self._rule_diagnostics[idx]}
+        if self._judge_invoked[idx]:
+            diagnostics["judge_score"] = confidence
+        return VerificationResult(
+            verdict=Verdict(self._verdicts[idx]),
+            score=self._scores[idx],
+            provenance=Provenance(
+                task_name=self.task_name,
+                rule_name=self.rule_name,
+                rule_passed=bool(self._rule_passed[idx]),
+                model_name=self.model_names[model_index] if model_index >= 0 else None,
+                model_invoked=bool(self._judge_invoked[idx]),
+                model_confidence=None if math.isnan(confidence) else confidence,
+                cache_hit=False,
+                timestamp=self.timestamp,
+                extra=extra,
+            ),
+            diagnostics=diagnostics,
+        )
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
-from .registry import get_task_config, register_task
-from .rules import LogicSATRule, PythonUnitTestRule, gsm8k_exact_match, sympy_equivalence
+from .registry import get_task_config, register_task_spec
+from .specs import ComponentSpec, TaskSpec
 
 _REGISTERED = False
-_TASK_NAMES = [
-    "gsm8k_builtin",
-    "math_expr_builtin",
-    "logic_sat_builtin",
-    "code_exec_builtin",
-]
+_BUILTIN_RULES = {
+    "gsm8k_builtin": ComponentSpec("hvt.rules.math:gsm8k_exact_match", call=False),
+    "math_expr_builtin": ComponentSpec("hvt.rules.math:sympy_equivalence", call=False),
+    "logic_sat_builtin": ComponentSpec("hvt.rules.logic:LogicSATRule"),
+    "code_exec_builtin": ComponentSpec("hvt.rules.code:PythonUnitTestRule"),
+}
+_TASK_NAMES = list(_BUILTIN_RULES)
 
 
 def _task_exists(name: str) -> bool:
@@ -24,30 +25,19 @@ def _task_exists(name: str) -> bool:
         return False
 
 
+def builtin_task_specs(cache_dir: Optional[str] = None) -> List[TaskSpec]:
+    return [
+        TaskSpec(name=name, rule=rule, cache_dir=cache_dir)
+        for name, rule in _BUILTIN_RULES.items()
+    ]
+
+
 def register_builtin_tasks(cache_dir: Optional[str] = None) -> None:
     global _REGISTERED
     if _REGISTERED and all(_task_exists(name) for name in _TASK_NAMES):
         return
 
-    register_task(
-        name="gsm8k_builtin",
-        rule_fn=gsm8k_exact_match,
-        cache_dir=cache_dir,
-    )
-    register_task(
-        name="math_expr_builtin",
-        rule_fn=sympy_equivalence,
-        cache_dir=cache_dir,
-    )
-    register_task(
-        name="logic_sat_builtin",
-        rule_fn=LogicSATRule(),
-        cache_dir=cache_dir,
-    )
-    register_task(
-        name="code_exec_builtin",
-        rule_fn=PythonUnitTestRule(),
-        cache_dir=cache_dir,
-    )
+    for spec in builtin_task_specs(cache_dir):
+        register_task_spec(spec)
 
     _REGISTERED = True
@@ -0,0 +1,231 @@
+"""Streaming bulk verification of JSONL records (``hvt verify-batch``).
+
+Each input record is a JSON object with ``prompt``, ``candidate`` (or ``completion``
+/ ``response``), optional ``metadata``, optional ``task`` and an optional ``id`` that
+is echoed back. Records are read in chunks, grouped by task within a chunk and
+verified with ``verify_batch``, optionally across worker processes.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .multitask import MultiTaskVerifier
+from .orchestrator import HybridVerifier
+from .registry import restore_registry, snapshot_registry
+from .types import result_to_dict
+
+Record = Dict[str, object]
+
+# Only set inside pool workers (by _init_worker): routers hold verifiers built from
+# the registry at the time, so the calling process builds a fresh one per call.
+_WORKER_ROUTERS: Optional[Dict[Optional[str], MultiTaskVerifier]] = None
+
+
+@dataclass(frozen=True)
+class InvalidRecord:
+    """Stand-in for an input line that could not be parsed; verified as an error."""
+
+    error: str
+
+
+def iter_records(lines: Iterable[str]) -> Iterator[Tuple[int, Record]]:
+    """Yield ``(index, record)`` pairs, skipping blank lines; ``index`` counts records.
+
+    Lines that are not valid JSON yield an :class:`InvalidRecord` instead of raising.
+    """
+
+    index = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            record = InvalidRecord(f"invalid JSON: {exc}")
+        yield index, record
+        index += 1
+
+
+def _init_worker(initializer: Optional[Callable[..., object]], initargs: Sequence[object]) -> None:
+    global _WORKER_ROUTERS
+    _WORKER_ROUTERS = {}
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _worker_router(cache_dir: Optional[str]) -> MultiTaskVerifier:
+    if _WORKER_ROUTERS is None:
+        return MultiTaskVerifier(cache_dir=cache_dir)
+    router = _WORKER_ROUTERS.get(cache_dir)
+    if router is None:
+        router = _WORKER_ROUTERS[cache_dir] = MultiTaskVerifier(cache_dir=cache_dir)
+    return router
+
+
+def _candidate(record: Record) -> str:
+    return str(record.get("candidate") or record.get("completion") or record.get("response", ""))
+
+
+def _verify_group(
+    verifier: HybridVerifier,
+    task: str,
+    chunk: Sequence[Tuple[int, Record]],
+    positions: List[int],
+    outputs: List[Optional[Record]],
+    include_provenance: bool,
+) -> None:
+    records = [chunk[position][1] for position in positions]
+    try:
+        results = verifier.verify_batch(
+            [str(record.get("prompt", "")) for record in records],
+            [_candidate(record) for record in records],
+            [record.get("metadata") or {} for record in records],  # type: ignore[misc]
+        )
+    except Exception as exc:
+        if len(positions) == 1:
+            error = f"{type(exc).__name__}: {exc}"
+            outputs[positions[0]] = {"index": chunk[positions[0]][0], "task": task, "error": error}
+            return
+        # Retry record by record so the error lands only on the records that cause it.
+        for position in positions:
+            _verify_group(verifier, task, chunk, [position], outputs, include_provenance)
+        return
+    for position, result in zip(positions, results):
+        output: Record = {"index": chunk[position][0], "task": task}
+        output.update(result_to_dict(result, include_provenance=include_provenance))
+        outputs[position] = output
+
+
+def verify_chunk(
+    chunk: Sequence[Tuple[int, Record]],
+    *,
+    default_task: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    include_provenance: bool = True,
+    router: Optional[MultiTaskVerifier] = None,
+) -> List[Record]:
+    """Verify one chunk of records, returning output records in input order.
+
+    Problems (unparsable or non-object records, missing or unknown task, rule
+    exceptions) become an ``error`` field on
+    the affected records instead of aborting the stream. Without a ``router``, pool
+    workers reuse their per-process one and other callers build a fresh one.
+    """
+
+    if router is None:
+        router = _worker_router(cache_dir)
+    outputs: List[Optional[Record]] = [None] * len(chunk)
+    groups: Dict[str, List[int]] = {}
+    for position, (index, record) in enumerate(chunk):
+        if isinstance(record, InvalidRecord):
+            outputs[position] = {"index": index, "error": record.error}
+            continue
+        if not isinstance(record, dict):
+            outputs[position] = {"index": index, "error": "record is not a JSON object"}
+            continue
+        task = record.get("task") or default_task
+        if not task:
+            outputs[position] = {"index": index, "error": "record has no 'task'"}
+            continue
+        groups.setdefault(str(task), []).append(position)
+
+    for task, positions in groups.items():
+        try:
+            verifier = router.verifier(task)
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            for position in positions:
+                outputs[position] = {"index": chunk[position][0], "task": task, "error": error}
+            continue
+        _verify_group(verifier, task, chunk, positions, outputs, include_provenance)
+
+    for (_, record), output in zip(chunk, outputs):
+        if isinstance(record, dict) and "id" in record and output is not None:
+            output["id"] = record["id"]
+    return outputs  # type: ignore[return-value]
+
+
+def verify_records(
+    records: Iterable[Tuple[int, Record]],
+    *,
+    default_task: Optional[str] = None,
+    batch_size: int = 256,
+    workers: int = 1,
+    ordered: bool = True,
+    cache_dir: Optional[str] = None,
+    include_provenance: bool = True,
+    initializer: Optional[Callable[..., object]] = None,
+    initargs: Sequence[object] = (),
+) -> Iterator[Record]:
+    """Lazily verify ``(index, record)`` pairs ``batch_size`` at a time.
+
+    With ``workers > 1`` chunks run in a process pool with at most ``2 * workers``
+    in flight; ``ordered=False`` emits each chunk as soon as it finishes (records
+    keep their ``index`` so callers can restore order). ``initializer`` runs in each
+    worker and defaults to restoring a :func:`~hvt.registry.snapshot_registry` of
+    this process.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    kwargs = {
+        "default_task": default_task,
+        "cache_dir": cache_dir,
+        "include_provenance": include_provenance,
+    }
+    iterator = iter(records)
+
+    def _chunks() -> Iterator[List[Tuple[int, Record]]]:
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                return
+            yield chunk
+
+    if workers <= 1:
+        router = MultiTaskVerifier(cache_dir=cache_dir)
+        for chunk in _chunks():
+            yield from verify_chunk(chunk, router=router, **kwargs)
+        return
+
+    if initializer is None:
+        initializer, initargs = restore_registry, (snapshot_registry(),)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(initializer, tuple(initargs))
+    ) as pool:
+        if ordered:
+            in_flight: Deque[Future] = deque()
+            for chunk in _chunks():
+                in_flight.append(pool.submit(verify_chunk, chunk, **kwargs))
+                if len(in_flight) >= 2 * workers:
+                    yield from in_flight.popleft().result()
+            while in_flight:
+                yield from in_flight.popleft().result()
+            return
+
+        pending: Set[Future] = set()
+        for chunk in _chunks():
+            pending.add(pool.submit(verify_chunk, chunk, **kwargs))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        for future in as_completed(pending):
+            yield from future.result()
@@ -1,5 +1,14 @@
 """Calibration helpers."""
 
 from .quant_regressor import CalibrationExample, QuantitativeJudgeRegressorImpl
+from .online import RecursiveLeastSquaresCalibrator
+from .skip_policy import DiagnosticSkipPolicy, SkipObservation, diagnostic_signature
 
-__all__ = ["CalibrationExample", "QuantitativeJudgeRegressorImpl"]
+__all__ = [
+    "CalibrationExample",
+    "QuantitativeJudgeRegressorImpl",
+    "RecursiveLeastSquaresCalibrator",
+    "DiagnosticSkipPolicy",
+    "SkipObservation",
+    "diagnostic_signature",
+]
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping
+from pathlib import Path
+from typing import Iterable, List, Mapping, Sequence
 
 import numpy as np
 
 from ..types import QuantitativeJudgeRegressor
 
 
+def npz_path(path: str | Path) -> Path:
+    """``path`` with ``.npz`` appended unless it already ends in it (``calib.v2.npz``)."""
+
+    path = Path(path)
+    return path if path.suffix == ".npz" else path.with_name(path.name + ".npz")
+
+
 @dataclass(frozen=True)
 class CalibrationExample:
     judge_score: float
@@ -19,9 +27,9 @@ class CalibrationExample:
 
 class QuantitativeJudgeRegressorImpl(QuantitativeJudgeRegressor):
     def __init__(self, weights: np.ndarray, bias: float, feature_order: List[str]):
-        self.weights = weights
-        self.bias = bias
-        self.feature_order = feature_order
+        self.weights = np.asarray(weights, dtype=float)
+        self.bias = float(bias)
+        self.feature_order = list(feature_order)
 
     @classmethod
     def train(
@@ -51,3 +59,48 @@ class QuantitativeJudgeRegressorImpl(QuantitativeJudgeRegressor):
     def predict(self, judge_score: float, features: Mapping[str, float]) -> float:
         vector = np.array([features.get(name, 0.0) for name in self.feature_order])
         return float(vector @ self.weights + self.bias)
+
+    def feature_matrix(self, rows: Iterable[Mapping[str, float]]) -> np.ndarray:
+        """Stack feature mappings into a matrix whose columns follow ``feature_order``."""
+
+        return np.array(
+            [[row.get(name, 0.0) for name in self.feature_order] for row in rows],
+            dtype=float,
+        ).reshape(-1, len(self.feature_order))
+
+    def predict_batch(
+        self, judge_scores: Sequence[float], feature_matrix: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized :meth:`predict` over rows of ``feature_matrix`` (one per judge score)."""
+
+        matrix = np.asarray(feature_matrix, dtype=float)
+        if matrix.ndim != 2 or matrix.shape[1] != len(self.feature_order):
+            raise ValueError(
+                f"feature_matrix must have shape (n, {len(self.feature_order)}), "
+                f"got {matrix.shape}"
+            )
+        if len(judge_scores) != matrix.shape[0]:
+            raise ValueError("judge_scores and feature_matrix must have the same number of rows")
+        return matrix @ self.weights + self.bias
+
+    def save(self, path: str | Path) -> Path:
+        """Write the coefficients to an ``.npz`` archive, appending ``.npz`` if missing."""
+
+        path = npz_path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            weights=self.weights,
+            bias=np.array(self.bias),
+            feature_order=np.array(self.feature_order, dtype=str),
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "QuantitativeJudgeRegressorImpl":
+        with np.load(Path(path), allow_pickle=False) as archive:
+            return cls(
+                weights=archive["weights"],
+                bias=float(archive["bias"]),
+                feature_order=[str(name) for name in archive["feature_order"]],
+            )
@@ -0,0 +1,122 @@
+"""Judge-skip policies learned from logged rule diagnostics."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from ..types import JudgeSkipPolicy, VerificationResult, Verdict
+
+_EXCEPTION_RE = re.compile(r"\b([A-Z]\w*(?:Error|Exception|Exit))\b")
+_NUMERIC_RE = re.compile(r"[-+]?\d+(?:/\d+)?(?:\.\d+)?")
+
+
+def _describe(value: Any) -> str:
+    if isinstance(value, (bool, int)):
+        return str(value)
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        text = value.strip()
+        if not text:
+            return "empty"
+        exceptions = _EXCEPTION_RE.findall(text)
+        if exceptions:
+            return exceptions[-1]
+        return "numeric" if _NUMERIC_RE.fullmatch(text) else "text"
+    if isinstance(value, Mapping):
+        return "mapping"
+    return type(value).__name__
+
+
+def diagnostic_signature(rule_name: str, diagnostics: Mapping[str, Any]) -> str:
+    """Collapse rule diagnostics into a coarse, value-free pattern.
+
+    Integers (e.g. ``returncode``) are kept verbatim, strings are reduced to the last
+    exception name they mention or to ``numeric``/``text``/``empty``.
+    """
+
+    parts = [f"{key}={_describe(diagnostics[key])}" for key in sorted(diagnostics)]
+    return f"{rule_name}|{','.join(parts)}"
+
+
+@dataclass(frozen=True)
+class SkipObservation:
+    rule_name: str
+    diagnostics: Mapping[str, Any]
+    judge_passed: bool
+
+    @classmethod
+    def from_result(cls, result: VerificationResult) -> Optional["SkipObservation"]:
+        """Build an observation from a judged rule failure, or ``None`` if not applicable."""
+
+        provenance = result.provenance
+        if provenance.rule_passed or not provenance.model_invoked:
+            return None
+        return cls(
+            rule_name=provenance.rule_name,
+            diagnostics=result.diagnostics.get("rule", {}),
+            judge_passed=result.verdict is Verdict.PASS,
+        )
+
+
+class DiagnosticSkipPolicy(JudgeSkipPolicy):
+    """Skip the judge for diagnostic patterns that have (almost) always ended in FAIL.
+
+    The confidence is the Laplace-smoothed FAIL rate of the pattern; a pattern is
+    only trusted once it has been seen ``min_support`` times.
+    """
+
+    def __init__(self, *, min_support: int = 20, min_confidence: float = 0.98) -> None:
+        self.min_support = min_support
+        self.min_confidence = min_confidence
+        self._counts: Dict[str, List[int]] = {}
+
+    @classmethod
+    def train(
+        cls,
+        observations: Iterable[SkipObservation],
+        *,
+        min_support: int = 20,
+        min_confidence: float = 0.98,
+    ) -> "DiagnosticSkipPolicy":
+        policy = cls(min_support=min_support, min_confidence=min_confidence)
+        for obs in observations:
+            policy.observe(obs.rule_name, obs.diagnostics, obs.judge_passed)
+        return policy
+
+    def observe(self, rule_name: str, diagnostics: Mapping[str, Any], judge_passed: bool) -> None:
+        counts = self._counts.setdefault(diagnostic_signature(rule_name, diagnostics), [0, 0])
+        if not judge_passed:
+            counts[0] += 1
+        counts[1] += 1
+
+    def fail_confidence(self, rule_name: str, diagnostics: Mapping[str, Any]) -> float:
+        fails, total = self._counts.get(diagnostic_signature(rule_name, diagnostics), (0, 0))
+        return (fails + 1) / (total + 2)
+
+    def skip_confidence(self, rule_name: str, diagnostics: Mapping[str, Any]) -> Optional[float]:
+        _, total = self._counts.get(diagnostic_signature(rule_name, diagnostics), (0, 0))
+        if total < self.min_support:
+            return None
+        confidence = self.fail_confidence(rule_name, diagnostics)
+        return confidence if confidence >= self.min_confidence else None
+
+    def to_dict(self) -> dict:
+        return {
+            "min_support": self.min_support,
+            "min_confidence": self.min_confidence,
+            "counts": {sig: list(counts) for sig, counts in self._counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "DiagnosticSkipPolicy":
+        policy = cls(
+            min_support=int(payload.get("min_support", 20)),
+            min_confidence=float(payload.get("min_confidence", 0.98)),
+        )
+        policy._counts = {
+            sig: [int(c) for c in counts] for sig, counts in payload["counts"].items()
+        }
+        return policy
@@ -8,12 +8,15 @@ import sys
 from pathlib import Path
 from typing import List
 
-from . import HybridVerifier
 from .builtins import register_builtin_tasks
-from .eval import evaluate_dataset, load_jsonl_dataset
-from .synlogic import default_tasks, synthesize_dataset, export_jsonl
+from .multitask import MultiTaskVerifier
+from .orchestrator import HybridVerifier
+from .tracing import ChromeTraceCollector, Tracer, set_tracer
 from .types import provenance_to_dict
 
+# Subcommand handlers import their heavier dependencies (NumPy-backed eval, the
+# synthesis pipeline, the HTTP server) on entry so that `hvt verify` stays fast.
+
 
 def _load_metadata(path: str | None) -> dict:
     if not path:
@@ -22,6 +25,13 @@ def _load_metadata(path: str | None) -> dict:
         return json.load(fh)
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def _print_json(obj: dict) -> None:
     json.dump(obj, sys.stdout, ensure_ascii=False)
     sys.stdout.write("\n")
@@ -48,31 +58,252 @@ def _handle_verify(args: argparse.Namespace) -> int:
 
 
 def _handle_eval(args: argparse.Namespace) -> int:
+    from .eval import (
+        JsonlDataset,
+        evaluate_parallel,
+        evaluate_sampled,
+        evaluate_stream,
+        iter_jsonl_dataset,
+    )
+
     if args.use_builtins:
         register_builtin_tasks()
-    verifier = _build_verifier(args.task, args.cache_dir)
-    dataset = load_jsonl_dataset(args.dataset)
-    metrics = evaluate_dataset(verifier, dataset)
+
+    if args.ci_width is not None:
+        result = evaluate_sampled(
+            _build_verifier(args.task, args.cache_dir),
+            JsonlDataset(args.dataset),
+            ci_width=args.ci_width,
+            confidence=args.confidence,
+            method=args.ci_method,
+            seed=args.seed,
+        )
+        _print_json(result.to_dict())
+        return 0
+
+    if args.workers > 1 or args.shard_count > 1:
+        metrics = evaluate_parallel(
+            args.task,
+            args.dataset,
+            workers=args.workers,
+            shard_index=args.shard_index,
+            shard_count=args.shard_count,
+            cache_dir=args.cache_dir,
+            batch_size=args.batch_size,
+        )
+    else:
+        verifier = _build_verifier(args.task, args.cache_dir)
+
+        def _report(partial) -> None:
+            json.dump({"partial": partial.to_dict()}, sys.stderr, ensure_ascii=False)
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+        metrics = evaluate_stream(
+            verifier,
+            iter_jsonl_dataset(args.dataset),
+            batch_size=args.batch_size,
+            report_every=args.report_every,
+            on_progress=_report,
+        )
+    if args.output:
+        Path(args.output).write_text(json.dumps(metrics.to_dict()) + "\n", encoding="utf-8")
     _print_json(metrics.to_dict())
     return 0
 
 
+def _handle_eval_merge(args: argparse.Namespace) -> int:
+    from .eval import merge_metric_files
+
+    _print_json(merge_metric_files(args.partials).to_dict())
+    return 0
+
+
+def _handle_sweep(args: argparse.Namespace) -> int:
+    from .eval import ScoreRecords, collect_scores, iter_jsonl_dataset, threshold_sweep
+
+    if args.scores:
+        records = ScoreRecords.load(args.scores)
+    else:
+        if not (args.task and args.dataset):
+            raise SystemExit("sweep needs --scores or both --task and --dataset")
+        if args.use_builtins:
+            register_builtin_tasks()
+        verifier = _build_verifier(args.task, args.cache_dir)
+        records = collect_scores(verifier, iter_jsonl_dataset(args.dataset))
+        if args.save_scores:
+            records.save(args.save_scores)
+    sweep = threshold_sweep(records)
+    if args.curve_output:
+        with Path(args.curve_output).open("w", encoding="utf-8") as fh:
+            for row in sweep.to_rows():
+                fh.write(json.dumps(row) + "\n")
+    _print_json(
+        {
+            "num_examples": len(records),
+            "num_judged": int(records.judged.sum()),
+            "target_precision": args.target_precision,
+            "recommended": sweep.recommend(args.target_precision),
+        }
+    )
+    return 0
+
+
+def _handle_bench(args: argparse.Namespace) -> int:
+    from .eval import compare_to_baseline, run_benchmark
+
+    report = run_benchmark(
+        tasks=args.tasks, count=args.count, seed=args.seed, startup_repeats=args.startup_repeats
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    status = 0
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(report, baseline, tolerance=args.tolerance)
+        report = {**report, "regressions": regressions}
+        status = 1 if regressions else 0
+    _print_json(report)
+    return status
+
+
 def _handle_synthesize(args: argparse.Namespace) -> int:
+    from .synlogic import (
+        FunctionImplementationTask,
+        TemplateExpressionTask,
+        TrustPolicy,
+        default_tasks,
+        make_deduper,
+        stream_synthesis,
+        synthesize_parallel,
+    )
+
     register_builtin_tasks()
-    task_map = {task.name: task for task in default_tasks()}
+    defaults = default_tasks()
+    task_map = {
+        task.name: task
+        for task in [*defaults, FunctionImplementationTask(), TemplateExpressionTask()]
+    }
     if args.tasks:
         missing = set(args.tasks) - task_map.keys()
         if missing:
             raise SystemExit(f"Unknown SynLogic task(s): {', '.join(sorted(missing))}")
         selected = [task_map[name] for name in args.tasks]
     else:
-        selected = list(task_map.values())
+        selected = defaults
 
-    verifier_names = {"gsm8k_builtin", "logic_sat_builtin", "math_expr_builtin", "code_exec_builtin"}
-    lookup = {name: _build_verifier(name, args.cache_dir) for name in verifier_names}
-    dataset = synthesize_dataset(selected, lookup, per_task=args.count, seed=args.seed)
-    output_path = export_jsonl(dataset, args.output)
-    _print_json({"output": str(output_path), "num_examples": len(dataset)})
+    if args.output_dir:
+        mode = "--output"
+        flags = {
+            "--batch-size": args.batch_size is not None,
+            "--flush-every": args.flush_every is not None,
+            "--passed-only": args.passed_only,
+            "--dedupe": args.dedupe is not None,
+            "--trusted": args.trusted,
+        }
+    else:
+        mode = "--output-dir"
+        flags = {"--workers": args.workers is not None, "--chunk-size": args.chunk_size is not None}
+    unsupported = [flag for flag, given in flags.items() if given]
+    if unsupported:
+        raise SystemExit(f"{', '.join(unsupported)} only supported with {mode}")
+
+    deduper = None
+    if args.dedupe:
+        deduper = make_deduper(
+            args.dedupe, capacity=args.bloom_capacity, error_rate=args.bloom_error_rate
+        )
+
+    trust = None
+    if args.trusted:
+        trust = TrustPolicy(
+            audit_rate=args.audit_rate,
+            audit_first=args.audit_first,
+            tasks=args.trusted_tasks or None,
+            seed=args.seed,
+        )
+
+    if args.output_dir:
+        summary = synthesize_parallel(
+            selected,
+            args.output_dir,
+            per_task=args.count,
+            seed=args.seed,
+            workers=args.workers or 1,
+            chunk_size=args.chunk_size or 256,
+            cache_dir=args.cache_dir,
+        )
+        _print_json(summary)
+        return 0
+
+    lookup = MultiTaskVerifier(cache_dir=args.cache_dir)
+    summary = stream_synthesis(
+        selected,
+        lookup,
+        args.output,
+        per_task=args.count,
+        seed=args.seed,
+        batch_size=args.batch_size or 256,
+        keep_failed=not args.passed_only,
+        deduper=deduper,
+        trust=trust,
+        flush_every=1000 if args.flush_every is None else args.flush_every,
+    )
+    _print_json(summary)
+    return 0
+
+
+def _handle_verify_batch(args: argparse.Namespace) -> int:
+    from .bulk import iter_records, verify_records
+    from .eval.benchmark import open_text
+
+    if args.use_builtins:
+        register_builtin_tasks()
+    source = sys.stdin if args.input in (None, "-") else open_text(args.input)
+    sink = sys.stdout if args.output in (None, "-") else open_text(args.output, "w")
+    try:
+        outputs = verify_records(
+            iter_records(source),
+            default_task=args.task,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            ordered=not args.unordered,
+            cache_dir=args.cache_dir,
+            include_provenance=not args.no_provenance,
+        )
+        for output in outputs:
+            sink.write(json.dumps(output, ensure_ascii=False) + "\n")
+            if args.flush:
+                sink.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+def _handle_serve(args: argparse.Namespace) -> int:
+    from .server import VerificationService, make_server
+
+    if args.use_builtins:
+        register_builtin_tasks()
+    service = VerificationService(
+        cache_dir=args.cache_dir,
+        max_batch_size=args.max_batch_size,
+        max_wait=args.max_wait_ms / 1000.0,
+    )
+    for task in args.preload or []:
+        service.batcher(task)
+    server = make_server(args.host, args.port, service=service)
+    print(f"hvt serve listening on {server.url}", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
     return 0
 
 
@@ -84,6 +315,13 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Register built-in demo tasks before running the command",
     )
+    parser.add_argument("--trace-output", help="Write a Chrome trace-event JSON file here")
+    parser.add_argument(
+        "--trace-sample-rate",
+        type=float,
+        default=1.0,
+        help="Fraction of verify_batch calls to trace",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     verify_parser = subparsers.add_parser("verify", help="Verify a single candidate")
@@ -94,10 +332,113 @@ def build_parser() -> argparse.ArgumentParser:
 
     eval_parser = subparsers.add_parser("eval", help="Run evaluation on a dataset")
     eval_parser.add_argument("--task", required=True)
-    eval_parser.add_argument("--dataset", required=True)
+    eval_parser.add_argument("--dataset", required=True, help="JSONL dataset (.jsonl or .jsonl.gz)")
+    eval_parser.add_argument("--batch-size", type=_positive_int, default=64)
+    eval_parser.add_argument(
+        "--report-every",
+        type=int,
+        default=0,
+        help="Emit partial metrics to stderr every N examples",
+    )
+    eval_parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    eval_parser.add_argument("--shard-index", type=int, default=0)
+    eval_parser.add_argument("--shard-count", type=int, default=1)
+    eval_parser.add_argument("--output", help="Also write the (partial) metrics JSON here")
+    eval_parser.add_argument(
+        "--ci-width",
+        type=float,
+        help="Sample stratified examples until precision/recall intervals are this narrow",
+    )
+    eval_parser.add_argument("--confidence", type=float, default=0.95)
+    eval_parser.add_argument("--ci-method", choices=["wilson", "bootstrap"], default="wilson")
+    eval_parser.add_argument("--seed", type=int, default=0)
+
+    merge_parser = subparsers.add_parser("eval-merge", help="Merge partial eval metrics")
+    merge_parser.add_argument(
+        "partials", nargs="+", help="Metric JSON files from `hvt eval --output`"
+    )
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Sweep judge_min thresholds from a single scoring pass"
+    )
+    sweep_parser.add_argument("--task")
+    sweep_parser.add_argument("--dataset")
+    sweep_parser.add_argument("--scores", help="Reuse scores saved with --save-scores (.npz)")
+    sweep_parser.add_argument("--save-scores", help="Store collected scores (.npz)")
+    sweep_parser.add_argument("--target-precision", type=float, default=0.95)
+    sweep_parser.add_argument("--curve-output", help="Write the full PR curve as JSONL")
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark built-in task latency")
+    bench_parser.add_argument("--tasks", nargs="*", help="Subset of built-in tasks to benchmark")
+    bench_parser.add_argument("--count", type=int, default=50)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument(
+        "--startup-repeats",
+        type=int,
+        default=3,
+        help="Cold-interpreter startup probes per scenario (0 disables)",
+    )
+    bench_parser.add_argument("--output", help="Write the benchmark JSON here")
+    bench_parser.add_argument("--baseline", help="Compare against a stored benchmark JSON")
+    bench_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown before a metric counts as a regression",
+    )
 
     synth_parser = subparsers.add_parser("synthesize", help="Generate SynLogic-lite dataset")
-    synth_parser.add_argument("--output", required=True)
+    synth_output = synth_parser.add_mutually_exclusive_group(required=True)
+    synth_output.add_argument(
+        "--output", help="Single JSONL output file (.gz / .zst suffix compresses)"
+    )
+    synth_output.add_argument(
+        "--output-dir",
+        help="Write deterministic part-NNNNN.jsonl shards here (supports --workers)",
+    )
+    synth_parser.add_argument(
+        "--workers", type=_positive_int, help="Worker processes (--output-dir; default 1)"
+    )
+    synth_parser.add_argument(
+        "--batch-size", type=_positive_int, help="Verify batch size (--output; default 256)"
+    )
+    synth_parser.add_argument(
+        "--flush-every",
+        type=int,
+        help="Flush (and end the compressed block) every N records (--output; default 1000)",
+    )
+    synth_parser.add_argument(
+        "--passed-only",
+        action="store_true",
+        help="Drop examples whose canonical answer fails self-verification",
+    )
+    synth_parser.add_argument(
+        "--dedupe",
+        choices=["exact", "bloom"],
+        help="Skip repeated prompt/metadata pairs before verification",
+    )
+    synth_parser.add_argument("--bloom-capacity", type=int, default=1_000_000)
+    synth_parser.add_argument("--bloom-error-rate", type=float, default=0.001)
+    synth_parser.add_argument(
+        "--trusted",
+        action="store_true",
+        help="Trust generators and verify only an audit sample of their answers",
+    )
+    synth_parser.add_argument(
+        "--trusted-tasks",
+        nargs="*",
+        help="Limit --trusted to these SynLogic tasks (default: all selected)",
+    )
+    synth_parser.add_argument("--audit-rate", type=float, default=0.01)
+    synth_parser.add_argument(
+        "--audit-first", type=int, default=0, help="Always audit the first N examples per task"
+    )
+    synth_parser.add_argument(
+        "--chunk-size",
+        type=_positive_int,
+        help="Examples per RNG stream (--output-dir; default 256); output depends on it, "
+        "not on --workers",
+    )
     synth_parser.add_argument("--count", type=int, default=5)
     synth_parser.add_argument("--seed", type=int, default=42)
     synth_parser.add_argument(
@@ -106,21 +447,75 @@ def build_parser() -> argparse.ArgumentParser:
         help="Subset of SynLogic tasks to run",
     )
 
+    batch_parser = subparsers.add_parser(
+        "verify-batch", help="Verify JSONL records from stdin or a file, one result per line"
+    )
+    batch_parser.add_argument("--input", help="JSONL input (.gz supported); default stdin")
+    batch_parser.add_argument("--output", help="JSONL output (.gz supported); default stdout")
+    batch_parser.add_argument("--task", help="Task for records without a 'task' field")
+    batch_parser.add_argument("--batch-size", type=_positive_int, default=256)
+    batch_parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    batch_parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Emit chunks as they finish (records carry their input 'index')",
+    )
+    batch_parser.add_argument("--no-provenance", action="store_true")
+    batch_parser.add_argument(
+        "--flush", action="store_true", help="Flush output after every record"
+    )
+
+    serve_parser = subparsers.add_parser("serve", help="Run a batched verification service")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--max-batch-size", type=int, default=64)
+    serve_parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=5.0,
+        help="Longest an item waits for its micro-batch to fill",
+    )
+    serve_parser.add_argument(
+        "--preload", nargs="*", help="Tasks to build verifiers for at startup"
+    )
+
     return parser
 
 
-def main(argv: List[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+def _dispatch(parser: argparse.ArgumentParser, args: argparse.Namespace) -> int:
     if args.command == "verify":
         return _handle_verify(args)
     if args.command == "eval":
         return _handle_eval(args)
+    if args.command == "eval-merge":
+        return _handle_eval_merge(args)
+    if args.command == "sweep":
+        return _handle_sweep(args)
+    if args.command == "bench":
+        return _handle_bench(args)
     if args.command == "synthesize":
         return _handle_synthesize(args)
+    if args.command == "verify-batch":
+        return _handle_verify_batch(args)
+    if args.command == "serve":
+        return _handle_serve(args)
     parser.error("Unknown command")
     return 1
 
 
+def main(argv: List[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.trace_output:
+        return _dispatch(parser, args)
+    collector = ChromeTraceCollector(args.trace_output)
+    previous = set_tracer(Tracer([collector], sample_rate=args.trace_sample_rate))
+    try:
+        return _dispatch(parser, args)
+    finally:
+        set_tracer(previous)
+        collector.write()
+
+
 if __name__ == "__main__":  # pragma: no cover
     raise SystemExit(main())
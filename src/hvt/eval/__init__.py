@@ -1,12 +1,49 @@
 """Evaluation helpers."""
 
 from .adversarial import run_false_positive_suite
-from .benchmark import EvalExample, EvalMetrics, evaluate_dataset, load_jsonl_dataset
+from .mutations import AdversarialSample, MutationEngine, MutationFamily, run_mutation_suite
+from .benchmark import (
+    EvalExample,
+    EvalMetrics,
+    JsonlDataset,
+    SampledEvalResult,
+    bootstrap_intervals,
+    evaluate_dataset,
+    evaluate_sampled,
+    evaluate_stream,
+    iter_jsonl_dataset,
+    load_jsonl_dataset,
+    wilson_interval,
+)
+from .perf import bench_startup, compare_to_baseline, run_benchmark
+from .parallel import evaluate_parallel, merge_metric_files, merge_metrics
+from .sweep import ScoreRecords, ThresholdSweep, collect_scores, threshold_sweep
 
 __all__ = [
     "run_false_positive_suite",
+    "AdversarialSample",
+    "MutationEngine",
+    "MutationFamily",
+    "run_mutation_suite",
     "EvalExample",
     "EvalMetrics",
+    "JsonlDataset",
     "evaluate_dataset",
     "load_jsonl_dataset",
+    "iter_jsonl_dataset",
+    "evaluate_stream",
+    "evaluate_sampled",
+    "SampledEvalResult",
+    "wilson_interval",
+    "bootstrap_intervals",
+    "evaluate_parallel",
+    "merge_metrics",
+    "merge_metric_files",
+    "ScoreRecords",
+    "ThresholdSweep",
+    "collect_scores",
+    "threshold_sweep",
+    "run_benchmark",
+    "compare_to_baseline",
+    "bench_startup",
 ]
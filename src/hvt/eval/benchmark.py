@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import gzip
 import json
-from dataclasses import dataclass
+from array import array
+from collections.abc import Sequence as SequenceABC
+from dataclasses import dataclass, field, replace
+from itertools import islice
 from pathlib import Path
-from typing import List, Mapping, Sequence
+from statistics import NormalDist
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
 
 from ..orchestrator import HybridVerifier
-from ..types import Verdict
 
 
 @dataclass(slots=True)
@@ -17,15 +23,38 @@ class EvalExample:
     candidate: str
     metadata: Mapping[str, object]
     label: bool
+    task: Optional[str] = None
 
 
 @dataclass(slots=True)
 class EvalMetrics:
-    total: int
-    true_positive: int
-    false_positive: int
-    true_negative: int
-    false_negative: int
+    total: int = 0
+    true_positive: int = 0
+    false_positive: int = 0
+    true_negative: int = 0
+    false_negative: int = 0
+
+    def update(self, label: bool, predicted_positive: bool) -> None:
+        self.total += 1
+        if label and predicted_positive:
+            self.true_positive += 1
+        elif label:
+            self.false_negative += 1
+        elif predicted_positive:
+            self.false_positive += 1
+        else:
+            self.true_negative += 1
+
+    def update_many(self, labels: Sequence[bool], predicted_positive: np.ndarray) -> None:
+        """Vectorized :meth:`update` for a batch of labels and boolean predictions."""
+
+        labels_arr = np.asarray(labels, dtype=bool)
+        predicted = np.asarray(predicted_positive, dtype=bool)
+        self.total += int(labels_arr.size)
+        self.true_positive += int(np.count_nonzero(labels_arr & predicted))
+        self.false_negative += int(np.count_nonzero(labels_arr & ~predicted))
+        self.false_positive += int(np.count_nonzero(~labels_arr & predicted))
+        self.true_negative += int(np.count_nonzero(~labels_arr & ~predicted))
 
     @property
     def precision(self) -> float:
@@ -47,6 +76,27 @@ class EvalMetrics:
     def accuracy(self) -> float:
         return (self.true_positive + self.true_negative) / self.total if self.total else 0.0
 
+    def merge(self, other: "EvalMetrics") -> "EvalMetrics":
+        """Combine counts from disjoint partitions (shards, workers) exactly."""
+
+        return EvalMetrics(
+            total=self.total + other.total,
+            true_positive=self.true_positive + other.true_positive,
+            false_positive=self.false_positive + other.false_positive,
+            true_negative=self.true_negative + other.true_negative,
+            false_negative=self.false_negative + other.false_negative,
+        )
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, object]) -> "EvalMetrics":
+        return cls(
+            total=int(payload["total"]),
+            true_positive=int(payload["tp"]),
+            false_positive=int(payload["fp"]),
+            true_negative=int(payload["tn"]),
+            false_negative=int(payload["fn"]),
+        )
+
     def to_dict(self) -> dict:
         return {
             "total": self.total,
@@ -61,46 +111,302 @@ class EvalMetrics:
         }
 
 
-def load_jsonl_dataset(path: str | Path) -> List[EvalExample]:
+def open_text(path: str | Path, mode: str = "r") -> IO[str]:
+    """Open a text file, transparently (de)compressing ``.gz`` paths."""
+
     path = Path(path)
-    examples: List[EvalExample] = []
-    with path.open("r", encoding="utf-8") as fh:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def iter_jsonl_dataset(
+    path: str | Path,
+    *,
+    shard_index: int = 0,
+    shard_count: int = 1,
+) -> Iterator[EvalExample]:
+    """Lazily yield examples from a (optionally gzip-compressed) JSONL file.
+
+    With ``shard_count > 1`` only records whose position (ignoring blank lines) is
+    congruent to ``shard_index`` are parsed and yielded.
+    """
+
+    if not 0 <= shard_index < shard_count:
+        raise ValueError("shard_index must be in [0, shard_count)")
+    position = -1
+    with open_text(path) as fh:
         for line in fh:
             if not line.strip():
                 continue
-            payload = json.loads(line)
-            examples.append(
-                EvalExample(
-                    prompt=payload["prompt"],
-                    candidate=payload["candidate"],
-                    metadata=payload.get("metadata", {}),
-                    label=bool(payload.get("label", True)),
-                )
-            )
-    return examples
-
-
-def evaluate_dataset(verifier: HybridVerifier, dataset: Sequence[EvalExample]) -> EvalMetrics:
-    tp = fp = tn = fn = 0
-    for example in dataset:
-        result = verifier.verify(
-            prompt=example.prompt,
-            candidate_answer=example.candidate,
-            metadata=example.metadata,
+            position += 1
+            if position % shard_count != shard_index:
+                continue
+            yield _example_from_payload(json.loads(line))
+
+
+def _example_from_payload(payload: Mapping[str, object]) -> EvalExample:
+    return EvalExample(
+        prompt=payload["prompt"],  # type: ignore[arg-type]
+        candidate=payload["candidate"],  # type: ignore[arg-type]
+        metadata=payload.get("metadata", {}),  # type: ignore[arg-type]
+        label=bool(payload.get("label", True)),
+        task=payload.get("task"),  # type: ignore[arg-type]
+    )
+
+
+class JsonlDataset(SequenceABC):
+    """Random-access view of a JSONL dataset that keeps only offsets, labels and tasks.
+
+    One streaming pass indexes the file; examples are parsed again when accessed, so
+    memory grows with the number of records rather than their size. ``.gz`` files
+    seek by decompressing, so read batches with :meth:`fetch`, which visits them in
+    file order.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._offsets = array("q")
+        self._labels = array("b")
+        self._tasks: List[Optional[str]] = []
+        interned: Dict[str, str] = {}
+        offset = 0
+        with self._open() as fh:
+            for line in fh:
+                if line.strip():
+                    payload = json.loads(line)
+                    task = payload.get("task")
+                    self._offsets.append(offset)
+                    self._labels.append(bool(payload.get("label", True)))
+                    self._tasks.append(None if task is None else interned.setdefault(task, task))
+                offset += len(line)
+
+    def _open(self) -> IO[bytes]:
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, "rb")  # type: ignore[return-value]
+        return self.path.open("rb")
+
+    def strata_keys(self) -> Iterator[Tuple[bool, Optional[str]]]:
+        """``(label, task)`` of every record, without parsing the records again."""
+
+        return ((bool(label), task) for label, task in zip(self._labels, self._tasks))
+
+    def fetch(self, indices: Sequence[int]) -> List[EvalExample]:
+        """Parse the records at ``indices`` (in that order) in one pass over the file."""
+
+        examples: Dict[int, EvalExample] = {}
+        with self._open() as fh:
+            for idx in sorted(set(indices), key=self._offsets.__getitem__):
+                fh.seek(self._offsets[idx])
+                examples[idx] = _example_from_payload(json.loads(fh.readline()))
+        return [examples[idx] for idx in indices]
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        if isinstance(idx, slice):
+            return self.fetch(range(*idx.indices(len(self))))
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("dataset index out of range")
+        return self.fetch([idx])[0]
+
+
+def load_jsonl_dataset(path: str | Path) -> List[EvalExample]:
+    return list(iter_jsonl_dataset(path))
+
+
+def evaluate_stream(
+    verifier: HybridVerifier,
+    examples: Iterable[EvalExample],
+    *,
+    batch_size: int = 64,
+    report_every: int = 0,
+    on_progress: Optional[Callable[[EvalMetrics], None]] = None,
+) -> EvalMetrics:
+    """Evaluate an iterable in constant memory, batching calls to ``verify_columns``.
+
+    When ``report_every`` is positive, ``on_progress`` receives a copy of the running
+    metrics roughly every ``report_every`` examples (at batch boundaries).
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    metrics = EvalMetrics()
+    iterator = iter(examples)
+    next_report = report_every
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            break
+        results = verifier.verify_columns(
+            [example.prompt for example in batch],
+            [example.candidate for example in batch],
+            [example.metadata for example in batch],
         )
-        predicted_positive = result.verdict is Verdict.PASS
-        if example.label and predicted_positive:
-            tp += 1
-        elif example.label and not predicted_positive:
-            fn += 1
-        elif not example.label and predicted_positive:
-            fp += 1
+        metrics.update_many([example.label for example in batch], results.passed)
+        if report_every > 0 and on_progress is not None and metrics.total >= next_report:
+            on_progress(replace(metrics))
+            next_report = (metrics.total // report_every + 1) * report_every
+    return metrics
+
+
+def evaluate_dataset(verifier: HybridVerifier, dataset: Iterable[EvalExample]) -> EvalMetrics:
+    return evaluate_stream(verifier, dataset)
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+
+    if trials == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p_hat = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p_hat + z * z / (2 * trials)) / denom
+    half = z * np.sqrt(p_hat * (1 - p_hat) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+def bootstrap_intervals(
+    metrics: EvalMetrics,
+    *,
+    confidence: float = 0.95,
+    num_resamples: int = 1000,
+    rng: Optional[np.random.Generator] = None,
+) -> Dict[str, Tuple[float, float]]:
+    """Percentile bootstrap intervals for precision and recall.
+
+    Resampling examples with replacement only changes the four confusion counts, so
+    each resample is drawn directly as a multinomial over (tp, fp, tn, fn).
+    """
+
+    if metrics.total == 0:
+        return {"precision": (0.0, 1.0), "recall": (0.0, 1.0)}
+    rng = rng or np.random.default_rng()
+    counts = np.array(
+        [
+            metrics.true_positive,
+            metrics.false_positive,
+            metrics.true_negative,
+            metrics.false_negative,
+        ],
+        dtype=float,
+    )
+    draws = rng.multinomial(metrics.total, counts / counts.sum(), size=num_resamples)
+    tp, fp, _, fn = draws.T
+    precision = np.divide(tp, tp + fp, out=np.zeros(num_resamples), where=(tp + fp) > 0)
+    recall = np.divide(tp, tp + fn, out=np.zeros(num_resamples), where=(tp + fn) > 0)
+    tail = (1 - confidence) / 2 * 100
+    return {
+        name: (float(np.percentile(values, tail)), float(np.percentile(values, 100 - tail)))
+        for name, values in (("precision", precision), ("recall", recall))
+    }
+
+
+@dataclass(slots=True)
+class SampledEvalResult:
+    metrics: EvalMetrics
+    intervals: Dict[str, Tuple[float, float]]
+    population: int
+    converged: bool
+    strata: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            **self.metrics.to_dict(),
+            "population": self.population,
+            "converged": self.converged,
+            "intervals": {name: list(bounds) for name, bounds in self.intervals.items()},
+            "strata": dict(self.strata),
+        }
+
+
+def _allocate(sizes: np.ndarray, n: int) -> np.ndarray:
+    quotas = sizes * n / sizes.sum()
+    counts = np.floor(quotas).astype(int)
+    remainder = n - int(counts.sum())
+    counts[np.argsort(-(quotas - counts), kind="stable")[:remainder]] += 1
+    return np.minimum(counts, sizes)
+
+
+def evaluate_sampled(
+    verifier: HybridVerifier,
+    dataset: Sequence[EvalExample],
+    *,
+    ci_width: float = 0.02,
+    confidence: float = 0.95,
+    method: str = "wilson",
+    batch_size: int = 256,
+    seed: int = 0,
+    max_samples: Optional[int] = None,
+) -> SampledEvalResult:
+    """Evaluate a stratified random sample, growing it until the intervals are tight.
+
+    Examples are stratified by ``(label, task)`` and drawn without replacement in
+    proportion to stratum size, ``batch_size`` at a time. Sampling stops once both
+    the precision and recall intervals are at most ``ci_width`` wide (``0.02`` is
+    roughly "within +-1%"), or when the dataset or ``max_samples`` is exhausted.
+    Pass a :class:`JsonlDataset` to sample a file without loading every example.
+    """
+
+    if method not in {"wilson", "bootstrap"}:
+        raise ValueError("method must be 'wilson' or 'bootstrap'")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    rng = np.random.default_rng(seed)
+    strata_keys = getattr(dataset, "strata_keys", None)
+    fetch = getattr(dataset, "fetch", None)
+    keys_iter = (
+        strata_keys() if strata_keys is not None else ((ex.label, ex.task) for ex in dataset)
+    )
+    strata: Dict[Tuple[bool, Optional[str]], List[int]] = {}
+    for idx, key in enumerate(keys_iter):
+        strata.setdefault(key, []).append(idx)
+    keys = list(strata)
+    pools = [rng.permutation(strata[key]) for key in keys]
+    sizes = np.array([len(pool) for pool in pools])
+    drawn = np.zeros(len(keys), dtype=int)
+    limit = min(len(dataset), max_samples or len(dataset))
+
+    metrics = EvalMetrics()
+    intervals: Dict[str, Tuple[float, float]] = {"precision": (0.0, 1.0), "recall": (0.0, 1.0)}
+    converged = False
+    while metrics.total < limit and not converged:
+        target = _allocate(sizes, min(metrics.total + batch_size, limit))
+        indices = [
+            int(idx) for pool, start, stop in zip(pools, drawn, target) for idx in pool[start:stop]
+        ]
+        batch = fetch(indices) if fetch is not None else [dataset[idx] for idx in indices]
+        drawn = np.maximum(drawn, target)
+        if not batch:
+            break
+        results = verifier.verify_columns(
+            [example.prompt for example in batch],
+            [example.candidate for example in batch],
+            [example.metadata for example in batch],
+        )
+        metrics.update_many([example.label for example in batch], results.passed)
+
+        if method == "wilson":
+            tp = metrics.true_positive
+            intervals = {
+                "precision": wilson_interval(tp, tp + metrics.false_positive, confidence),
+                "recall": wilson_interval(tp, tp + metrics.false_negative, confidence),
+            }
         else:
-            tn += 1
-    return EvalMetrics(
-        total=len(dataset),
-        true_positive=tp,
-        false_positive=fp,
-        true_negative=tn,
-        false_negative=fn,
+            intervals = bootstrap_intervals(metrics, confidence=confidence, rng=rng)
+        converged = all(hi - lo <= ci_width for lo, hi in intervals.values())
+
+    return SampledEvalResult(
+        metrics=metrics,
+        intervals=intervals,
+        population=len(dataset),
+        converged=converged,
+        strata={
+            f"{'pos' if label else 'neg'}:{task or '*'}": int(count)
+            for (label, task), count in zip(keys, drawn)
+        },
     )
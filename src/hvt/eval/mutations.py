@@ -0,0 +1,282 @@
+"""Mutation engine and batched runner for large adversarial false-positive suites."""
+
+from __future__ import annotations
+
+import random
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from ..orchestrator import HybridVerifier
+from ..synlogic.tasks import SynLogicExample
+
+MutateFn = Callable[[str, Mapping[str, object], random.Random], List[str]]
+
+TASK_KINDS: Dict[str, str] = {
+    "gsm8k_builtin": "numeric",
+    "math_expr_builtin": "expression",
+    "logic_sat_builtin": "logic",
+    "code_exec_builtin": "code",
+}
+
+
+@dataclass(frozen=True)
+class MutationFamily:
+    """A named perturbation that turns a correct answer into (intended) wrong ones."""
+
+    name: str
+    kind: str
+    mutate: MutateFn
+
+
+@dataclass(slots=True)
+class AdversarialSample:
+    family: str
+    verifier_task: str
+    prompt: str
+    candidate: str
+    metadata: Mapping[str, object]
+
+
+_INT_RE = re.compile(r"\d+")
+
+
+def _as_int(text: str) -> Optional[int]:
+    try:
+        return int(float(text.strip()))
+    except ValueError:
+        return None
+
+
+def _numeric(fn: Callable[[int], List[str]]) -> MutateFn:
+    def mutate(answer: str, metadata: Mapping[str, object], rng: random.Random) -> List[str]:
+        value = _as_int(answer)
+        return [] if value is None else fn(value)
+
+    return mutate
+
+
+def _bump_coefficient(answer: str, metadata: Mapping[str, object], rng: random.Random) -> List[str]:
+    matches = list(_INT_RE.finditer(answer))
+    if not matches:
+        return []
+    match = rng.choice(matches)
+    value = int(match.group(0))
+    return [
+        f"{answer[:match.start()]}{value + delta}{answer[match.end():]}"
+        for delta in (-1, 1)
+        if value + delta >= 0
+    ]
+
+
+def _parse_assignment(answer: str) -> List[List[str]]:
+    return [token.split("=", 1) for token in answer.split() if "=" in token]
+
+
+def _flip(value: str) -> str:
+    return "False" if value.strip().lower() in {"true", "1", "t"} else "True"
+
+
+def _flip_one(answer: str, metadata: Mapping[str, object], rng: random.Random) -> List[str]:
+    pairs = _parse_assignment(answer)
+    if not pairs:
+        return []
+    target = rng.randrange(len(pairs))
+    flipped = [
+        f"{name}={_flip(value) if idx == target else value}"
+        for idx, (name, value) in enumerate(pairs)
+    ]
+    return [" ".join(flipped)]
+
+
+def _partial(answer: str, metadata: Mapping[str, object], rng: random.Random) -> List[str]:
+    pairs = _parse_assignment(answer)
+    if len(pairs) < 2:
+        return []
+    drop = rng.randrange(len(pairs))
+    return [" ".join(f"{name}={value}" for idx, (name, value) in enumerate(pairs) if idx != drop)]
+
+
+def _contradiction(answer: str, metadata: Mapping[str, object], rng: random.Random) -> List[str]:
+    pairs = _parse_assignment(answer)
+    if not pairs:
+        return []
+    name, value = rng.choice(pairs)
+    return [f"{answer} {name}={_flip(value)}"]
+
+
+def _broken_code(answer: str) -> str:
+    return answer.replace("return ", "return None if True else ")
+
+
+def _code_hack(prefix: str) -> MutateFn:
+    def mutate(answer: str, metadata: Mapping[str, object], rng: random.Random) -> List[str]:
+        return [f"{prefix}\n{_broken_code(answer)}"]
+
+    return mutate
+
+
+_PATCH_ASSERTS = (
+    "import unittest\n"
+    "for _name in dir(unittest.TestCase):\n"
+    "    if _name.startswith('assert'):\n"
+    "        setattr(unittest.TestCase, _name, lambda *args, **kwargs: None)"
+)
+
+DEFAULT_FAMILIES: List[MutationFamily] = [
+    MutationFamily("numeric_off_by_one", "numeric", _numeric(lambda n: [str(n - 1), str(n + 1)])),
+    MutationFamily(
+        "numeric_magnitude", "numeric", _numeric(lambda n: [str(n * 10), f"{n}.5", str(-n)])
+    ),
+    MutationFamily(
+        "numeric_format_trick",
+        "numeric",
+        _numeric(lambda n: [f"{n} - 1 = {n - 1}", f"{n}+1", f"not {n} but {n + 1}"]),
+    ),
+    MutationFamily(
+        "numeric_unit_trick",
+        "numeric",
+        _numeric(lambda n: [f"{n} dozen", f"{n}%", f"{n},000"]),
+    ),
+    MutationFamily("expression_coefficient", "expression", _bump_coefficient),
+    MutationFamily(
+        "expression_extra_term",
+        "expression",
+        lambda answer, metadata, rng: [f"{answer} + 1", f"-({answer})", f"({answer})**2"],
+    ),
+    MutationFamily("logic_flip_one", "logic", _flip_one),
+    MutationFamily("logic_partial_assignment", "logic", _partial),
+    MutationFamily("logic_contradiction", "logic", _contradiction),
+    MutationFamily(
+        "code_wrong_return", "code", lambda answer, metadata, rng: [_broken_code(answer)]
+    ),
+    MutationFamily("code_sys_exit", "code", _code_hack("import sys\nsys.exit(0)")),
+    MutationFamily("code_os_exit", "code", _code_hack("import os\nos._exit(0)")),
+    MutationFamily("code_patch_asserts", "code", _code_hack(_PATCH_ASSERTS)),
+]
+
+
+class MutationEngine:
+    """Generate adversarial candidates from canonical answers, family by family."""
+
+    def __init__(
+        self,
+        families: Optional[Sequence[MutationFamily]] = None,
+        *,
+        task_kinds: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.families = list(families or DEFAULT_FAMILIES)
+        self.task_kinds = dict(task_kinds or TASK_KINDS)
+
+    def mutate(
+        self,
+        example: SynLogicExample,
+        rng: random.Random,
+    ) -> Iterator[AdversarialSample]:
+        kind = self.task_kinds.get(example.verifier_task)
+        canonical = example.canonical_answer.strip()
+        for family in self.families:
+            if family.kind != kind:
+                continue
+            for candidate in family.mutate(example.canonical_answer, example.metadata, rng):
+                if candidate.strip() == canonical:
+                    continue
+                yield AdversarialSample(
+                    family=family.name,
+                    verifier_task=example.verifier_task,
+                    prompt=example.prompt,
+                    candidate=candidate,
+                    metadata=example.metadata,
+                )
+
+    def generate(
+        self,
+        examples: Iterable[SynLogicExample],
+        *,
+        seed: int = 0,
+    ) -> Iterator[AdversarialSample]:
+        rng = random.Random(seed)
+        for example in examples:
+            yield from self.mutate(example, rng)
+
+
+def _verify_chunk(verifier: HybridVerifier, chunk: List[AdversarialSample]) -> List[bool]:
+    results = verifier.verify_columns(
+        [sample.prompt for sample in chunk],
+        [sample.candidate for sample in chunk],
+        [sample.metadata for sample in chunk],
+    )
+    return results.passed.tolist()
+
+
+def run_mutation_suite(
+    verifier_lookup: Mapping[str, HybridVerifier],
+    samples: Iterable[AdversarialSample],
+    *,
+    batch_size: int = 256,
+    workers: int = 1,
+) -> dict:
+    """Verify adversarial samples in batches and report false-positive rates per family.
+
+    Samples are consumed lazily; at most ``2 * workers`` batches are in flight, so
+    suites of hundreds of thousands of samples run in bounded memory. Worker threads
+    suit the subprocess-bound code sandbox; SymPy-bound tasks gain less.
+    """
+
+    totals: Dict[str, List[int]] = {}
+
+    def _record(chunk: List[AdversarialSample], passed: List[bool]) -> None:
+        for sample, accepted in zip(chunk, passed):
+            counts = totals.setdefault(sample.family, [0, 0])
+            counts[0] += 1
+            counts[1] += int(accepted)
+
+    def _chunks() -> Iterator[List[AdversarialSample]]:
+        iterator = iter(samples)
+        while True:
+            chunk = list(islice(iterator, batch_size))
+            if not chunk:
+                return
+            groups: Dict[str, List[AdversarialSample]] = {}
+            for sample in chunk:
+                groups.setdefault(sample.verifier_task, []).append(sample)
+            yield from groups.values()
+
+    def _verifier(task: str) -> HybridVerifier:
+        verifier = verifier_lookup.get(task)
+        if verifier is None:
+            raise KeyError(f"Verifier '{task}' not found in lookup")
+        return verifier
+
+    if workers <= 1:
+        for chunk in _chunks():
+            _record(chunk, _verify_chunk(_verifier(chunk[0].verifier_task), chunk))
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            in_flight: List[tuple[List[AdversarialSample], Future]] = []
+            for chunk in _chunks():
+                verifier = _verifier(chunk[0].verifier_task)
+                in_flight.append((chunk, pool.submit(_verify_chunk, verifier, chunk)))
+                if len(in_flight) >= 2 * workers:
+                    done_chunk, future = in_flight.pop(0)
+                    _record(done_chunk, future.result())
+            for done_chunk, future in in_flight:
+                _record(done_chunk, future.result())
+
+    total = sum(counts[0] for counts in totals.values())
+    false_positives = sum(counts[1] for counts in totals.values())
+    return {
+        "total": total,
+        "false_positives": false_positives,
+        "false_positive_rate": false_positives / total if total else 0.0,
+        "families": {
+            family: {
+                "total": counts[0],
+                "false_positives": counts[1],
+                "false_positive_rate": counts[1] / counts[0] if counts[0] else 0.0,
+            }
+            for family, counts in sorted(totals.items())
+        },
+    }
@@ -0,0 +1,93 @@
+"""Process-parallel and multi-node sharded evaluation."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence
+
+from ..orchestrator import HybridVerifier
+from ..registry import restore_registry, snapshot_registry
+from .benchmark import EvalMetrics, evaluate_stream, iter_jsonl_dataset
+
+
+def _evaluate_shard(
+    task_name: str,
+    path: str,
+    shard_index: int,
+    shard_count: int,
+    cache_dir: Optional[str],
+    batch_size: int,
+) -> EvalMetrics:
+    verifier = HybridVerifier(task_name=task_name, cache_dir=cache_dir)
+    examples = iter_jsonl_dataset(path, shard_index=shard_index, shard_count=shard_count)
+    return evaluate_stream(verifier, examples, batch_size=batch_size)
+
+
+def evaluate_parallel(
+    task_name: str,
+    path: str | Path,
+    *,
+    workers: int = 1,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    cache_dir: Optional[str] = None,
+    batch_size: int = 64,
+    initializer: Optional[Callable[..., object]] = None,
+    initargs: Sequence[object] = (),
+) -> EvalMetrics:
+    """Evaluate shard ``shard_index`` of ``shard_count`` across ``workers`` processes.
+
+    Each worker owns the records at positions ``i`` with
+    ``i % (shard_count * workers) == shard_index + w * shard_count``, so the union of
+    all workers on all nodes covers the dataset exactly once and the partial metrics
+    can be combined with :meth:`EvalMetrics.merge`. ``initializer`` runs in every
+    worker; by default it restores a :func:`~hvt.registry.snapshot_registry` of
+    this process so spawned workers see the same tasks.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    if not 0 <= shard_index < shard_count:
+        raise ValueError("shard_index must be in [0, shard_count)")
+    path = str(path)
+    total_shards = shard_count * workers
+    if workers == 1:
+        return _evaluate_shard(task_name, path, shard_index, shard_count, cache_dir, batch_size)
+
+    if initializer is None:
+        initializer, initargs = restore_registry, (snapshot_registry(),)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=tuple(initargs)
+    ) as pool:
+        futures = [
+            pool.submit(
+                _evaluate_shard,
+                task_name,
+                path,
+                shard_index + worker * shard_count,
+                total_shards,
+                cache_dir,
+                batch_size,
+            )
+            for worker in range(workers)
+        ]
+        return merge_metrics(future.result() for future in futures)
+
+
+def merge_metrics(partials: Iterable[EvalMetrics]) -> EvalMetrics:
+    merged = EvalMetrics()
+    for partial in partials:
+        merged = merged.merge(partial)
+    return merged
+
+
+def merge_metric_files(paths: Iterable[str | Path]) -> EvalMetrics:
+    """Merge partial metrics written by ``hvt eval --output`` on each shard."""
+
+    return merge_metrics(
+        EvalMetrics.from_dict(json.loads(Path(path).read_text(encoding="utf-8"))) for path in paths
+    )
@@ -0,0 +1,265 @@
+"""Performance benchmarks for the built-in verification tasks."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from ..batch import STAGES
+from ..builtins import register_builtin_tasks
+from ..orchestrator import HybridVerifier
+from ..synlogic.tasks import (
+    BooleanConstraintTask,
+    ExpressionSimplifyTask,
+    FunctionImplementationTask,
+    SynLogicExample,
+    SynLogicTask,
+    WordEquationTask,
+)
+
+BENCH_WORKLOADS: Dict[str, Callable[[], SynLogicTask]] = {
+    "gsm8k_builtin": WordEquationTask,
+    "math_expr_builtin": ExpressionSimplifyTask,
+    "logic_sat_builtin": BooleanConstraintTask,
+    "code_exec_builtin": FunctionImplementationTask,
+}
+
+PERCENTILES = (50, 95, 99)
+
+HEAVY_MODULES = ("numpy", "sympy", "litellm")
+
+STARTUP_PROBES: Dict[str, str] = {
+    "import_hvt": "import hvt",
+    "verify_gsm8k": (
+        "from hvt import HybridVerifier, register_builtin_tasks\n"
+        "register_builtin_tasks()\n"
+        "HybridVerifier(task_name='gsm8k_builtin').verify(\n"
+        "    prompt='Q', candidate_answer='3', metadata={'reference_answer': '3'}\n"
+        ")"
+    ),
+}
+
+_PROBE_RUNNER = """
+import json, sys, time
+started = time.perf_counter()
+exec(compile(sys.argv[1], "<probe>", "exec"), {})
+elapsed = time.perf_counter() - started
+heavy = [name for name in json.loads(sys.argv[2]) if name in sys.modules]
+print(json.dumps({"seconds": elapsed, "heavy_modules": heavy}))
+"""
+
+
+def latency_summary(durations: Sequence[float]) -> Dict[str, float]:
+    """Summarize per-item durations (seconds) as millisecond percentiles."""
+
+    if not durations:
+        return {"count": 0, "mean_ms": 0.0, **{f"p{q}_ms": 0.0 for q in PERCENTILES}}
+    values = np.asarray(durations, dtype=float) * 1000.0
+    summary: Dict[str, float] = {"count": int(values.size), "mean_ms": float(values.mean())}
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{q}_ms"] = float(value)
+    return summary
+
+
+def _timed(fn: Callable[[], object], sink: List[float]) -> object:
+    start = time.perf_counter()
+    out = fn()
+    sink.append(time.perf_counter() - start)
+    return out
+
+
+def _unique_examples(examples: Iterable[SynLogicExample]) -> List[SynLogicExample]:
+    """Drop repeated ``(prompt, canonical_answer)`` pairs, which would hit the cache."""
+
+    seen: Set[Tuple[str, str]] = set()
+    unique: List[SynLogicExample] = []
+    for example in examples:
+        key = (example.prompt, example.canonical_answer)
+        if key not in seen:
+            seen.add(key)
+            unique.append(example)
+    return unique
+
+
+def bench_task(
+    task_name: str,
+    examples: Sequence[SynLogicExample],
+    *,
+    cache_dir: str,
+) -> dict:
+    """Time ``examples`` on a cold and then a warm cache.
+
+    Examples are de-duplicated first, so every cold call is a real cache miss.
+    ``verify_cold``/``verify_cached`` are end-to-end ``verify`` latencies; the
+    per-stage entries come from the verifier's own ``provenance.extra["timings"]``
+    (cold pass, plus ``cache_hit`` for the lookup on the warm pass).
+    """
+
+    examples = _unique_examples(examples)
+    verifier = HybridVerifier(task_name=task_name, cache_dir=cache_dir)
+    totals: Dict[str, List[float]] = {"verify_cold": [], "verify_cached": []}
+    pipeline: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    pipeline["cache_hit"] = []
+    for key in ("verify_cold", "verify_cached"):
+        for example in examples:
+            result = _timed(
+                lambda: verifier.verify(
+                    prompt=example.prompt,
+                    candidate_answer=example.canonical_answer,
+                    metadata=example.metadata,
+                ),
+                totals[key],
+            )
+            timings = result.provenance.extra["timings"]  # type: ignore[attr-defined]
+            if key == "verify_cached":
+                pipeline["cache_hit"].append(timings["cache_lookup"])
+                continue
+            for stage, seconds in timings.items():
+                pipeline[stage].append(seconds)
+    stages = {name: latency_summary(durations) for name, durations in totals.items()}
+    stages.update(
+        (name, latency_summary(durations)) for name, durations in pipeline.items() if durations
+    )
+    return {
+        "unique_examples": len(examples),
+        "stages": stages,
+        "throughput": {
+            "cache_miss_per_s": len(examples) / sum(totals["verify_cold"]) if examples else 0.0,
+            "cache_hit_per_s": len(examples) / sum(totals["verify_cached"]) if examples else 0.0,
+        },
+    }
+
+
+def run_startup_probe(code: str, *, python: Optional[str] = None) -> dict:
+    """Run ``code`` in a fresh interpreter; report its wall time and heavy modules loaded."""
+
+    src_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_root, env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [python or sys.executable, "-c", _PROBE_RUNNER, code, json.dumps(HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def bench_startup(
+    probes: Optional[Mapping[str, str]] = None,
+    *,
+    repeats: int = 3,
+) -> dict:
+    """Time cold-interpreter startup probes (import and first verify) ``repeats`` times each."""
+
+    report: Dict[str, dict] = {}
+    for name, code in (probes or STARTUP_PROBES).items():
+        runs = [run_startup_probe(code) for _ in range(repeats)]
+        summary = latency_summary([run["seconds"] for run in runs])
+        report[name] = {
+            "p50_ms": summary["p50_ms"],
+            "min_ms": min(run["seconds"] for run in runs) * 1000.0,
+            "heavy_modules": sorted({mod for run in runs for mod in run["heavy_modules"]}),
+        }
+    return report
+
+
+def run_benchmark(
+    *,
+    tasks: Optional[Sequence[str]] = None,
+    count: int = 50,
+    seed: int = 0,
+    startup_repeats: int = 0,
+) -> dict:
+    """Benchmark the built-in tasks on SynLogic-generated workloads.
+
+    ``count`` examples are generated per task; duplicates are timed only once (see
+    :func:`bench_task`), so small example spaces yield fewer timed examples.
+
+    With ``startup_repeats > 0`` cold-start probes (see :func:`bench_startup`) are
+    included under ``"startup"``. Returns a JSON-serializable mapping suitable for
+    :func:`compare_to_baseline`.
+    """
+
+    register_builtin_tasks()
+    selected = list(tasks or BENCH_WORKLOADS)
+    unknown = set(selected) - BENCH_WORKLOADS.keys()
+    if unknown:
+        raise KeyError(f"No benchmark workload for task(s): {', '.join(sorted(unknown))}")
+
+    report: Dict[str, dict] = {}
+    for task_name in selected:
+        generator = BENCH_WORKLOADS[task_name]()
+        rng = random.Random(f"{seed}:{task_name}")
+        generate: List[float] = []
+        examples = [_timed(lambda: generator.generate(rng), generate) for _ in range(count)]
+        with tempfile.TemporaryDirectory(prefix="hvt-bench-") as cache_dir:
+            task_report = bench_task(task_name, examples, cache_dir=cache_dir)
+        task_report["stages"] = {"generate": latency_summary(generate), **task_report["stages"]}
+        report[task_name] = task_report
+    result = {"config": {"count": count, "seed": seed}, "tasks": report}
+    if startup_repeats > 0:
+        result["startup"] = bench_startup(repeats=startup_repeats)
+    return result
+
+
+def _regression(task_name: str, metric: str, baseline: float, current: float) -> dict:
+    return {"task": task_name, "metric": metric, "baseline": baseline, "current": current}
+
+
+def compare_to_baseline(
+    current: Mapping[str, object],
+    baseline: Mapping[str, object],
+    *,
+    tolerance: float = 0.25,
+) -> List[dict]:
+    """List metrics that regressed by more than ``tolerance`` (relative) vs ``baseline``.
+
+    Latencies (p50/p95/p99) regress when they grow, throughputs when they shrink. Startup
+    probes regress when their p50 grows. Tasks, stages or probes missing from either
+    side are ignored.
+    """
+
+    regressions: List[dict] = []
+    current_tasks = current.get("tasks", {})
+    for task_name, base_task in baseline.get("tasks", {}).items():  # type: ignore[union-attr]
+        cur_task = current_tasks.get(task_name)  # type: ignore[union-attr]
+        if cur_task is None:
+            continue
+        for stage, base_stage in base_task.get("stages", {}).items():
+            cur_stage = cur_task.get("stages", {}).get(stage)
+            if cur_stage is None:
+                continue
+            for key in ("p50_ms", "p95_ms", "p99_ms"):
+                base_value, cur_value = base_stage.get(key, 0.0), cur_stage.get(key, 0.0)
+                if base_value > 0 and cur_value > base_value * (1 + tolerance):
+                    regressions.append(
+                        _regression(task_name, f"{stage}.{key}", base_value, cur_value)
+                    )
+        for key, base_value in base_task.get("throughput", {}).items():
+            cur_value = cur_task.get("throughput", {}).get(key)
+            if cur_value is None or base_value <= 0:
+                continue
+            if cur_value < base_value * (1 - tolerance):
+                regressions.append(
+                    _regression(task_name, f"throughput.{key}", base_value, cur_value)
+                )
+    current_startup = current.get("startup", {})
+    for probe, base_probe in baseline.get("startup", {}).items():  # type: ignore[union-attr]
+        cur_probe = current_startup.get(probe)  # type: ignore[union-attr]
+        if cur_probe is None:
+            continue
+        base_value, cur_value = base_probe.get("p50_ms", 0.0), cur_probe.get("p50_ms", 0.0)
+        if base_value > 0 and cur_value > base_value * (1 + tolerance):
+            regressions.append(_regression("startup", f"{probe}.p50_ms", base_value, cur_value))
+    return regressions
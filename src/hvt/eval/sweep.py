@@ -0,0 +1,188 @@
+"""Single-pass threshold sweeps and PR curves from stored verifier scores."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..orchestrator import HybridVerifier
+from .benchmark import EvalExample
+
+
+@dataclass(slots=True)
+class ScoreRecords:
+    """Per-example outcomes needed to re-threshold a verifier without re-running it."""
+
+    labels: np.ndarray
+    scores: np.ndarray
+    rule_passed: np.ndarray
+    judged: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.labels.shape[0])
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        if path.suffix != ".npz":
+            path = path.with_suffix(".npz")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            labels=self.labels,
+            scores=self.scores,
+            rule_passed=self.rule_passed,
+            judged=self.judged,
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "ScoreRecords":
+        with np.load(Path(path), allow_pickle=False) as archive:
+            return cls(
+                labels=archive["labels"].astype(bool),
+                scores=archive["scores"].astype(float),
+                rule_passed=archive["rule_passed"].astype(bool),
+                judged=archive["judged"].astype(bool),
+            )
+
+
+def collect_scores(
+    verifier: HybridVerifier,
+    examples: Iterable[EvalExample],
+    *,
+    batch_size: int = 64,
+) -> ScoreRecords:
+    """Run the verifier once and keep each example's calibrated score and rule outcome."""
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    labels: List[bool] = []
+    scores: List[np.ndarray] = []
+    rule_passed: List[np.ndarray] = []
+    judged: List[np.ndarray] = []
+    iterator = iter(examples)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            break
+        results = verifier.verify_columns(
+            [example.prompt for example in batch],
+            [example.candidate for example in batch],
+            [example.metadata for example in batch],
+        )
+        labels.extend(example.label for example in batch)
+        scores.append(results.scores)
+        rule_passed.append(results.rule_passed)
+        judged.append(results.judge_invoked)
+    return ScoreRecords(
+        labels=np.asarray(labels, dtype=bool),
+        scores=_concat(scores, float),
+        rule_passed=_concat(rule_passed, bool),
+        judged=_concat(judged, bool),
+    )
+
+
+def _concat(parts: List[np.ndarray], dtype: type) -> np.ndarray:
+    return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+
+def _safe_ratio(num: np.ndarray, denom: np.ndarray) -> np.ndarray:
+    return np.divide(num, denom, out=np.zeros(num.shape, dtype=float), where=denom > 0)
+
+
+@dataclass(slots=True)
+class ThresholdSweep:
+    thresholds: np.ndarray
+    true_positive: np.ndarray
+    false_positive: np.ndarray
+    true_negative: np.ndarray
+    false_negative: np.ndarray
+
+    @property
+    def precision(self) -> np.ndarray:
+        return _safe_ratio(self.true_positive, self.true_positive + self.false_positive)
+
+    @property
+    def recall(self) -> np.ndarray:
+        return _safe_ratio(self.true_positive, self.true_positive + self.false_negative)
+
+    @property
+    def f1(self) -> np.ndarray:
+        prec, rec = self.precision, self.recall
+        return _safe_ratio(2 * prec * rec, prec + rec)
+
+    @property
+    def accuracy(self) -> np.ndarray:
+        total = self.true_positive + self.false_positive + self.true_negative + self.false_negative
+        return _safe_ratio(self.true_positive + self.true_negative, total)
+
+    def row(self, idx: int) -> dict:
+        return {
+            "threshold": float(self.thresholds[idx]),
+            "tp": int(self.true_positive[idx]),
+            "fp": int(self.false_positive[idx]),
+            "tn": int(self.true_negative[idx]),
+            "fn": int(self.false_negative[idx]),
+            "precision": float(self.precision[idx]),
+            "recall": float(self.recall[idx]),
+            "f1": float(self.f1[idx]),
+            "accuracy": float(self.accuracy[idx]),
+        }
+
+    def to_rows(self) -> List[dict]:
+        return [self.row(idx) for idx in range(len(self.thresholds))]
+
+    def recommend(self, target_precision: float) -> Optional[dict]:
+        """Lowest threshold with the best recall among those meeting ``target_precision``."""
+
+        eligible = np.flatnonzero(self.precision >= target_precision)
+        if eligible.size == 0:
+            return None
+        best = eligible[np.argmax(self.recall[eligible])]
+        return self.row(int(best))
+
+
+def threshold_sweep(
+    records: ScoreRecords,
+    thresholds: Optional[Sequence[float]] = None,
+) -> ThresholdSweep:
+    """Compute confusion counts for every candidate ``judge_min`` in one vectorized pass.
+
+    An example is predicted positive when its rule passed, or when a judge ran and its
+    calibrated score is ``>= threshold``. By default every distinct judged score (plus
+    0 and 1) is evaluated. With a judge cascade the escalation decisions were made at
+    the deployed ``judge_min``, so results away from it are an approximation.
+    """
+
+    labels = records.labels
+    judged_scores = records.scores[records.judged & ~records.rule_passed]
+    judged_labels = labels[records.judged & ~records.rule_passed]
+    if thresholds is None:
+        grid = np.unique(np.concatenate([judged_scores, [0.0, 1.0]]))
+    else:
+        grid = np.asarray(sorted(thresholds), dtype=float)
+
+    order = np.argsort(judged_scores, kind="stable")
+    sorted_scores = judged_scores[order]
+    suffix_pos = np.concatenate([np.cumsum(judged_labels[order][::-1])[::-1], [0]])
+    first_passing = np.searchsorted(sorted_scores, grid, side="left")
+    judged_tp = suffix_pos[first_passing]
+    judged_fp = (sorted_scores.size - first_passing) - judged_tp
+
+    positives = int(labels.sum())
+    negatives = int(labels.size) - positives
+    base_tp = int((labels & records.rule_passed).sum())
+    base_fp = int((~labels & records.rule_passed).sum())
+    tp = base_tp + judged_tp
+    fp = base_fp + judged_fp
+    return ThresholdSweep(
+        thresholds=grid,
+        true_positive=tp,
+        false_positive=fp,
+        true_negative=negatives - fp,
+        false_negative=positives - tp,
+    )
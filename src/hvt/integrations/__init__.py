@@ -1,5 +1,15 @@
 """Integration helpers (TRL, RL pipelines, etc.)."""
 
-from .trl_adapter import VerifierRewardAdapter, build_trl_reward_fn
+from .trl_adapter import RewardRecord, VerifierRewardAdapter, build_trl_reward_fn
+from .async_rewards import AsyncRewardComputer, RewardFuture
+from .remote import VerificationClient, build_remote_reward_fn
 
-__all__ = ["VerifierRewardAdapter", "build_trl_reward_fn"]
+__all__ = [
+    "VerifierRewardAdapter",
+    "build_trl_reward_fn",
+    "RewardRecord",
+    "AsyncRewardComputer",
+    "RewardFuture",
+    "VerificationClient",
+    "build_remote_reward_fn",
+]
@@ -0,0 +1,167 @@
+"""Non-blocking reward computation that overlaps verification with generation."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .trl_adapter import RewardRecord, VerifierRewardAdapter
+
+
+def _split_samples(
+    samples: Iterable[Mapping[str, object]],
+) -> tuple[List[str], List[str], List[Mapping[str, object]]]:
+    samples = list(samples)
+    prompts = [str(sample.get("prompt", "")) for sample in samples]
+    responses = [
+        str(sample.get("completion") or sample.get("response", "")) for sample in samples
+    ]
+    metadata = [sample.get("metadata", {}) or {} for sample in samples]
+    return prompts, responses, metadata  # type: ignore[return-value]
+
+
+class RewardFuture:
+    """Handle for rewards being computed in the background, chunk by chunk.
+
+    When the submitter's ``deadline`` (seconds from submission) passes, chunks that
+    have not finished get ``default_reward`` and are flagged in :meth:`records`; the
+    stragglers themselves keep running to completion in their worker.
+    """
+
+    def __init__(
+        self,
+        chunks: Sequence[tuple[slice, Future]],
+        size: int,
+        *,
+        deadline_at: Optional[float],
+        default_reward: float,
+    ) -> None:
+        self._chunks = list(chunks)
+        self._size = size
+        self._deadline_at = deadline_at
+        self._default_reward = default_reward
+        self._rewards: Optional[np.ndarray] = None
+        self._timed_out: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def done(self) -> bool:
+        if self._rewards is not None:
+            return True
+        if self._deadline_at is not None and time.monotonic() >= self._deadline_at:
+            return True
+        return all(future.done() for _, future in self._chunks)
+
+    def result(self, timeout: Optional[float] = None) -> np.ndarray:
+        """Block until every chunk finished or the deadline passed; return ``float32`` rewards.
+
+        Raises :class:`TimeoutError` if ``timeout`` expires before the deadline does.
+        """
+
+        if self._rewards is not None:
+            return self._rewards
+        wait_for = timeout
+        if self._deadline_at is not None:
+            remaining = max(0.0, self._deadline_at - time.monotonic())
+            wait_for = remaining if timeout is None else min(timeout, remaining)
+        _, not_done = wait_futures([future for _, future in self._chunks], timeout=wait_for)
+        deadline_hit = self._deadline_at is not None and time.monotonic() >= self._deadline_at
+        if not_done and not deadline_hit:
+            raise TimeoutError(f"{len(not_done)} reward chunk(s) still running")
+
+        rewards = np.full(self._size, self._default_reward, dtype=np.float32)
+        timed_out = np.zeros(self._size, dtype=bool)
+        for chunk, future in self._chunks:
+            if future in not_done:
+                future.cancel()
+                timed_out[chunk] = True
+            else:
+                rewards[chunk] = future.result()
+        self._rewards, self._timed_out = rewards, timed_out
+        return rewards
+
+    @property
+    def timed_out(self) -> np.ndarray:
+        """Boolean mask of samples that received the default reward (after :meth:`result`)."""
+
+        if self._timed_out is None:
+            self.result()
+        assert self._timed_out is not None
+        return self._timed_out
+
+    def records(self, timeout: Optional[float] = None) -> List[RewardRecord]:
+        rewards = self.result(timeout)
+        return [
+            RewardRecord(
+                reward=float(reward),
+                metadata={"deadline_exceeded": bool(late)},
+            )
+            for reward, late in zip(rewards, self.timed_out)
+        ]
+
+
+class AsyncRewardComputer:
+    """Submit reward batches to a worker pool and collect them when the trainer needs them.
+
+    Batches are split into ``chunk_size`` pieces so one hanging sample (e.g. sandboxed
+    code) only defaults its own chunk at the deadline. Any :class:`Executor` can be
+    injected; process pools need a picklable ``adapter``.
+    """
+
+    def __init__(
+        self,
+        adapter: VerifierRewardAdapter,
+        *,
+        max_workers: int = 4,
+        chunk_size: int = 64,
+        deadline: Optional[float] = None,
+        default_reward: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.adapter = adapter
+        self.chunk_size = chunk_size
+        self.deadline = deadline
+        self.default_reward = adapter.reward_fail if default_reward is None else default_reward
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hvt-reward"
+        )
+
+    def submit(
+        self,
+        samples: Iterable[Mapping[str, object]],
+        *,
+        deadline: Optional[float] = None,
+    ) -> RewardFuture:
+        """Start verifying TRL-style samples (``prompt``/``completion``/``metadata``)."""
+
+        prompts, responses, metadata = _split_samples(samples)
+        deadline = self.deadline if deadline is None else deadline
+        deadline_at = time.monotonic() + deadline if deadline is not None else None
+        chunks = []
+        for start in range(0, len(prompts), self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            future = self._executor.submit(
+                self.adapter.rewards, prompts[chunk], responses[chunk], metadata[chunk]
+            )
+            chunks.append((chunk, future))
+        return RewardFuture(
+            chunks, len(prompts), deadline_at=deadline_at, default_reward=self.default_reward
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "AsyncRewardComputer":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.shutdown(wait=False)
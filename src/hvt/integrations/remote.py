@@ -0,0 +1,81 @@
+"""Client for the ``hvt serve`` verification service."""
+
+from __future__ import annotations
+
+import json
+import urllib.error
+import urllib.request
+from typing import Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+
+class VerificationClient:
+    """Thin JSON client; connection setup is per call, so instances are cheap to share."""
+
+    def __init__(self, url: str = "http://127.0.0.1:8765", *, timeout: float = 60.0) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def verify(
+        self,
+        task: str,
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        metadata_list: Optional[Sequence[Optional[Mapping[str, object]]]] = None,
+        *,
+        include_provenance: bool = False,
+    ) -> List[dict]:
+        if metadata_list is None:
+            metadata_list = [{} for _ in prompts]
+        payload = {
+            "task": task,
+            "include_provenance": include_provenance,
+            "items": [
+                {"prompt": prompt, "candidate": candidate, "metadata": metadata or {}}
+                for prompt, candidate, metadata in zip(prompts, candidates, metadata_list)
+            ],
+        }
+        request = urllib.request.Request(
+            f"{self.url}/verify",
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())["results"]
+        except urllib.error.HTTPError as exc:
+            detail = json.loads(exc.read() or b"{}").get("error", exc.reason)
+            raise RuntimeError(f"Verification service error ({exc.code}): {detail}") from exc
+
+    def health(self) -> bool:
+        try:
+            with urllib.request.urlopen(f"{self.url}/health", timeout=self.timeout) as response:
+                return json.loads(response.read()).get("status") == "ok"
+        except OSError:
+            return False
+
+
+def build_remote_reward_fn(
+    client: VerificationClient,
+    task: str,
+    *,
+    reward_pass: float = 1.0,
+    reward_fail: float = 0.0,
+):
+    """TRL-compatible reward function backed by a shared ``hvt serve`` instance."""
+
+    def reward_fn(samples: Iterable[Mapping[str, object]], **kwargs) -> List[float]:
+        samples = list(samples)
+        results = client.verify(
+            task,
+            [str(sample.get("prompt", "")) for sample in samples],
+            [str(sample.get("completion") or sample.get("response", "")) for sample in samples],
+            [sample.get("metadata", {}) for sample in samples],
+        )
+        # Items the service could not verify carry "error" instead of a verdict.
+        passed = np.array([result.get("verdict") == "PASS" for result in results], dtype=bool)
+        return np.where(passed, reward_pass, reward_fail).tolist()
+
+    return reward_fn
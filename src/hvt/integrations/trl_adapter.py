@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import json
 from dataclasses import dataclass
-from typing import Iterable, List, Mapping, Optional, Sequence
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
+
+from ..batch import VerificationBatchResult
 from ..orchestrator import HybridVerifier
-from ..types import provenance_to_dict
+from ..types import Verdict, provenance_to_dict
 
 
 @dataclass(slots=True)
@@ -15,8 +20,19 @@ class RewardRecord:
     metadata: Mapping[str, object]
 
 
+def _metadata_key(metadata: Optional[Mapping[str, object]]) -> str:
+    return json.dumps(metadata or {}, sort_keys=True, default=str)
+
+
 class VerifierRewardAdapter:
-    """Callable adapter turning verifier outputs into scalar rewards."""
+    """Callable adapter turning verifier outputs into scalar rewards.
+
+    GRPO-style batches repeat each prompt once per generation. Identical
+    ``(prompt, completion, metadata)`` triples are verified once per call, and the
+    metadata fingerprint is computed once per distinct metadata object, so a group
+    of ``G`` completions sharing a prompt costs one fingerprint and at most ``G``
+    verifications, all in a single ``verify_batch``.
+    """
 
     def __init__(
         self,
@@ -29,39 +45,98 @@ class VerifierRewardAdapter:
         self.reward_pass = reward_pass
         self.reward_fail = reward_fail
 
+    def _verify_unique(
+        self,
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        metadata_list: Optional[Sequence[Optional[Mapping[str, object]]]],
+    ) -> Tuple[VerificationBatchResult, np.ndarray]:
+        if len(candidates) != len(prompts):
+            raise ValueError("prompts and candidates must have the same length")
+        if metadata_list is None:
+            metadata_list = [{} for _ in prompts]
+        elif len(metadata_list) != len(prompts):
+            raise ValueError("metadata_list must match the number of prompts")
+        fingerprints: Dict[int, str] = {}
+        slots: Dict[Tuple[str, str, str], int] = {}
+        inverse = np.empty(len(prompts), dtype=np.intp)
+        unique: List[int] = []
+        for idx, (prompt, candidate, metadata) in enumerate(
+            zip(prompts, candidates, metadata_list)
+        ):
+            fingerprint = fingerprints.get(id(metadata))
+            if fingerprint is None:
+                fingerprint = fingerprints[id(metadata)] = _metadata_key(metadata)
+            key = (prompt, candidate, fingerprint)
+            slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(unique)
+                unique.append(idx)
+            inverse[idx] = slot
+        batch = self.verifier.verify_columns(
+            [prompts[idx] for idx in unique],
+            [candidates[idx] for idx in unique],
+            [metadata_list[idx] for idx in unique],
+        )
+        return batch, inverse
+
+    def rewards(
+        self,
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        metadata_list: Optional[Sequence[Optional[Mapping[str, object]]]] = None,
+        *,
+        dtype: type = np.float32,
+    ) -> np.ndarray:
+        """Rewards as a ``dtype`` array aligned with the inputs; no provenance is built.
+
+        Use ``dtype=np.float64`` when rewards must equal ``reward_pass``/``reward_fail``
+        exactly (e.g. 0.1 is not representable in ``float32``).
+        """
+
+        batch, inverse = self._verify_unique(prompts, candidates, metadata_list)
+        unique_rewards = np.where(batch.passed, self.reward_pass, self.reward_fail)
+        return unique_rewards.astype(dtype)[inverse]
+
     def __call__(
         self,
         prompts: Sequence[str],
         candidates: Sequence[str],
         metadata_list: Optional[Sequence[Mapping[str, object]]] = None,
+        *,
+        include_provenance: bool = True,
     ) -> List[RewardRecord]:
-        if metadata_list is None:
-            metadata_list = [{} for _ in prompts]
+        batch, inverse = self._verify_unique(prompts, candidates, metadata_list)
+        verdicts = [Verdict(code) for code in batch.verdicts.tolist()]
+        scores = batch.scores.tolist()
         records: List[RewardRecord] = []
-        for prompt, candidate, metadata in zip(prompts, candidates, metadata_list):
-            result = self.verifier.verify(prompt=prompt, candidate_answer=candidate, metadata=metadata)
-            reward = self.reward_pass if result.verdict.name == "PASS" else self.reward_fail
-            records.append(
-                RewardRecord(
-                    reward=reward,
-                    metadata={
-                        "score": result.score,
-                        "verdict": result.verdict.name,
-                        "provenance": provenance_to_dict(result.provenance),
-                    },
-                )
-            )
+        for slot in inverse.tolist():
+            # Duplicate inputs share a verification but each gets its own record.
+            verdict = verdicts[slot]
+            metadata: Dict[str, object] = {"score": scores[slot], "verdict": verdict.name}
+            if include_provenance:
+                metadata["provenance"] = copy.deepcopy(provenance_to_dict(batch.provenance(slot)))
+            reward = self.reward_pass if verdict is Verdict.PASS else self.reward_fail
+            records.append(RewardRecord(reward=reward, metadata=metadata))
         return records
 
 
-def build_trl_reward_fn(adapter: VerifierRewardAdapter):
-    """Return a function compatible with TRL's reward interface."""
+def build_trl_reward_fn(adapter: VerifierRewardAdapter, *, as_array: bool = False):
+    """Return a function compatible with TRL's reward interface.
+
+    Rewards come from :meth:`VerifierRewardAdapter.rewards`, so no provenance is
+    built. The default list holds plain floats equal to ``reward_pass``/``reward_fail``;
+    with ``as_array=True`` a ``float32`` array is returned instead (ready for
+    ``torch.from_numpy``).
+    """
 
-    def reward_fn(samples: Iterable[Mapping[str, object]], **kwargs) -> List[float]:
+    def reward_fn(samples: Iterable[Mapping[str, object]], **kwargs):
+        samples = list(samples)
         prompts = [sample.get("prompt", "") for sample in samples]
         responses = [sample.get("completion") or sample.get("response", "") for sample in samples]
         metadata = [sample.get("metadata", {}) for sample in samples]
-        records = adapter(prompts, responses, metadata)
-        return [record.reward for record in records]
+        if as_array:
+            return adapter.rewards(prompts, responses, metadata)
+        return adapter.rewards(prompts, responses, metadata, dtype=np.float64).tolist()
 
     return reward_fn
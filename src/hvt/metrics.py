@@ -0,0 +1,216 @@
+"""Low-overhead in-process metrics (histograms and counters) for the verifier hot path."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    def __init__(self) -> None:
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = 0.0
+
+
+class Histogram:
+    """Fixed-bucket histogram; ``observe`` is a bisect plus three additions."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def quantile(self, q: float) -> float:
+        """Approximate quantile: the upper bound of the bucket containing rank ``q``."""
+
+        if not self._count:
+            return 0.0
+        rank = q * self._count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total, count = self._sum, self._count
+        return {"buckets": list(self.buckets), "counts": counts, "sum": total, "count": count}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)
+            self._sum = 0.0
+            self._count = 0
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class MetricsRegistry:
+    """Named, labelled counters and histograms with snapshot/reset and Prometheus export.
+
+    Look metrics up once (e.g. in ``__init__``) and keep the returned objects; the
+    lookup takes a lock, updating the metric afterwards is cheap.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, Dict[LabelKey, Counter]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str = "", **labels: str) -> Counter:
+        key = _label_key(labels)
+        with self._lock:
+            family = self._counters.setdefault(name, {})
+            if description:
+                self._help.setdefault(name, description)
+            return family.setdefault(key, Counter())
+
+    def histogram(
+        self,
+        name: str,
+        description: str = "",
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        key = _label_key(labels)
+        with self._lock:
+            family = self._histograms.setdefault(name, {})
+            if description:
+                self._help.setdefault(name, description)
+            if key not in family:
+                family[key] = Histogram(buckets)
+            return family[key]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counters = {name: dict(family) for name, family in self._counters.items()}
+            histograms = {name: dict(family) for name, family in self._histograms.items()}
+        return {
+            "counters": {
+                name: [{"labels": dict(key), "value": c.value} for key, c in family.items()]
+                for name, family in counters.items()
+            },
+            "histograms": {
+                name: [{"labels": dict(key), **h.snapshot()} for key, h in family.items()]
+                for name, family in histograms.items()
+            },
+        }
+
+    def reset(self) -> None:
+        """Zero every metric while keeping handles held by verifiers valid."""
+
+        with self._lock:
+            counters = [c for family in self._counters.values() for c in family.values()]
+            histograms = [h for family in self._histograms.values() for h in family.values()]
+        for counter in counters:
+            counter.reset()
+        for histogram in histograms:
+            histogram.reset()
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (v0.0.4)."""
+
+        lines: List[str] = []
+        snap = self.snapshot()
+        for name, series in sorted(snap["counters"].items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for item in series:
+                lines.append(f"{name}{_format_labels(_label_key(item['labels']))} {item['value']}")
+        for name, series in sorted(snap["histograms"].items()):
+            if name in self._help:
+                lines.append(f"# HELP {name} {self._help[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for item in series:
+                key = _label_key(item["labels"])
+                cumulative = 0
+                for bound, count in zip(item["buckets"], item["counts"]):
+                    cumulative += count
+                    labels = _format_labels(key, ("le", repr(bound)))
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _format_labels(key, ("le", "+Inf"))
+                lines.append(f"{name}_bucket{labels} {item['count']}")
+                lines.append(f"{name}_sum{_format_labels(key)} {item['sum']}")
+                lines.append(f"{name}_count{_format_labels(key)} {item['count']}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def snapshot(registry: Optional[MetricsRegistry] = None) -> dict:
+    return (registry or REGISTRY).snapshot()
+
+
+def reset(registry: Optional[MetricsRegistry] = None) -> None:
+    (registry or REGISTRY).reset()
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    return (registry or REGISTRY).render_prometheus()
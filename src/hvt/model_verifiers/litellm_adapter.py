@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Mapping, Optional
 
+from ..tracing import span
 from ..types import ModelVerifier
 
 
@@ -28,17 +29,17 @@ class LiteLLMJudge(ModelVerifier):
         self.user_template = user_template or "Prompt: {prompt}\nCandidate: {candidate}\nScore between 0 and 1:"
 
     def score(self, prompt: str, candidate: str, metadata: Optional[Mapping[str, object]] = None) -> float:
-        completion = litellm.completion(
-            model=self.model_name,
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {
-                    "role": "user",
-                    "content": self.user_template.format(prompt=prompt, candidate=candidate),
-                },
-            ],
-        )
-        text = completion.choices[0].message["content"].strip()
+        user_content = self.user_template.format(prompt=prompt, candidate=candidate)
+        with span("llm_completion", model=self.model_name, prompt_chars=len(user_content)) as attrs:
+            completion = litellm.completion(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": user_content},
+                ],
+            )
+            text = completion.choices[0].message["content"].strip()
+            attrs["response_length"] = len(text)
         try:
             return max(0.0, min(1.0, float(text.split()[0])))
         except (ValueError, IndexError):
@@ -0,0 +1,122 @@
+"""Route mixed-task batches to per-task verifiers sharing one cache and metrics registry."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping as MappingABC
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+from .cache import VerificationCache
+from .metrics import REGISTRY, MetricsRegistry
+from .orchestrator import HybridVerifier
+from .types import VerificationResult
+
+
+class MultiTaskVerifier(MappingABC):
+    """Verify items tagged with different task names in one call.
+
+    Items are grouped by task, each group goes through its verifier's ``verify_batch``
+    and results come back in input order. Verifiers are created on first use (or
+    up front for ``tasks``) and all share ``metrics`` and, when ``cache`` or
+    ``cache_dir`` is given, one cache (it keys on task name, so sharing is safe);
+    otherwise each verifier uses its task's configured ``cache_dir``. With
+    ``workers > 1`` the task groups run concurrently on a thread pool, which overlaps
+    e.g. sandboxed code with SymPy work.
+
+    The instance is also a read-only, lazily populated ``Mapping`` from task name to
+    verifier, so it can be passed wherever a ``verifier_lookup`` is expected:
+    ``router[task]`` and ``router.get(task)`` build the verifier of any registered
+    task on demand, while ``in``, ``len()`` and iteration only see verifiers built so
+    far.
+    """
+
+    def __init__(
+        self,
+        tasks: Optional[Iterable[str]] = None,
+        *,
+        cache_dir: Optional[str] = None,
+        cache: Optional[VerificationCache] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        workers: int = 1,
+    ) -> None:
+        if cache is None and cache_dir:
+            cache = VerificationCache(cache_dir)
+        self.cache = cache
+        self.metrics = metrics or REGISTRY
+        self.workers = workers
+        self._verifiers: Dict[str, HybridVerifier] = {}
+        self._lock = threading.Lock()
+        for task in tasks or ():
+            self.verifier(task)
+
+    def verifier(self, task_name: str) -> HybridVerifier:
+        with self._lock:
+            verifier = self._verifiers.get(task_name)
+            if verifier is None:
+                verifier = HybridVerifier(
+                    task_name=task_name, cache=self.cache, metrics=self.metrics
+                )
+                self._verifiers[task_name] = verifier
+            return verifier
+
+    def __getitem__(self, task_name: str) -> HybridVerifier:
+        return self.verifier(task_name)
+
+    def __contains__(self, task_name: object) -> bool:
+        return task_name in self._verifiers
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._verifiers))
+
+    def __len__(self) -> int:
+        return len(self._verifiers)
+
+    def verify(
+        self,
+        *,
+        task: str,
+        prompt: str,
+        candidate_answer: str,
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> VerificationResult:
+        return self.verify_batch([task], [prompt], [candidate_answer], [metadata or {}])[0]
+
+    def verify_batch(
+        self,
+        tasks: Sequence[str],
+        prompts: Sequence[str],
+        candidate_answers: Sequence[str],
+        metadata_list: Optional[Sequence[Optional[Mapping[str, object]]]] = None,
+    ) -> List[VerificationResult]:
+        if not len(tasks) == len(prompts) == len(candidate_answers):
+            raise ValueError("tasks, prompts and candidate_answers must have the same length")
+        if metadata_list is None:
+            metadata_list = [{} for _ in prompts]
+        elif len(metadata_list) != len(prompts):
+            raise ValueError("metadata_list must match the number of prompts")
+
+        groups: Dict[str, List[int]] = {}
+        for idx, task in enumerate(tasks):
+            groups.setdefault(task, []).append(idx)
+        # Resolve every verifier first so an unknown task fails before any work runs.
+        verifiers = {task: self.verifier(task) for task in groups}
+
+        def _run(task: str) -> List[VerificationResult]:
+            indices = groups[task]
+            return verifiers[task].verify_batch(
+                [prompts[idx] for idx in indices],
+                [candidate_answers[idx] for idx in indices],
+                [metadata_list[idx] for idx in indices],
+            )
+
+        results: List[Optional[VerificationResult]] = [None] * len(prompts)
+        if self.workers > 1 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(groups))) as pool:
+                outputs = dict(zip(groups, pool.map(_run, groups)))
+        else:
+            outputs = {task: _run(task) for task in groups}
+        for task, indices in groups.items():
+            for idx, result in zip(indices, outputs[task]):
+                results[idx] = result
+        return results  # type: ignore[return-value]
@@ -2,18 +2,93 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Optional
+import time
+from dataclasses import replace
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from .batch import STAGES, VerificationBatchResult
 from .cache import VerificationCache
+from .metrics import REGISTRY, MetricsRegistry
 from .registry import get_task_config
-from .types import Provenance, VerificationResult, Verdict
+from .tracing import get_tracer, span
+from .types import JudgeStage, QuantitativeJudgeRegressor, VerificationResult
+
+if TYPE_CHECKING:  # NumPy is only needed once a batch calibrator is used
+    import numpy as np
+
+FeatureFn = Callable[[str, str], float]
+
+_FEATURE_FNS: Dict[str, FeatureFn] = {
+    "prompt_length": lambda prompt, candidate: len(prompt.split()),
+    "candidate_length": lambda prompt, candidate: len(candidate.split()),
+}
 
 
 class HybridVerifier:
-    def __init__(self, *, task_name: str, cache_dir: Optional[str] = None) -> None:
-        self.config = get_task_config(task_name)
-        cache_location = cache_dir or self.config.cache_dir
-        self.cache = VerificationCache(cache_location)
+    def __init__(
+        self,
+        *,
+        task_name: str,
+        cache_dir: Optional[str] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        cache: Optional[VerificationCache] = None,
+    ) -> None:
+        # A private copy, so per-verifier changes (swap_calibrator) leave the registry alone.
+        self.config = replace(get_task_config(task_name))
+        if cache is None:
+            cache = VerificationCache(cache_dir or self.config.cache_dir)
+        self.cache = cache
+        self.metrics = metrics or REGISTRY
+        self._feature_columns: Dict[Tuple[str, ...], List[Optional[FeatureFn]]] = {}
+        self._stage_seconds = {
+            stage: self.metrics.histogram(
+                "hvt_stage_duration_seconds",
+                "Per-item wall-clock time spent in each verification stage",
+                task=task_name,
+                stage=stage,
+            )
+            for stage in STAGES
+        }
+        self._verifications = self.metrics.counter(
+            "hvt_verifications_total", "Verification requests", task=task_name
+        )
+        self._cache_hits = self.metrics.counter(
+            "hvt_cache_hits_total", "Results served from the cache", task=task_name
+        )
+        self._rule_passes = self.metrics.counter(
+            "hvt_rule_passes_total", "Candidates accepted by the rule", task=task_name
+        )
+        self._judge_calls = self.metrics.counter(
+            "hvt_judge_invocations_total", "Judge calls, one per cascade stage", task=task_name
+        )
+        self._judge_skips = self.metrics.counter(
+            "hvt_judge_skips_total",
+            "Rule failures the skip policy kept from the judge",
+            task=task_name,
+        )
+
+    def swap_calibrator(
+        self,
+        calibrator: Optional[QuantitativeJudgeRegressor],
+        *,
+        stage: Optional[int] = None,
+    ) -> None:
+        """Replace this verifier's calibrator without restarting it.
+
+        By default the task-level calibrator is replaced, which applies to judge stages
+        without one of their own; pass ``stage`` to replace that judge stage's
+        calibrator instead. Only this verifier changes: other verifiers of the task and
+        the registered config keep theirs. The reference is read once per judge stage,
+        so an in-flight stage finishes with the old calibrator and later ones use the
+        new one. Cached results are untouched.
+        """
+
+        if stage is None:
+            self.config.calibrator = calibrator
+            return
+        judges = list(self.config.judge_stages())
+        judges[stage] = replace(judges[stage], calibrator=calibrator)
+        self.config.judges = judges
 
     def verify(
         self,
@@ -22,58 +97,182 @@ class HybridVerifier:
         candidate_answer: str,
         metadata: Optional[Mapping[str, object]] = None,
     ) -> VerificationResult:
-        metadata = metadata or {}
-        cached = self.cache.get(self.config.name, prompt, candidate_answer)
-        if cached:
-            cached.provenance.cache_hit = True
-            return cached
+        return self.verify_batch([prompt], [candidate_answer], [metadata or {}])[0]
+
+    def verify_batch(
+        self,
+        prompts: Sequence[str],
+        candidate_answers: Sequence[str],
+        metadata_list: Optional[Sequence[Optional[Mapping[str, object]]]] = None,
+    ) -> List[VerificationResult]:
+        """Verify many candidates, judging and calibrating the rule failures together.
+
+        Per-item stage durations (seconds) are stored in ``provenance.extra["timings"]``
+        and aggregated into ``self.metrics``. When the active tracer samples the call,
+        each stage is also emitted as a span.
+        """
+
+        return self.verify_columns(prompts, candidate_answers, metadata_list).to_list()
+
+    def verify_columns(
+        self,
+        prompts: Sequence[str],
+        candidate_answers: Sequence[str],
+        metadata_list: Optional[Sequence[Optional[Mapping[str, object]]]] = None,
+    ) -> VerificationBatchResult:
+        """Like :meth:`verify_batch`, but return a columnar :class:`VerificationBatchResult`.
 
-        rule_passed, rule_diag = self.config.rule_fn(candidate_answer, metadata)
+        Per-item results, provenance and diagnostics are only built when accessed (or
+        when written to an enabled cache).
+        """
+
+        if len(candidate_answers) != len(prompts):
+            raise ValueError("prompts and candidate_answers must have the same length")
+        if metadata_list is None:
+            metadata_list = [{} for _ in prompts]
+        elif len(metadata_list) != len(prompts):
+            raise ValueError("metadata_list must match the number of prompts")
+
+        with get_tracer().root("verify_batch", task=self.config.name, batch_size=len(prompts)):
+            return self._verify_batch(prompts, candidate_answers, metadata_list)
+
+    def _verify_batch(
+        self,
+        prompts: Sequence[str],
+        candidate_answers: Sequence[str],
+        metadata_list: Sequence[Optional[Mapping[str, object]]],
+    ) -> VerificationBatchResult:
+        clock = time.perf_counter
+        name = self.config.name
+        stages = self.config.judge_stages()
         rule_name = getattr(self.config.rule_fn, "__name__", self.config.rule_fn.__class__.__name__)
-        provenance = Provenance(
-            task_name=self.config.name,
+        batch = VerificationBatchResult(
+            len(prompts),
+            task_name=name,
             rule_name=rule_name,
-            rule_passed=rule_passed,
-            model_name=self.config.model_verifier.model_name if self.config.model_verifier else None,
-            model_invoked=False,
-            model_confidence=None,
-            cache_hit=False,
+            model_names=[stage.verifier.model_name for stage in stages],
         )
+        pending: List[int] = []
+        finished: List[int] = []
+        self._verifications.inc(len(prompts))
 
-        if rule_passed:
-            result = VerificationResult(
-                verdict=Verdict.PASS,
-                score=1.0,
-                provenance=provenance,
-                diagnostics={"rule": rule_diag},
-            )
-            self.cache.set(self.config.name, prompt, candidate_answer, result)
-            return result
-
-        if not self.config.model_verifier:
-            result = VerificationResult(
-                verdict=Verdict.FAIL,
-                score=0.0,
-                provenance=provenance,
-                diagnostics={"rule": rule_diag},
-            )
-            self.cache.set(self.config.name, prompt, candidate_answer, result)
-            return result
-
-        judge_score = self.config.model_verifier.score(prompt, candidate_answer, metadata)
-        provenance.model_invoked = True
-        provenance.model_confidence = judge_score
-        calibrated_score = self._calibrate(judge_score, prompt, candidate_answer, metadata)
-        verdict = Verdict.PASS if calibrated_score >= self.config.thresholds.get("judge_min", 0.8) else Verdict.FAIL
-
-        result = VerificationResult(
-            verdict=verdict,
-            score=calibrated_score,
-            provenance=provenance,
-            diagnostics={"rule": rule_diag, "judge_score": judge_score},
-        )
-        self.cache.set(self.config.name, prompt, candidate_answer, result)
-        return result
+        for idx, (prompt, candidate) in enumerate(zip(prompts, candidate_answers)):
+            started = clock()
+            with span("cache_lookup", task=name) as attrs:
+                cached = self.cache.get(name, prompt, candidate)
+                attrs["hit"] = cached is not None
+            if cached:
+                batch.record_cached(idx, cached)
+                batch.add_timing(idx, "cache_lookup", clock() - started)
+                self._cache_hits.inc()
+                continue
+            batch.add_timing(idx, "cache_lookup", clock() - started)
+
+            metadata = metadata_list[idx] or {}
+            started = clock()
+            with span("rule", task=name, rule=rule_name, candidate_length=len(candidate)) as attrs:
+                rule_passed, rule_diag = self.config.rule_fn(candidate, metadata)
+                attrs["passed"] = rule_passed
+            batch.add_timing(idx, "rule", clock() - started)
+            batch.record_rule(idx, rule_passed, rule_diag)
+            if rule_passed:
+                self._rule_passes.inc()
+            if rule_passed or not stages:
+                finished.append(idx)
+                continue
+
+            if self.config.skip_policy is not None:
+                skip_confidence = self.config.skip_policy.skip_confidence(rule_name, rule_diag)
+                if skip_confidence is not None:
+                    batch.record_skip(idx, skip_confidence)
+                    self._judge_skips.inc()
+                    finished.append(idx)
+                    continue
+
+            pending.append(idx)
+
+        if pending:
+            self._run_judges(stages, pending, prompts, candidate_answers, metadata_list, batch)
+            finished.extend(pending)
+
+        for idx in finished:
+            started = clock()
+            with span("cache_write", task=name):
+                if self.cache.enabled:  # avoid materializing items nobody stores
+                    self.cache.set(name, prompts[idx], candidate_answers[idx], batch[idx])
+            batch.add_timing(idx, "cache_write", clock() - started)
+        for stage in STAGES:
+            histogram = self._stage_seconds[stage]
+            for seconds in batch.stage_durations(stage):
+                if seconds == seconds:  # skip NaN: stage not run for this item
+                    histogram.observe(seconds)
+        return batch
+
+    def _run_judges(
+        self,
+        stages: Sequence[JudgeStage],
+        pending: List[int],
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        metadata_list: Sequence[Optional[Mapping[str, object]]],
+        batch: VerificationBatchResult,
+    ) -> None:
+        clock = time.perf_counter
+        judge_min = self.config.thresholds.get("judge_min", 0.8)
+        default_margin = self.config.thresholds.get("judge_margin", 0.1)
+        cascades: Dict[int, List[dict]] = {idx: [] for idx in pending}
+        active = pending
+        for position, stage in enumerate(stages):
+            batch_prompts = [prompts[idx] for idx in active]
+            batch_candidates = [candidates[idx] for idx in active]
+            started = clock()
+            with span(
+                "judge",
+                task=self.config.name,
+                model=stage.verifier.model_name,
+                batch_size=len(active),
+                candidate_chars=sum(len(candidate) for candidate in batch_candidates),
+            ):
+                raw_scores = stage.verifier.score_batch(
+                    batch_prompts,
+                    batch_candidates,
+                    [metadata_list[idx] or {} for idx in active],
+                )
+            judged = clock()
+            with span("calibration", task=self.config.name, batch_size=len(active)):
+                calibrated = self._calibrate_batch(
+                    raw_scores, batch_prompts, batch_candidates, calibrator=stage.calibrator
+                )
+            judge_share = (judged - started) / len(active)
+            calibration_share = (clock() - judged) / len(active)
+            self._judge_calls.inc(len(active))
+            margin = default_margin if stage.margin is None else stage.margin
+            last_stage = position == len(stages) - 1
+            escalate: List[int] = []
+            for idx, judge_score, calibrated_score in zip(active, raw_scores, calibrated):
+                batch.add_timing(idx, "judge", judge_share)
+                batch.add_timing(idx, "calibration", calibration_share)
+                cascades[idx].append(
+                    {
+                        "model_name": stage.verifier.model_name,
+                        "judge_score": judge_score,
+                        "calibrated_score": calibrated_score,
+                    }
+                )
+                if not last_stage and abs(calibrated_score - judge_min) < margin:
+                    escalate.append(idx)
+                    continue
+                batch.record_judge(
+                    idx,
+                    position,
+                    judge_score,
+                    calibrated_score,
+                    calibrated_score >= judge_min,
+                    cascade=cascades[idx] if len(stages) > 1 else None,
+                )
+            active = escalate
+            if not active:
+                break
 
     def _calibrate(
         self,
@@ -81,12 +280,58 @@ class HybridVerifier:
         prompt: str,
         candidate: str,
         metadata: Mapping[str, object],
+        *,
+        calibrator: Optional[QuantitativeJudgeRegressor] = None,
     ) -> float:
-        if not self.config.calibrator:
+        calibrator = calibrator or self.config.calibrator
+        if not calibrator:
             return raw_score
-        features = {
-            "prompt_length": len(prompt.split()),
-            "candidate_length": len(candidate.split()),
-        }
-        calibrated = self.config.calibrator.predict(raw_score, features)
+        features = {name: fn(prompt, candidate) for name, fn in _FEATURE_FNS.items()}
+        calibrated = calibrator.predict(raw_score, features)
         return max(0.0, min(1.0, calibrated))
+
+    def _calibrate_batch(
+        self,
+        raw_scores: Sequence[float],
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        *,
+        calibrator: Optional[QuantitativeJudgeRegressor] = None,
+    ) -> List[float]:
+        calibrator = calibrator or self.config.calibrator
+        if not calibrator:
+            return list(raw_scores)
+        feature_order = getattr(calibrator, "feature_order", None)
+        predict_batch = getattr(calibrator, "predict_batch", None)
+        if feature_order is None or predict_batch is None:
+            return [
+                self._calibrate(score, prompt, candidate, {}, calibrator=calibrator)
+                for score, prompt, candidate in zip(raw_scores, prompts, candidates)
+            ]
+        import numpy as np
+
+        matrix = self._feature_matrix(feature_order, prompts, candidates)
+        calibrated = predict_batch(np.asarray(raw_scores, dtype=float), matrix)
+        return np.clip(calibrated, 0.0, 1.0).tolist()
+
+    def _feature_matrix(
+        self,
+        feature_order: Sequence[str],
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+    ) -> np.ndarray:
+        import numpy as np
+
+        key = tuple(feature_order)
+        columns = self._feature_columns.get(key)
+        if columns is None:
+            columns = [_FEATURE_FNS.get(name) for name in key]
+            self._feature_columns[key] = columns
+        matrix = np.zeros((len(prompts), len(columns)), dtype=float)
+        for col, fn in enumerate(columns):
+            if fn is None:
+                continue
+            matrix[:, col] = [
+                fn(prompt, candidate) for prompt, candidate in zip(prompts, candidates)
+            ]
+        return matrix
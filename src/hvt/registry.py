@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import warnings
 from pathlib import Path
-from typing import Dict, Optional
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 
-from .types import TaskConfig, RuleFn, ModelVerifier, QuantitativeJudgeRegressor
+from .specs import ComponentSpec, TaskSpec, object_path
+from .types import (
+    JudgeSkipPolicy,
+    JudgeStage,
+    ModelVerifier,
+    QuantitativeJudgeRegressor,
+    RuleFn,
+    TaskConfig,
+)
 
 _TASK_REGISTRY: Dict[str, TaskConfig] = {}
+_TASK_SPECS: Dict[str, TaskSpec] = {}
 
 
 def register_task(
@@ -18,11 +29,26 @@ def register_task(
     calibrator: Optional[QuantitativeJudgeRegressor] = None,
     thresholds: Optional[Dict[str, float]] = None,
     cache_dir: Optional[str] = None,
+    judges: Optional[Sequence[Union[ModelVerifier, JudgeStage]]] = None,
+    skip_policy: Optional[JudgeSkipPolicy] = None,
 ) -> None:
-    """Register a task configuration for later lookup."""
+    """Register a task configuration for later lookup.
+
+    ``judges`` lists model verifiers from cheapest to most expensive. Each stage is
+    only consulted when the previous one's calibrated score lands within
+    ``thresholds["judge_margin"]`` of ``thresholds["judge_min"]``. An optional
+    ``skip_policy`` may short-circuit the judges on rule failures it deems final.
+    """
 
     if not name:
         raise ValueError("Task name must be non-empty")
+    if model_verifier is not None and judges:
+        raise ValueError("Pass either 'model_verifier' or 'judges', not both")
+
+    stages: List[JudgeStage] = [
+        judge if isinstance(judge, JudgeStage) else JudgeStage(verifier=judge)
+        for judge in (judges or [])
+    ]
 
     resolved_cache = Path(cache_dir).expanduser().resolve() if cache_dir else None
 
@@ -33,7 +59,21 @@ def register_task(
         calibrator=calibrator,
         thresholds=thresholds or {"judge_min": 0.8},
         cache_dir=str(resolved_cache) if resolved_cache else None,
+        judges=stages,
+        skip_policy=skip_policy,
     )
+    _TASK_SPECS.pop(name, None)
+
+
+def register_task_spec(spec: TaskSpec) -> None:
+    """Register a task from a :class:`~hvt.specs.TaskSpec` and remember the spec.
+
+    Spec-backed tasks can be captured by :func:`snapshot_registry` and rebuilt in
+    worker processes that were not forked from this one.
+    """
+
+    register_task(spec.name, **spec.build_kwargs())
+    _TASK_SPECS[spec.name] = spec
 
 
 def get_task_config(name: str) -> TaskConfig:
@@ -45,3 +85,58 @@ def get_task_config(name: str) -> TaskConfig:
 
 def clear_registry() -> None:
     _TASK_REGISTRY.clear()
+    _TASK_SPECS.clear()
+
+
+def _derive_spec(config: TaskConfig) -> Optional[TaskSpec]:
+    """Describe a code-registered task whose only component is an importable rule."""
+
+    if config.model_verifier or config.judges or config.calibrator or config.skip_policy:
+        return None
+    if object_path(config.rule_fn) is None:
+        return None
+    # Bound methods carry their instance, which an import path cannot rebuild.
+    owner = getattr(config.rule_fn, "__self__", None)
+    if owner is not None and not isinstance(owner, ModuleType):
+        return None
+    return TaskSpec(
+        name=config.name,
+        rule=ComponentSpec.reference(config.rule_fn),
+        thresholds=dict(config.thresholds),
+        cache_dir=config.cache_dir,
+    )
+
+
+def snapshot_registry(*, strict: bool = False) -> List[TaskSpec]:
+    """Picklable description of the registered tasks, for :func:`restore_registry`.
+
+    Tasks registered with :func:`register_task_spec` are captured exactly; others
+    only when their rule is a module-level function and they have no judges.
+    Remaining tasks are skipped with a warning naming them, or raise ``ValueError``
+    when ``strict``.
+    """
+
+    specs: List[TaskSpec] = []
+    skipped: List[str] = []
+    for name, config in _TASK_REGISTRY.items():
+        spec = _TASK_SPECS.get(name) or _derive_spec(config)
+        if spec is None:
+            if strict:
+                raise ValueError(f"Task '{name}' was not registered from a TaskSpec")
+            skipped.append(name)
+            continue
+        specs.append(spec)
+    if skipped:
+        warnings.warn(
+            "snapshot_registry skipped tasks that cannot be rebuilt in worker processes: "
+            + ", ".join(skipped),
+            stacklevel=2,
+        )
+    return specs
+
+
+def restore_registry(specs: Iterable[TaskSpec]) -> None:
+    """Register every spec; usable directly as a process-pool ``initializer``."""
+
+    for spec in specs:
+        register_task_spec(spec)
@@ -1,8 +1,25 @@
-"""Rule-based verifiers."""
+"""Rule-based verifiers.
 
-from .math import gsm8k_exact_match, sympy_equivalence
-from .code import PythonUnitTestRule
-from .logic import LogicSATRule
+Rules are resolved on first access so that importing one of them does not pay for
+the dependencies of the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .math import gsm8k_exact_match, sympy_equivalence
+    from .code import PythonUnitTestRule
+    from .logic import LogicSATRule
+
+_LAZY_ATTRS = {
+    "gsm8k_exact_match": ".math",
+    "sympy_equivalence": ".math",
+    "PythonUnitTestRule": ".code",
+    "LogicSATRule": ".logic",
+}
 
 __all__ = [
     "gsm8k_exact_match",
@@ -10,3 +27,16 @@ __all__ = [
     "PythonUnitTestRule",
     "LogicSATRule",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
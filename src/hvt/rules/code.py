@@ -7,6 +7,8 @@ import tempfile
 from pathlib import Path
 from typing import Mapping, Tuple
 
+from ..tracing import span
+
 
 class PythonUnitTestRule:
     """Executes candidate code with inline unittest-based tests."""
@@ -24,12 +26,16 @@ class PythonUnitTestRule:
         with tempfile.TemporaryDirectory() as tmp_dir:
             script_path = Path(tmp_dir) / "candidate_tests.py"
             script_path.write_text(script)
-            proc = subprocess.run(
-                [self.python_bin, str(script_path)],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
+            with span("sandbox", script_bytes=len(script)) as attrs:
+                proc = subprocess.run(
+                    [self.python_bin, str(script_path)],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout,
+                )
+                attrs["stdout_bytes"] = len(proc.stdout)
+                attrs["stderr_bytes"] = len(proc.stderr)
+                attrs["returncode"] = proc.returncode
         passed = proc.returncode == 0
         return passed, {"stdout": proc.stdout, "stderr": proc.stderr, "returncode": proc.returncode}
 
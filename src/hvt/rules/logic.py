@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Mapping, Tuple
+from typing import TYPE_CHECKING, Mapping, Tuple
 
-import sympy as sp
+from ..tracing import span
+
+if TYPE_CHECKING:  # SymPy is imported on first use to keep `import hvt` fast
+    import sympy as sp
 
 
 class LogicSATRule:
@@ -15,16 +18,21 @@ class LogicSATRule:
         constraints = metadata.get("constraints")
         if not isinstance(constraints, list) or not constraints:
             raise ValueError("LogicSATRule requires a non-empty list of 'constraints'")
+        import sympy as sp
+
         try:
             assignment = self._parse_assignment(candidate)
-            exprs = [sp.sympify(expr, locals=self._symbols_cache) for expr in constraints]
-            result = all(bool(expr.subs(assignment)) for expr in exprs)
+            with span("sympy_sat", constraints=len(constraints), variables=len(assignment)):
+                exprs = [sp.sympify(expr, locals=self._symbols_cache) for expr in constraints]
+                result = all(bool(expr.subs(assignment)) for expr in exprs)
             serializable_assignment = {str(k): bool(v) for k, v in assignment.items()}
             return result, {"assignment": serializable_assignment}
         except Exception as exc:  # pragma: no cover - sympy parsing edge cases
             return False, {"error": str(exc)}
 
     def _parse_assignment(self, text: str) -> dict[sp.Symbol, bool]:
+        import sympy as sp
+
         assignment: dict[sp.Symbol, bool] = {}
         for token in text.replace(",", " ").split():
             if "=" not in token:
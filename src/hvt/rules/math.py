@@ -5,8 +5,7 @@ from __future__ import annotations
 import re
 from typing import Mapping, Tuple
 
-import sympy as sp
-
+from ..tracing import span
 
 NUMERIC_RE = re.compile(r"[-+]?\d+(?:/\d+)?(?:\.\d+)?")
 
@@ -30,10 +29,13 @@ def sympy_equivalence(candidate: str, metadata: Mapping[str, object]) -> Tuple[b
     reference = str(metadata.get("reference_expression", "")).strip()
     if not reference:
         raise ValueError("SymPy equivalence rule requires 'reference_expression'")
+    import sympy as sp  # deferred: the GSM8K rule in this module needs only `re`
+
     try:
-        cand_expr = sp.simplify(candidate)
-        ref_expr = sp.simplify(reference)
-        diff = sp.simplify(cand_expr - ref_expr)
+        with span("sympy_simplify", candidate_length=len(candidate)):
+            cand_expr = sp.simplify(candidate)
+            ref_expr = sp.simplify(reference)
+            diff = sp.simplify(cand_expr - ref_expr)
         result = diff == 0
     except Exception as exc:  # pragma: no cover - sympy edge cases
         return False, {"error": str(exc)}
@@ -0,0 +1,284 @@
+"""Long-running verification service with per-task dynamic micro-batching.
+
+Verifiers (and their caches) stay resident across requests. Items from concurrent
+requests for the same task are coalesced into one ``verify_batch`` call: a batch is
+dispatched when it reaches ``max_batch_size`` or ``max_wait`` seconds after its
+first item arrived, whichever comes first.
+
+Endpoints (JSON over HTTP, meant for localhost / a trusted network):
+
+* ``POST /verify`` with ``{"task", "items": [{"prompt", "candidate", "metadata"}],
+  "include_provenance"}`` returns ``{"results": [{"verdict", "score", ...}]}``; an
+  item the rule or judge rejects with an exception gets ``{"error": ...}`` instead,
+  and an unregistered task is a 404
+* ``GET /health`` and ``GET /metrics`` (Prometheus text format)
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from .metrics import REGISTRY, MetricsRegistry
+from .orchestrator import HybridVerifier
+from .types import VerificationResult, result_to_dict
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+class UnknownTaskError(LookupError):
+    """The requested task is not registered."""
+
+
+@dataclass(slots=True)
+class _PendingItem:
+    prompt: str
+    candidate: str
+    metadata: Mapping[str, object]
+    future: Future
+
+
+class MicroBatcher:
+    """Coalesce single-item submissions for one verifier into ``verify_batch`` calls."""
+
+    def __init__(
+        self,
+        verifier: HybridVerifier,
+        *,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.verifier = verifier
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[Optional[_PendingItem]]" = queue.Queue()
+        self._batch_sizes = (metrics or verifier.metrics).histogram(
+            "hvt_server_batch_size",
+            "Items per dispatched micro-batch",
+            buckets=BATCH_SIZE_BUCKETS,
+            task=verifier.config.name,
+        )
+        self._thread = threading.Thread(
+            target=self._run, name=f"hvt-batcher-{verifier.config.name}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(
+        self,
+        prompt: str,
+        candidate: str,
+        metadata: Optional[Mapping[str, object]] = None,
+    ) -> Future:
+        future: Future = Future()
+        self._queue.put(_PendingItem(prompt, candidate, metadata or {}, future))
+        return future
+
+    def verify_many(
+        self,
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        metadata_list: Sequence[Optional[Mapping[str, object]]],
+    ) -> List[VerificationResult]:
+        futures = [
+            self.submit(prompt, candidate, metadata)
+            for prompt, candidate, metadata in zip(prompts, candidates, metadata_list)
+        ]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _collect(self, first: _PendingItem) -> tuple[List[_PendingItem], bool]:
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, closing = self._collect(first)
+            self._batch_sizes.observe(len(batch))
+            self._dispatch(batch)
+            if closing:
+                return
+
+    def _dispatch(self, batch: List[_PendingItem]) -> None:
+        try:
+            results = self.verifier.verify_batch(
+                [item.prompt for item in batch],
+                [item.candidate for item in batch],
+                [item.metadata for item in batch],
+            )
+        except Exception as exc:
+            if len(batch) == 1:
+                batch[0].future.set_exception(exc)
+                return
+            # The batch mixes items from several requests: retry them one by one so
+            # only the items that actually fail see the exception.
+            for item in batch:
+                self._dispatch([item])
+            return
+        for item, result in zip(batch, results):
+            item.future.set_result(result)
+
+
+class VerificationService:
+    """Resident verifiers and micro-batchers keyed by task name, created on first use."""
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Optional[str] = None,
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        metrics: Optional[MetricsRegistry] = None,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.metrics = metrics or REGISTRY
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self._lock = threading.Lock()
+
+    def batcher(self, task_name: str) -> MicroBatcher:
+        with self._lock:
+            batcher = self._batchers.get(task_name)
+            if batcher is None:
+                verifier = HybridVerifier(
+                    task_name=task_name, cache_dir=self.cache_dir, metrics=self.metrics
+                )
+                batcher = MicroBatcher(
+                    verifier,
+                    max_batch_size=self.max_batch_size,
+                    max_wait=self.max_wait,
+                    metrics=self.metrics,
+                )
+                self._batchers[task_name] = batcher
+            return batcher
+
+    def handle_verify(self, payload: Mapping[str, object]) -> dict:
+        task = payload.get("task")
+        items = payload.get("items")
+        if not isinstance(task, str) or not isinstance(items, list):
+            raise ValueError("Request needs a 'task' string and an 'items' list")
+        include_provenance = bool(payload.get("include_provenance", False))
+        try:
+            batcher = self.batcher(task)
+        except KeyError as exc:
+            raise UnknownTaskError(exc.args[0] if exc.args else task) from exc
+        futures = [
+            batcher.submit(
+                str(item.get("prompt", "")),
+                str(item.get("candidate", "")),
+                item.get("metadata") or {},
+            )
+            for item in items
+        ]
+        results = []
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                results.append({"error": f"{type(error).__name__}: {error}"})
+            else:
+                results.append(
+                    result_to_dict(future.result(), include_provenance=include_provenance)
+                )
+        return {"results": results}
+
+    def close(self) -> None:
+        with self._lock:
+            batchers, self._batchers = list(self._batchers.values()), {}
+        for batcher in batchers:
+            batcher.close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "VerificationHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"))
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            body = self.server.service.metrics.render_prometheus().encode("utf-8")
+            self._send(200, body, "text/plain; version=0.0.4")
+        else:
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        if self.path != "/verify":
+            self._send_json(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            response = self.server.service.handle_verify(payload)
+        except UnknownTaskError as exc:
+            self._send_json(404, {"error": str(exc)})
+        except (ValueError, AttributeError) as exc:
+            self._send_json(400, {"error": str(exc)})
+        except Exception as exc:  # pragma: no cover - unexpected verifier failure
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+        else:
+            self._send_json(200, response)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+class VerificationHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: VerificationService) -> None:
+        super().__init__(address, _Handler)
+        self.service = service
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    *,
+    service: Optional[VerificationService] = None,
+) -> VerificationHTTPServer:
+    """Bind the service (``port=0`` picks a free port); call ``serve_forever`` to run."""
+
+    return VerificationHTTPServer((host, port), service or VerificationService())
@@ -0,0 +1,174 @@
+"""Picklable, JSON-serializable task specifications.
+
+A :class:`TaskSpec` describes a task by *import path plus constructor arguments*
+instead of live objects, so it can be shipped to worker processes, written to disk
+or sent to a remote worker and turned back into an identical registration there.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from .types import JudgeStage
+
+
+def import_object(path: str) -> Any:
+    """Resolve ``"package.module:attr.sub"`` (or ``"package.module.attr"``)."""
+
+    if ":" in path:
+        module_name, _, attr_path = path.partition(":")
+    else:
+        module_name, _, attr_path = path.rpartition(".")
+    if not module_name or not attr_path:
+        raise ValueError(f"Invalid import path: {path!r}")
+    obj: Any = importlib.import_module(module_name)
+    for part in attr_path.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def object_path(obj: Any) -> Optional[str]:
+    """Import path of a module-level function or class, or ``None`` if it has none."""
+
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", None)
+    if not module or not qualname or "<" in qualname:
+        return None
+    return f"{module}:{qualname}"
+
+
+@dataclass(slots=True)
+class ComponentSpec:
+    """An importable object, optionally called with ``args``/``kwargs`` to build it.
+
+    ``call=False`` references the object itself (e.g. a plain rule function).
+    """
+
+    target: str
+    args: List[Any] = field(default_factory=list)
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    call: bool = True
+
+    @classmethod
+    def reference(cls, obj: Any) -> "ComponentSpec":
+        path = object_path(obj)
+        if path is None:
+            raise ValueError(f"{obj!r} is not importable by path")
+        return cls(target=path, call=False)
+
+    def build(self) -> Any:
+        obj = import_object(self.target)
+        return obj(*self.args, **self.kwargs) if self.call else obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "target": self.target,
+            "args": list(self.args),
+            "kwargs": dict(self.kwargs),
+            "call": self.call,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "ComponentSpec":
+        return cls(
+            target=str(payload["target"]),
+            args=list(payload.get("args", [])),
+            kwargs=dict(payload.get("kwargs", {})),
+            call=bool(payload.get("call", True)),
+        )
+
+
+def _optional(payload: Optional[Mapping[str, Any]]) -> Optional[ComponentSpec]:
+    return ComponentSpec.from_dict(payload) if payload else None
+
+
+@dataclass(slots=True)
+class JudgeStageSpec:
+    verifier: ComponentSpec
+    calibrator: Optional[ComponentSpec] = None
+    margin: Optional[float] = None
+
+    def build(self) -> JudgeStage:
+        return JudgeStage(
+            verifier=self.verifier.build(),
+            calibrator=self.calibrator.build() if self.calibrator else None,
+            margin=self.margin,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "verifier": self.verifier.to_dict(),
+            "calibrator": self.calibrator.to_dict() if self.calibrator else None,
+            "margin": self.margin,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "JudgeStageSpec":
+        return cls(
+            verifier=ComponentSpec.from_dict(payload["verifier"]),
+            calibrator=_optional(payload.get("calibrator")),
+            margin=payload.get("margin"),
+        )
+
+
+@dataclass(slots=True)
+class TaskSpec:
+    """Everything :func:`hvt.registry.register_task` needs, by reference."""
+
+    name: str
+    rule: ComponentSpec
+    judges: List[JudgeStageSpec] = field(default_factory=list)
+    calibrator: Optional[ComponentSpec] = None
+    skip_policy: Optional[ComponentSpec] = None
+    thresholds: Optional[Dict[str, float]] = None
+    cache_dir: Optional[str] = None
+
+    def build_kwargs(self) -> Dict[str, Any]:
+        """Instantiate the components as keyword arguments for ``register_task``."""
+
+        return {
+            "rule_fn": self.rule.build(),
+            "judges": [judge.build() for judge in self.judges] or None,
+            "calibrator": self.calibrator.build() if self.calibrator else None,
+            "skip_policy": self.skip_policy.build() if self.skip_policy else None,
+            "thresholds": dict(self.thresholds) if self.thresholds else None,
+            "cache_dir": self.cache_dir,
+        }
+
+    def register(self) -> None:
+        from .registry import register_task_spec
+
+        register_task_spec(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rule": self.rule.to_dict(),
+            "judges": [judge.to_dict() for judge in self.judges],
+            "calibrator": self.calibrator.to_dict() if self.calibrator else None,
+            "skip_policy": self.skip_policy.to_dict() if self.skip_policy else None,
+            "thresholds": dict(self.thresholds) if self.thresholds else None,
+            "cache_dir": self.cache_dir,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "TaskSpec":
+        return cls(
+            name=str(payload["name"]),
+            rule=ComponentSpec.from_dict(payload["rule"]),
+            judges=[JudgeStageSpec.from_dict(item) for item in payload.get("judges", [])],
+            calibrator=_optional(payload.get("calibrator")),
+            skip_policy=_optional(payload.get("skip_policy")),
+            thresholds=payload.get("thresholds"),
+            cache_dir=payload.get("cache_dir"),
+        )
+
+
+def specs_to_dicts(specs: Sequence[TaskSpec]) -> List[Dict[str, Any]]:
+    return [spec.to_dict() for spec in specs]
+
+
+def specs_from_dicts(payloads: Sequence[Mapping[str, Any]]) -> List[TaskSpec]:
+    return [TaskSpec.from_dict(payload) for payload in payloads]
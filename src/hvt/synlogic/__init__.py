@@ -1,7 +1,46 @@
 """SynLogic-lite integration helpers."""
 
-from .tasks import SynLogicExample, SynLogicTask, BooleanConstraintTask, WordEquationTask, ExpressionSimplifyTask, default_tasks
+from .tasks import (
+    SynLogicExample,
+    SynLogicTask,
+    BooleanConstraintTask,
+    WordEquationTask,
+    ExpressionSimplifyTask,
+    FunctionImplementationTask,
+    default_tasks,
+)
+from .expressions import (
+    DIFFICULTIES,
+    ExpressionDifficulty,
+    ExpressionTemplate,
+    TemplateExpressionTask,
+    format_poly,
+)
 from .exporter import synthesize_dataset, export_jsonl, load_synlogic_dataset
+from .dedup import (
+    BloomDeduper,
+    DedupStats,
+    Deduper,
+    ExactDeduper,
+    canonical_key,
+    dedupe_examples,
+    make_deduper,
+    task_space_size,
+)
+from .pipeline import (
+    AuditStats,
+    TrustPolicy,
+    audit_examples,
+    generate_examples,
+    label_example,
+    open_jsonl,
+    passed_only,
+    serialize_examples,
+    stream_synthesis,
+    verify_examples,
+    write_jsonl_lines,
+)
+from .parallel import SynthesisChunk, chunk_rng, plan_chunks, synthesize_parallel
 
 __all__ = [
     "SynLogicExample",
@@ -9,8 +48,37 @@ __all__ = [
     "BooleanConstraintTask",
     "WordEquationTask",
     "ExpressionSimplifyTask",
+    "FunctionImplementationTask",
     "default_tasks",
+    "TemplateExpressionTask",
+    "ExpressionTemplate",
+    "ExpressionDifficulty",
+    "DIFFICULTIES",
+    "format_poly",
     "synthesize_dataset",
     "export_jsonl",
     "load_synlogic_dataset",
+    "label_example",
+    "generate_examples",
+    "verify_examples",
+    "passed_only",
+    "serialize_examples",
+    "open_jsonl",
+    "write_jsonl_lines",
+    "stream_synthesis",
+    "TrustPolicy",
+    "AuditStats",
+    "audit_examples",
+    "Deduper",
+    "ExactDeduper",
+    "BloomDeduper",
+    "DedupStats",
+    "canonical_key",
+    "dedupe_examples",
+    "task_space_size",
+    "make_deduper",
+    "SynthesisChunk",
+    "chunk_rng",
+    "plan_chunks",
+    "synthesize_parallel",
 ]
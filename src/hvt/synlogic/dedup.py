@@ -0,0 +1,150 @@
+"""Deduplication of generated examples before they are verified."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, Optional
+
+from .tasks import SynLogicExample, SynLogicTask
+
+
+def canonical_key(example: SynLogicExample) -> bytes:
+    """16-byte digest of the task, prompt and metadata (key order insensitive)."""
+
+    payload = json.dumps(
+        [example.task_name, example.prompt, example.metadata],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+
+
+class Deduper:
+    """Protocol-like base class; ``add`` returns ``True`` when the key is new."""
+
+    def add(self, key: bytes) -> bool:
+        raise NotImplementedError
+
+
+class ExactDeduper(Deduper):
+    """Exact membership; memory grows with the number of unique keys (~100 B each)."""
+
+    def __init__(self) -> None:
+        self._seen: set[bytes] = set()
+
+    def add(self, key: bytes) -> bool:
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+
+class BloomDeduper(Deduper):
+    """Fixed-memory Bloom filter sized for ``capacity`` keys at ``error_rate``.
+
+    False positives drop a small fraction of genuinely new examples; duplicates are
+    never let through.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001) -> None:
+        if capacity < 1 or not 0.0 < error_rate < 1.0:
+            raise ValueError("capacity must be >= 1 and error_rate in (0, 1)")
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        import numpy as np
+
+        self._bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+
+    def _positions(self, key: bytes) -> Iterator[int]:
+        # Kirsch-Mitzenmacher double hashing over the two halves of the digest.
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:16], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: bytes) -> bool:
+        new = False
+        for pos in self._positions(key):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not self._bits[byte] & mask:
+                self._bits[byte] |= mask
+                new = True
+        return new
+
+
+@dataclass(slots=True)
+class DedupStats:
+    """Per-task generated/unique counts, plus how many unique examples each task can make.
+
+    ``space_size`` holds exact counts from :func:`task_space_size` where known. For
+    other tasks the report falls back to the uniques observed in this run, which is
+    only a lower bound (``space_size_exact`` is ``False``).
+    """
+
+    generated: Dict[str, int] = field(default_factory=dict)
+    unique: Dict[str, int] = field(default_factory=dict)
+    space_size: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        report = {}
+        for task, generated in self.generated.items():
+            unique = self.unique.get(task, 0)
+            space = self.space_size.get(task)
+            report[task] = {
+                "generated": generated,
+                "unique": unique,
+                "duplicate_rate": 1.0 - unique / generated,
+                "space_size": unique if space is None else space,
+                "space_size_exact": space is not None,
+                "coverage": unique / space if space else None,
+            }
+        return report
+
+
+def task_space_size(task: SynLogicTask, difficulty: str = "medium") -> Optional[int]:
+    """Number of distinct examples ``task`` can generate, or ``None`` if not enumerable.
+
+    Generators opt in by defining ``space_size(difficulty)``.
+    """
+
+    space_size = getattr(task, "space_size", None)
+    return space_size(difficulty) if space_size is not None else None
+
+
+def make_deduper(
+    method: str,
+    *,
+    capacity: int = 1_000_000,
+    error_rate: float = 0.001,
+) -> Deduper:
+    if method == "exact":
+        return ExactDeduper()
+    if method == "bloom":
+        return BloomDeduper(capacity, error_rate)
+    raise ValueError(f"Unknown dedup method: {method}")
+
+
+def dedupe_examples(
+    examples: Iterable[SynLogicExample],
+    deduper: Optional[Deduper] = None,
+    *,
+    stats: Optional[DedupStats] = None,
+) -> Iterator[SynLogicExample]:
+    """Drop examples whose :func:`canonical_key` was already seen, counting per task."""
+
+    deduper = deduper or ExactDeduper()
+    for example in examples:
+        if stats is not None:
+            stats.generated[example.task_name] = stats.generated.get(example.task_name, 0) + 1
+        if not deduper.add(canonical_key(example)):
+            continue
+        if stats is not None:
+            stats.unique[example.task_name] = stats.unique.get(example.task_name, 0) + 1
+        yield example
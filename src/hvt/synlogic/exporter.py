@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
 from pathlib import Path
 from typing import Iterable, List, Mapping
 
 from ..orchestrator import HybridVerifier
+from .pipeline import (
+    generate_examples,
+    open_jsonl,
+    serialize_examples,
+    verify_examples,
+    write_jsonl_lines,
+)
 from .tasks import SynLogicExample, SynLogicTask
 
 
@@ -18,37 +24,13 @@ def synthesize_dataset(
     per_task: int = 10,
     seed: int = 42,
 ) -> List[SynLogicExample]:
-    import random
-
-    rng = random.Random(seed)
-    dataset: List[SynLogicExample] = []
-    for task in tasks:
-        for idx in range(per_task):
-            example = task.generate(rng)
-            verifier = verifier_lookup.get(example.verifier_task)
-            if verifier is None:
-                raise KeyError(f"Verifier '{example.verifier_task}' not found in lookup")
-            result = verifier.verify(
-                prompt=example.prompt,
-                candidate_answer=example.canonical_answer,
-                metadata=example.metadata,
-            )
-            example.reward = 1.0 if result.verdict.name == "PASS" else 0.0
-            example.extra = {
-                "verdict": result.verdict.name,
-                "rule": result.provenance.rule_name,
-            }
-            dataset.append(example)
-    return dataset
+    examples = generate_examples(tasks, per_task=per_task, seed=seed)
+    return list(verify_examples(examples, verifier_lookup))
 
 
 def export_jsonl(examples: Iterable[SynLogicExample], output_path: str | Path) -> Path:
     path = Path(output_path)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as fh:
-        for example in examples:
-            payload = asdict(example)
-            fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+    write_jsonl_lines(serialize_examples(examples), path)
     return path
 
 
@@ -56,7 +38,7 @@ def load_synlogic_dataset(path: str | Path) -> List[SynLogicExample]:
     data: List[SynLogicExample] = []
     from .tasks import SynLogicExample as Example
 
-    with Path(path).open("r", encoding="utf-8") as fh:
+    with open_jsonl(path) as fh:
         for line in fh:
             if not line.strip():
                 continue
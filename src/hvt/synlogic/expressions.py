@@ -0,0 +1,205 @@
+"""Template-driven symbolic expression generators with answers known by construction.
+
+Each template builds a problem expression and its simplified form together from
+integer parameters, so generation never calls into SymPy.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .tasks import SynLogicExample
+
+Poly = Dict[int, int]
+
+
+@dataclass(frozen=True)
+class ExpressionDifficulty:
+    max_coeff: int
+    degree: int
+    variables: str
+
+
+DIFFICULTIES: Dict[str, ExpressionDifficulty] = {
+    "easy": ExpressionDifficulty(max_coeff=3, degree=1, variables="x"),
+    "medium": ExpressionDifficulty(max_coeff=5, degree=2, variables="x"),
+    "hard": ExpressionDifficulty(max_coeff=9, degree=3, variables="xyzt"),
+}
+
+
+BuildFn = Callable[[random.Random, ExpressionDifficulty, str], Tuple[str, str]]
+
+
+@dataclass(frozen=True)
+class ExpressionTemplate:
+    """Builds ``(expression, simplified)`` strings for one problem family."""
+
+    name: str
+    family: str
+    build: BuildFn
+
+
+def _nonzero(rng: random.Random, bound: int) -> int:
+    value = rng.randint(1, bound)
+    return value if rng.random() < 0.5 else -value
+
+
+def _term(coeff: int, power: int, var: str) -> str:
+    if power == 0:
+        return str(abs(coeff))
+    base = var if power == 1 else f"{var}**{power}"
+    return base if abs(coeff) == 1 else f"{abs(coeff)}*{base}"
+
+
+def format_poly(poly: Poly, var: str = "x") -> str:
+    """Render an integer polynomial in descending powers, e.g. ``3*x**2 - x + 4``."""
+
+    parts: List[str] = []
+    for power in sorted((p for p, c in poly.items() if c), reverse=True):
+        coeff = poly[power]
+        term = _term(coeff, power, var)
+        if not parts:
+            parts.append(term if coeff > 0 else f"-{term}")
+        else:
+            parts.append(f"{'+' if coeff > 0 else '-'} {term}")
+    return " ".join(parts) if parts else "0"
+
+
+def multiply(left: Poly, right: Poly) -> Poly:
+    out: Poly = {}
+    for p1, c1 in left.items():
+        for p2, c2 in right.items():
+            out[p1 + p2] = out.get(p1 + p2, 0) + c1 * c2
+    return {power: coeff for power, coeff in out.items() if coeff}
+
+
+def _random_poly(rng: random.Random, degree: int, bound: int) -> Poly:
+    poly = {power: rng.randint(-bound, bound) for power in range(degree)}
+    poly[degree] = _nonzero(rng, bound)
+    return {power: coeff for power, coeff in poly.items() if coeff}
+
+
+def _scaled(coeff: int, body: str) -> str:
+    if coeff == 1:
+        return body
+    if coeff == -1:
+        return f"-{body}"
+    return f"{coeff}*{body}"
+
+
+def _sum(parts: Sequence[str]) -> str:
+    """Join signed terms, turning ``a + -b`` into ``a - b``."""
+
+    out = parts[0]
+    for part in parts[1:]:
+        out += f" - {part[1:]}" if part.startswith("-") else f" + {part}"
+    return out
+
+
+def _paren(poly: Poly, var: str) -> str:
+    return f"({format_poly(poly, var)})"
+
+
+def _poly_product(rng: random.Random, params: ExpressionDifficulty, var: str) -> Tuple[str, str]:
+    factors = [
+        {1: _nonzero(rng, params.max_coeff), 0: _nonzero(rng, params.max_coeff)}
+        for _ in range(params.degree + 1)
+    ]
+    product: Poly = {0: 1}
+    for factor in factors:
+        product = multiply(product, factor)
+    return "*".join(_paren(factor, var) for factor in factors), format_poly(product, var)
+
+
+def _poly_collect(rng: random.Random, params: ExpressionDifficulty, var: str) -> Tuple[str, str]:
+    target = _random_poly(rng, params.degree + 1, params.max_coeff)
+    terms: List[Tuple[int, int]] = []
+    for power, coeff in target.items():
+        split = rng.randint(-params.max_coeff, params.max_coeff) or 1
+        terms.extend([(split, power), (coeff - split, power)])
+    rng.shuffle(terms)
+    parts = [format_poly({power: coeff}, var) for coeff, power in terms if coeff]
+    return _sum(parts), format_poly(target, var)
+
+
+def _rational_cancel(rng: random.Random, params: ExpressionDifficulty, var: str) -> Tuple[str, str]:
+    denominator = {1: 1, 0: _nonzero(rng, params.max_coeff)}
+    quotient = _random_poly(rng, params.degree, params.max_coeff)
+    numerator = multiply(denominator, quotient)
+    expression = f"{_paren(numerator, var)}/{_paren(denominator, var)}"
+    return expression, format_poly(quotient, var)
+
+
+def _rational_sum(rng: random.Random, params: ExpressionDifficulty, var: str) -> Tuple[str, str]:
+    denominator = _paren({1: 1, 0: _nonzero(rng, params.max_coeff)}, var)
+    numerators = [_nonzero(rng, params.max_coeff) for _ in range(params.degree + 1)]
+    expression = _sum([f"{value}/{denominator}" for value in numerators])
+    return expression, f"{sum(numerators)}/{denominator}"
+
+
+def _trig_pythagorean(
+    rng: random.Random, params: ExpressionDifficulty, var: str
+) -> Tuple[str, str]:
+    scale = _nonzero(rng, params.max_coeff)
+    shift = rng.randint(-params.max_coeff, params.max_coeff)
+    parts = [_scaled(scale, f"sin({var})**2"), _scaled(scale, f"cos({var})**2")]
+    if shift:
+        parts.append(str(shift))
+    return _sum(parts), str(scale + shift)
+
+
+def _trig_double_angle(
+    rng: random.Random, params: ExpressionDifficulty, var: str
+) -> Tuple[str, str]:
+    scale = _nonzero(rng, params.max_coeff)
+    if rng.random() < 0.5:
+        return _scaled(2 * scale, f"sin({var})*cos({var})"), _scaled(scale, f"sin(2*{var})")
+    expression = _sum([_scaled(scale, f"cos({var})**2"), _scaled(-scale, f"sin({var})**2")])
+    return expression, _scaled(scale, f"cos(2*{var})")
+
+
+DEFAULT_TEMPLATES: List[ExpressionTemplate] = [
+    ExpressionTemplate("poly_product", "polynomial", _poly_product),
+    ExpressionTemplate("poly_collect", "polynomial", _poly_collect),
+    ExpressionTemplate("rational_cancel", "rational", _rational_cancel),
+    ExpressionTemplate("rational_sum", "rational", _rational_sum),
+    ExpressionTemplate("trig_pythagorean", "trig", _trig_pythagorean),
+    ExpressionTemplate("trig_double_angle", "trig", _trig_double_angle),
+]
+
+
+class TemplateExpressionTask:
+    """Simplification problems drawn from expression templates, SymPy-free to generate."""
+
+    name = "expression_templates"
+
+    def __init__(
+        self,
+        templates: Optional[Sequence[ExpressionTemplate]] = None,
+        *,
+        families: Optional[Sequence[str]] = None,
+    ) -> None:
+        selected = list(templates or DEFAULT_TEMPLATES)
+        if families is not None:
+            selected = [template for template in selected if template.family in families]
+        if not selected:
+            raise ValueError("No expression templates selected")
+        self.templates = selected
+
+    def generate(self, rng: random.Random, difficulty: str = "medium") -> SynLogicExample:
+        params = DIFFICULTIES.get(difficulty)
+        if params is None:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        template = rng.choice(self.templates)
+        var = rng.choice(params.variables)
+        expression, answer = template.build(rng, params, var)
+        return SynLogicExample(
+            task_name=self.name,
+            prompt=f"Simplify the expression: {expression}",
+            canonical_answer=answer,
+            metadata={"reference_expression": answer, "template": template.name},
+            verifier_task="math_expr_builtin",
+            difficulty=difficulty,
+        )
@@ -0,0 +1,218 @@
+"""Deterministic, process-parallel SynLogic synthesis with sharded JSONL output."""
+
+from __future__ import annotations
+
+import json
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from ..orchestrator import HybridVerifier
+from ..registry import restore_registry, snapshot_registry
+from .pipeline import label_example
+from .tasks import SynLogicExample, SynLogicTask
+
+VerifierCache = Dict[Tuple[str, Optional[str]], HybridVerifier]
+
+# Only set inside pool workers (by _init_worker); the calling process never caches
+# verifiers globally, so re-registering a task takes effect on the next call.
+_WORKER_VERIFIERS: Optional[VerifierCache] = None
+
+
+@dataclass(frozen=True)
+class SynthesisChunk:
+    task_index: int
+    task_name: str
+    chunk_index: int
+    count: int
+
+
+def chunk_rng(seed: int, task_name: str, chunk_index: int) -> random.Random:
+    """Independent RNG stream for one chunk, derived from the master seed.
+
+    String seeds are hashed with SHA-512 by :class:`random.Random`, so the stream is
+    stable across processes and ``PYTHONHASHSEED`` values.
+    """
+
+    return random.Random(f"{seed}:{task_name}:{chunk_index}")
+
+
+def plan_chunks(
+    tasks: Sequence[SynLogicTask],
+    per_task: int,
+    chunk_size: int,
+) -> List[SynthesisChunk]:
+    """Split the work into ``(task, chunk)`` units in a fixed, worker-independent order."""
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    chunks: List[SynthesisChunk] = []
+    for task_index, task in enumerate(tasks):
+        for chunk_index, start in enumerate(range(0, per_task, chunk_size)):
+            chunks.append(
+                SynthesisChunk(
+                    task_index=task_index,
+                    task_name=task.name,
+                    chunk_index=chunk_index,
+                    count=min(chunk_size, per_task - start),
+                )
+            )
+    return chunks
+
+
+def _init_worker(initializer: Optional[Callable[..., object]], initargs: Sequence[object]) -> None:
+    global _WORKER_VERIFIERS
+    _WORKER_VERIFIERS = {}
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _verifier(task_name: str, cache_dir: Optional[str], verifiers: VerifierCache) -> HybridVerifier:
+    key = (task_name, cache_dir)
+    verifier = verifiers.get(key)
+    if verifier is None:
+        verifier = verifiers[key] = HybridVerifier(task_name=task_name, cache_dir=cache_dir)
+    return verifier
+
+
+def synthesize_chunk(
+    task: SynLogicTask,
+    chunk: SynthesisChunk,
+    seed: int,
+    cache_dir: Optional[str] = None,
+    verifiers: Optional[VerifierCache] = None,
+) -> List[SynLogicExample]:
+    """Generate and self-verify one chunk; the output depends only on its arguments.
+
+    ``verifiers`` lets consecutive chunks of one call share verifiers; pool workers
+    fall back to their per-process cache, other callers to fresh verifiers.
+    """
+
+    if verifiers is None:
+        verifiers = _WORKER_VERIFIERS if _WORKER_VERIFIERS is not None else {}
+
+    rng = chunk_rng(seed, chunk.task_name, chunk.chunk_index)
+    examples = [task.generate(rng) for _ in range(chunk.count)]
+    groups: Dict[str, List[SynLogicExample]] = {}
+    for example in examples:
+        groups.setdefault(example.verifier_task, []).append(example)
+    for verifier_task, group in groups.items():
+        results = _verifier(verifier_task, cache_dir, verifiers).verify_batch(
+            [example.prompt for example in group],
+            [example.canonical_answer for example in group],
+            [example.metadata for example in group],
+        )
+        for example, result in zip(group, results):
+            label_example(example, result)
+    return examples
+
+
+def _serialize_chunk(
+    task: SynLogicTask,
+    chunk: SynthesisChunk,
+    seed: int,
+    cache_dir: Optional[str],
+    verifiers: Optional[VerifierCache] = None,
+) -> Tuple[List[str], int]:
+    examples = synthesize_chunk(task, chunk, seed, cache_dir, verifiers)
+    lines = [json.dumps(asdict(example), ensure_ascii=False) for example in examples]
+    return lines, sum(1 for example in examples if example.reward == 1.0)
+
+
+def synthesize_parallel(
+    tasks: Sequence[SynLogicTask],
+    output_dir: str | Path,
+    *,
+    per_task: int = 10,
+    seed: int = 42,
+    workers: int = 1,
+    chunk_size: int = 256,
+    chunks_per_shard: int = 16,
+    cache_dir: Optional[str] = None,
+    initializer: Optional[Callable[..., object]] = None,
+    initargs: Sequence[object] = (),
+) -> dict:
+    """Synthesize ``per_task`` examples per task into ``part-NNNNN.jsonl`` shards.
+
+    Work is split into chunks of ``chunk_size`` examples, each with its own RNG stream
+    (see :func:`chunk_rng`), and written back in plan order. For fixed ``seed`` and
+    ``chunk_size`` the shards are byte-identical for any ``workers`` value. At most
+    ``2 * workers`` chunks are held in memory. Workers look verifiers up by the
+    examples' ``verifier_task``; by default each worker restores a
+    :func:`~hvt.registry.snapshot_registry` of this process, so spawned workers see
+    the same tasks. Existing ``part-*.jsonl`` files in ``output_dir`` are removed
+    first, so a rerun never leaves shards of an earlier, larger run behind.
+    """
+
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if chunks_per_shard < 1:
+        raise ValueError("chunks_per_shard must be >= 1")
+    chunks = plan_chunks(tasks, per_task, chunk_size)
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob("part-*.jsonl"):
+        stale.unlink()
+    shards: List[str] = []
+    num_examples = 0
+    num_passed = 0
+    current_shard = -1
+    handle = None
+
+    def _write(position: int, serialized: Tuple[List[str], int]) -> None:
+        nonlocal current_shard, handle, num_examples, num_passed
+        shard = position // chunks_per_shard
+        if shard != current_shard:
+            if handle is not None:
+                handle.close()
+            path = out_dir / f"part-{shard:05d}.jsonl"
+            handle = path.open("w", encoding="utf-8")
+            shards.append(str(path))
+            current_shard = shard
+        lines, passed = serialized
+        for line in lines:
+            handle.write(line + "\n")
+        num_examples += len(lines)
+        num_passed += passed
+
+    try:
+        if workers == 1:
+            verifiers: VerifierCache = {}
+            for position, chunk in enumerate(chunks):
+                task = tasks[chunk.task_index]
+                _write(position, _serialize_chunk(task, chunk, seed, cache_dir, verifiers))
+        else:
+            if initializer is None:
+                initializer, initargs = restore_registry, (snapshot_registry(),)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(initializer, tuple(initargs)),
+            ) as pool:
+                in_flight: Deque[Future] = deque()
+                position = 0
+                for chunk in chunks:
+                    in_flight.append(
+                        pool.submit(
+                            _serialize_chunk, tasks[chunk.task_index], chunk, seed, cache_dir
+                        )
+                    )
+                    if len(in_flight) >= 2 * workers:
+                        _write(position, in_flight.popleft().result())
+                        position += 1
+                while in_flight:
+                    _write(position, in_flight.popleft().result())
+                    position += 1
+    finally:
+        if handle is not None:
+            handle.close()
+
+    return {
+        "output_dir": str(out_dir),
+        "shards": shards,
+        "num_examples": num_examples,
+        "num_passed": num_passed,
+    }
@@ -0,0 +1,359 @@
+"""Lazy generate → verify → filter → serialize → write pipeline for SynLogic synthesis.
+
+Every stage is a generator, so at most ``batch_size`` examples are alive at a time and
+memory stays flat regardless of how many examples are requested.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import zlib
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+)
+
+from ..orchestrator import HybridVerifier
+from ..types import VerificationResult
+from .dedup import DedupStats, Deduper, dedupe_examples, task_space_size
+from .tasks import SynLogicExample, SynLogicTask
+
+try:
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd"}
+
+
+def label_example(example: SynLogicExample, result: VerificationResult) -> SynLogicExample:
+    """Record the self-verification outcome on ``example``."""
+
+    example.reward = 1.0 if result.verdict.name == "PASS" else 0.0
+    example.extra = {
+        "verdict": result.verdict.name,
+        "rule": result.provenance.rule_name,
+    }
+    return example
+
+
+def generate_examples(
+    tasks: Iterable[SynLogicTask],
+    *,
+    per_task: int = 10,
+    seed: int = 42,
+) -> Iterator[SynLogicExample]:
+    """Yield ``per_task`` examples per task from a single ``random.Random(seed)`` stream."""
+
+    import random
+
+    rng = random.Random(seed)
+    for task in tasks:
+        for _ in range(per_task):
+            yield task.generate(rng)
+
+
+def verify_examples(
+    examples: Iterable[SynLogicExample],
+    verifier_lookup: Mapping[str, HybridVerifier],
+    *,
+    batch_size: int = 256,
+) -> Iterator[SynLogicExample]:
+    """Self-verify canonical answers ``batch_size`` at a time, preserving input order."""
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    iterator = iter(examples)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        groups: Dict[str, List[SynLogicExample]] = {}
+        for example in batch:
+            groups.setdefault(example.verifier_task, []).append(example)
+        for verifier_task, group in groups.items():
+            verifier = verifier_lookup.get(verifier_task)
+            if verifier is None:
+                raise KeyError(f"Verifier '{verifier_task}' not found in lookup")
+            results = verifier.verify_batch(
+                [example.prompt for example in group],
+                [example.canonical_answer for example in group],
+                [example.metadata for example in group],
+            )
+            for example, result in zip(group, results):
+                label_example(example, result)
+        yield from batch
+
+
+@dataclass(slots=True)
+class TrustPolicy:
+    """Treat generators as correct by construction and audit only a sample.
+
+    An example is audited when it is among the first ``audit_first`` of its task or
+    with probability ``audit_rate``; ``tasks`` limits trust to the named generators
+    (``None`` trusts all of them). Untrusted tasks are always verified.
+    """
+
+    audit_rate: float = 0.01
+    audit_first: int = 0
+    tasks: Optional[Collection[str]] = None
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.audit_rate <= 1.0:
+            raise ValueError("audit_rate must be in [0, 1]")
+
+    def trusts(self, task_name: str) -> bool:
+        return self.tasks is None or task_name in self.tasks
+
+
+@dataclass(slots=True)
+class AuditStats:
+    generated: Dict[str, int] = field(default_factory=dict)
+    audited: Dict[str, int] = field(default_factory=dict)
+    failed: Dict[str, int] = field(default_factory=dict)
+    failures: Dict[str, List[dict]] = field(default_factory=dict)
+    untrusted_verified: int = 0
+    max_failures_kept: int = 20
+
+    def record_failure(self, example: SynLogicExample) -> None:
+        """Count a failed audit; only the first ``max_failures_kept`` are kept as examples."""
+
+        task = example.task_name
+        self.failed[task] = self.failed.get(task, 0) + 1
+        kept = self.failures.setdefault(task, [])
+        if len(kept) < self.max_failures_kept:
+            kept.append(
+                {
+                    "prompt": example.prompt,
+                    "canonical_answer": example.canonical_answer,
+                    "metadata": example.metadata,
+                    "verdict": example.extra.get("verdict"),
+                }
+            )
+
+    def to_dict(self) -> dict:
+        report = {}
+        for task, generated in self.generated.items():
+            audited = self.audited.get(task, 0)
+            report[task] = {
+                "generated": generated,
+                "audited": audited,
+                "audit_rate": audited / generated,
+                "failed": self.failed.get(task, 0),
+                "failure_examples": self.failures.get(task, []),
+            }
+        return report
+
+
+def audit_examples(
+    examples: Iterable[SynLogicExample],
+    verifier_lookup: Mapping[str, HybridVerifier],
+    policy: TrustPolicy,
+    *,
+    batch_size: int = 256,
+    stats: Optional[AuditStats] = None,
+) -> Iterator[SynLogicExample]:
+    """Verify only the audited sample of trusted tasks; the rest keep ``reward=1.0``.
+
+    Unaudited examples are marked ``extra={"verdict": "TRUSTED"}``; audited ones carry
+    ``extra["audited"] = True`` next to the usual verdict and rule.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    import random
+
+    stats = stats if stats is not None else AuditStats()
+    rng = random.Random(policy.seed)
+    iterator = iter(examples)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        selected: List[SynLogicExample] = []
+        for example in batch:
+            task = example.task_name
+            if not policy.trusts(task):
+                stats.untrusted_verified += 1
+                selected.append(example)
+                continue
+            seen = stats.generated.get(task, 0)
+            stats.generated[task] = seen + 1
+            if seen >= policy.audit_first and rng.random() >= policy.audit_rate:
+                example.reward = 1.0
+                example.extra = {"verdict": "TRUSTED"}
+                continue
+            selected.append(example)
+        for example in verify_examples(selected, verifier_lookup, batch_size=len(selected) or 1):
+            task = example.task_name
+            if not policy.trusts(task):
+                continue
+            example.extra["audited"] = True
+            stats.audited[task] = stats.audited.get(task, 0) + 1
+            if example.reward != 1.0:
+                stats.record_failure(example)
+        yield from batch
+
+
+def passed_only(examples: Iterable[SynLogicExample]) -> Iterator[SynLogicExample]:
+    return (example for example in examples if example.reward == 1.0)
+
+
+def serialize_examples(examples: Iterable[SynLogicExample]) -> Iterator[str]:
+    for example in examples:
+        yield json.dumps(asdict(example), ensure_ascii=False)
+
+
+def _open_binary(path: Path, compression: Optional[str], mode: str = "wb") -> BinaryIO:
+    if compression is None:
+        return path.open(mode)
+    if compression == "gzip":
+        return gzip.open(path, mode)  # type: ignore[return-value]
+    if compression == "zstd":
+        if zstandard is None:
+            raise ModuleNotFoundError(
+                "zstd files require the 'zstandard' package (pip install zstandard)"
+            )
+        if mode == "rb":
+            return zstandard.ZstdDecompressor().stream_reader(  # type: ignore[return-value]
+                path.open("rb"), read_across_frames=True, closefd=True
+            )
+        return zstandard.ZstdCompressor().stream_writer(path.open("wb"), closefd=True)
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def open_jsonl(path: str | Path, *, compression: Optional[str] = None) -> TextIO:
+    """Open a JSONL file for reading, inferring compression from the suffix like the writer."""
+
+    path = Path(path)
+    if compression is None:
+        compression = COMPRESSION_SUFFIXES.get(path.suffix)
+    return io.TextIOWrapper(_open_binary(path, compression, "rb"), encoding="utf-8")
+
+
+def _flusher(handle: BinaryIO, compression: Optional[str]) -> Callable[[], None]:
+    # A sync flush ends the current compressed block, so everything written so far
+    # can be decoded even if the process dies before the stream is closed.
+    if compression == "gzip":
+        return lambda: handle.flush(zlib.Z_SYNC_FLUSH)  # type: ignore[call-arg]
+    if compression == "zstd":
+        return lambda: handle.flush(zstandard.FLUSH_BLOCK)  # type: ignore[call-arg]
+    return handle.flush
+
+
+def write_jsonl_lines(
+    lines: Iterable[str],
+    output_path: str | Path,
+    *,
+    compression: Optional[str] = None,
+    flush_every: int = 1000,
+) -> int:
+    """Write serialized records, flushing every ``flush_every`` lines; returns the count.
+
+    ``compression`` defaults to the path suffix (``.gz`` → gzip, ``.zst`` → zstd).
+    """
+
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compression is None:
+        compression = COMPRESSION_SUFFIXES.get(path.suffix)
+    written = 0
+    with _open_binary(path, compression) as handle:
+        flush = _flusher(handle, compression)
+        for line in lines:
+            handle.write(line.encode("utf-8") + b"\n")
+            written += 1
+            if flush_every and written % flush_every == 0:
+                flush()
+    return written
+
+
+def stream_synthesis(
+    tasks: Iterable[SynLogicTask],
+    verifier_lookup: Mapping[str, HybridVerifier],
+    output_path: str | Path,
+    *,
+    per_task: int = 10,
+    seed: int = 42,
+    batch_size: int = 256,
+    keep_failed: bool = True,
+    deduper: Optional[Deduper] = None,
+    trust: Optional[TrustPolicy] = None,
+    compression: Optional[str] = None,
+    flush_every: int = 1000,
+) -> dict:
+    """Generate, self-verify and write examples without materializing the dataset.
+
+    Produces the same records as :func:`synthesize_dataset` followed by
+    :func:`export_jsonl`; with ``keep_failed=False`` examples whose canonical answer
+    failed verification are dropped. With a ``deduper``, repeated prompt/metadata
+    pairs are dropped before verification and per-task unique counts are reported.
+    With a ``trust`` policy only its audit sample is verified (see
+    :func:`audit_examples`) and the audit rate and failures are reported.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    tasks = list(tasks)
+    counts = {"kept": 0, "passed": 0}
+
+    def _count(examples: Iterable[SynLogicExample]) -> Iterator[SynLogicExample]:
+        for example in examples:
+            counts["kept"] += 1
+            counts["passed"] += int(example.reward == 1.0)
+            yield example
+
+    generated: Iterable[SynLogicExample] = generate_examples(tasks, per_task=per_task, seed=seed)
+    dedup_stats = DedupStats()
+    if deduper is not None:
+        for task in tasks:
+            space = task_space_size(task)
+            if space is not None:
+                dedup_stats.space_size[task.name] = space
+        generated = dedupe_examples(generated, deduper, stats=dedup_stats)
+    audit_stats = AuditStats()
+    if trust is not None:
+        labelled = audit_examples(
+            generated, verifier_lookup, trust, batch_size=batch_size, stats=audit_stats
+        )
+    else:
+        labelled = verify_examples(generated, verifier_lookup, batch_size=batch_size)
+    examples = _count(labelled)
+    if not keep_failed:
+        examples = passed_only(examples)
+    written = write_jsonl_lines(
+        serialize_examples(examples),
+        output_path,
+        compression=compression,
+        flush_every=flush_every,
+    )
+    summary = {
+        "output": str(output_path),
+        "num_examples": written,
+        "num_generated": counts["kept"],
+        "num_passed": counts["passed"],
+    }
+    if deduper is not None:
+        summary["num_generated"] = sum(dedup_stats.generated.values())
+        summary["num_verified"] = counts["kept"]
+        summary["dedup"] = dedup_stats.to_dict()
+    if trust is not None:
+        summary["num_verified"] = (
+            sum(audit_stats.audited.values()) + audit_stats.untrusted_verified
+        )
+        summary["audit"] = audit_stats.to_dict()
+    return summary
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass, field
+from math import perm
 from typing import Dict, List, Protocol
 
-import sympy as sp
-
 
 @dataclass(slots=True)
 class SynLogicExample:
@@ -33,6 +32,12 @@ class BooleanConstraintTask:
 
     name = "boolean_constraints"
 
+    def space_size(self, difficulty: str = "medium") -> int:
+        """Distinct examples: ordered variables x assignments x ordered ``Or`` pair."""
+
+        var_count = 3 if difficulty == "easy" else 4
+        return perm(6, var_count) * 2**var_count * perm(var_count, 2)
+
     def generate(self, rng: random.Random, difficulty: str = "medium") -> SynLogicExample:
         var_count = 3 if difficulty == "easy" else 4
         variables = rng.sample(list("xyzuvw"), var_count)
@@ -64,6 +69,9 @@ class WordEquationTask:
 
     name = "word_equations"
 
+    def space_size(self, difficulty: str = "medium") -> int:
+        return 8 * 5 * 3  # base in [3, 10], gain in [2, 6], give in [1, 3]
+
     def generate(self, rng: random.Random, difficulty: str = "medium") -> SynLogicExample:
         base = rng.randint(3, 10)
         gain = rng.randint(2, 6)
@@ -89,15 +97,16 @@ class ExpressionSimplifyTask:
 
     name = "expression_simplify"
 
+    def space_size(self, difficulty: str = "medium") -> int:
+        return 4  # only coeff in [2, 5] reaches the prompt
+
     def generate(self, rng: random.Random, difficulty: str = "medium") -> SynLogicExample:
-        x = sp.symbols("x")
         coeff = rng.randint(2, 5)
-        expr = coeff * x + coeff * x
-        extra = rng.randint(1, 4)
-        combined = expr + extra - extra
-        simplified = sp.simplify(combined)
-        prompt = f"Simplify the expression: {sp.sstr(combined)}"
-        answer = sp.sstr(simplified)
+        rng.randint(1, 4)  # formerly a cancelling constant; drawn to keep seeded streams stable
+        # coeff*x + coeff*x + extra - extra; SymPy auto-evaluates it to 2*coeff*x on
+        # construction, so both the prompt and the answer are known without simplify.
+        answer = f"{2 * coeff}*x"
+        prompt = f"Simplify the expression: {answer}"
         metadata = {"reference_expression": answer}
         return SynLogicExample(
             task_name=self.name,
@@ -109,5 +118,41 @@ class ExpressionSimplifyTask:
         )
 
 
+class FunctionImplementationTask:
+    """Tiny function-writing problems checked by running unit tests."""
+
+    name = "python_functions"
+
+    def space_size(self, difficulty: str = "medium") -> int:
+        return 8 * 11 * (21 * 21) ** 3  # scale, offset, three (a, b) test cases
+
+    def generate(self, rng: random.Random, difficulty: str = "medium") -> SynLogicExample:
+        scale = rng.randint(2, 9)
+        offset = rng.randint(-5, 5)
+        cases = [(rng.randint(-10, 10), rng.randint(-10, 10)) for _ in range(3)]
+        prompt = (
+            f"Write a Python function `combine(a, b)` that returns {scale} * a + b + ({offset})."
+        )
+        answer = f"def combine(a, b):\n    return {scale} * a + b + ({offset})\n"
+        asserts = "\n".join(
+            f"        self.assertEqual(combine({a}, {b}), {scale * a + b + offset})"
+            for a, b in cases
+        )
+        tests_code = (
+            "import unittest\n\n\n"
+            "class CombineTests(unittest.TestCase):\n"
+            "    def test_combine(self):\n"
+            f"{asserts}\n"
+        )
+        return SynLogicExample(
+            task_name=self.name,
+            prompt=prompt,
+            canonical_answer=answer,
+            metadata={"tests_code": tests_code},
+            verifier_task="code_exec_builtin",
+            difficulty=difficulty,
+        )
+
+
 def default_tasks() -> List[SynLogicTask]:
     return [BooleanConstraintTask(), WordEquationTask(), ExpressionSimplifyTask()]
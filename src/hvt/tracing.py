@@ -0,0 +1,189 @@
+"""Pluggable span tracing for verification pipelines.
+
+Spans are only recorded inside a sampled root span (one per ``verify_batch`` call),
+so rules and judges can call :func:`span` unconditionally: outside a sampled root it
+costs a context-variable lookup and nothing else.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_ACTIVE: ContextVar[bool] = ContextVar("hvt_trace_active", default=False)
+
+
+@dataclass(slots=True)
+class SpanEvent:
+    name: str
+    phase: str
+    timestamp_us: float
+    task: Optional[str]
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    process_id: int = 0
+    thread_id: int = 0
+
+
+class TraceCollector:
+    """Protocol-like base class for span sinks."""
+
+    def emit(self, event: SpanEvent) -> None:
+        raise NotImplementedError
+
+
+class ChromeTraceCollector(TraceCollector):
+    """Collect spans as Chrome trace events (``chrome://tracing`` / Perfetto JSON)."""
+
+    def __init__(self, path: Optional[str | Path] = None) -> None:
+        self.path = Path(path) if path else None
+        self.events: List[dict] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: SpanEvent) -> None:
+        payload = {
+            "name": event.name,
+            "cat": event.task or "hvt",
+            "ph": "B" if event.phase == "start" else "E",
+            "ts": event.timestamp_us,
+            "pid": event.process_id,
+            "tid": event.thread_id,
+        }
+        if event.attributes:
+            payload["args"] = dict(event.attributes)
+        with self._lock:
+            self.events.append(payload)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {"traceEvents": list(self.events), "displayTimeUnit": "ms"}
+
+    def write(self, path: Optional[str | Path] = None) -> Path:
+        target = Path(path) if path else self.path
+        if target is None:
+            raise ValueError("No output path given for the Chrome trace")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        return target
+
+
+class _Discard(dict):
+    def __setitem__(self, key: str, value: Any) -> None:
+        pass
+
+
+class _NullSpan:
+    def __enter__(self) -> Dict[str, Any]:
+        return _Discard()
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Fan span events out to collectors for a ``sample_rate`` fraction of root spans."""
+
+    def __init__(
+        self,
+        collectors: Optional[List[TraceCollector]] = None,
+        *,
+        sample_rate: float = 1.0,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in [0, 1]")
+        self.collectors: List[TraceCollector] = list(collectors or [])
+        self.sample_rate = sample_rate
+
+    def add_collector(self, collector: TraceCollector) -> None:
+        self.collectors.append(collector)
+
+    def remove_collector(self, collector: TraceCollector) -> None:
+        self.collectors.remove(collector)
+
+    def _emit(self, name: str, phase: str, task: Optional[str], attributes: Dict[str, Any]) -> None:
+        event = SpanEvent(
+            name=name,
+            phase=phase,
+            timestamp_us=time.perf_counter_ns() / 1000.0,
+            task=task,
+            attributes=attributes,
+            process_id=os.getpid(),
+            thread_id=threading.get_ident(),
+        )
+        for collector in self.collectors:
+            collector.emit(event)
+
+    @contextmanager
+    def _record(
+        self,
+        name: str,
+        task: Optional[str],
+        attributes: Dict[str, Any],
+    ) -> Iterator[Dict[str, Any]]:
+        self._emit(name, "start", task, dict(attributes))
+        end_attributes: Dict[str, Any] = {}
+        try:
+            yield end_attributes
+        finally:
+            self._emit(name, "end", task, end_attributes)
+
+    @contextmanager
+    def root(
+        self,
+        name: str,
+        *,
+        task: Optional[str] = None,
+        **attributes: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """Open a root span, deciding whether this unit of work is sampled."""
+
+        if _ACTIVE.get() or not self.collectors or random.random() >= self.sample_rate:
+            with self.span(name, task=task, **attributes) as attrs:
+                yield attrs
+            return
+        token = _ACTIVE.set(True)
+        try:
+            with self._record(name, task, attributes) as attrs:
+                yield attrs
+        finally:
+            _ACTIVE.reset(token)
+
+    def span(self, name: str, *, task: Optional[str] = None, **attributes: Any):
+        """Child span; a no-op unless an enclosing root span was sampled.
+
+        The context manager yields a dict; keys set on it are attached to the end event
+        (e.g. output sizes known only after the work is done).
+        """
+
+        if not _ACTIVE.get() or not self.collectors:
+            return _NULL_SPAN
+        return self._record(name, task, attributes)
+
+
+_TRACER = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _TRACER
+
+
+def set_tracer(tracer: Tracer) -> Tracer:
+    """Install ``tracer`` process-wide and return the previous one."""
+
+    global _TRACER
+    previous, _TRACER = _TRACER, tracer
+    return previous
+
+
+def span(name: str, *, task: Optional[str] = None, **attributes: Any):
+    return _TRACER.span(name, task=task, **attributes)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
 
 
 class Verdict(Enum):
@@ -55,6 +55,17 @@ def provenance_to_dict(provenance: Provenance) -> Dict[str, Any]:
     }
 
 
+def result_to_dict(
+    result: VerificationResult,
+    *,
+    include_provenance: bool = True,
+) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {"verdict": result.verdict.name, "score": result.score}
+    if include_provenance:
+        payload["provenance"] = provenance_to_dict(result.provenance)
+    return payload
+
+
 def provenance_from_dict(payload: Mapping[str, Any]) -> Provenance:
     return Provenance(
         task_name=str(payload["task_name"]),
@@ -72,6 +83,19 @@ def provenance_from_dict(payload: Mapping[str, Any]) -> Provenance:
 RuleFn = Callable[[str, Mapping[str, Any]], tuple[bool, Dict[str, Any]]]
 
 
+@dataclass(slots=True)
+class JudgeStage:
+    """One rung of a cheap-to-expensive judge cascade.
+
+    ``calibrator`` and ``margin`` fall back to the task-level calibrator and the
+    ``judge_margin`` threshold when left unset.
+    """
+
+    verifier: "ModelVerifier"
+    calibrator: Optional["QuantitativeJudgeRegressor"] = None
+    margin: Optional[float] = None
+
+
 @dataclass(slots=True)
 class TaskConfig:
     """Configuration for a registered verification task."""
@@ -82,6 +106,17 @@ class TaskConfig:
     calibrator: Optional["QuantitativeJudgeRegressor"] = None
     thresholds: Dict[str, float] = field(default_factory=lambda: {"judge_min": 0.0})
     cache_dir: Optional[str] = None
+    judges: List[JudgeStage] = field(default_factory=list)
+    skip_policy: Optional["JudgeSkipPolicy"] = None
+
+    def judge_stages(self) -> List[JudgeStage]:
+        """Return the judge cascade, treating a lone ``model_verifier`` as one stage."""
+
+        if self.judges:
+            return self.judges
+        if self.model_verifier is not None:
+            return [JudgeStage(verifier=self.model_verifier)]
+        return []
 
 
 class ModelVerifier:
@@ -92,6 +127,19 @@ class ModelVerifier:
     def score(self, prompt: str, candidate: str, metadata: Optional[Mapping[str, Any]] = None) -> float:
         raise NotImplementedError
 
+    def score_batch(
+        self,
+        prompts: Sequence[str],
+        candidates: Sequence[str],
+        metadata_list: Sequence[Mapping[str, Any]],
+    ) -> List[float]:
+        """Score several candidates; override when the backend supports batching."""
+
+        return [
+            self.score(prompt, candidate, metadata)
+            for prompt, candidate, metadata in zip(prompts, candidates, metadata_list)
+        ]
+
 
 class QuantitativeJudgeRegressor:
     """Protocol for calibration models."""
@@ -100,4 +148,13 @@ class QuantitativeJudgeRegressor:
         raise NotImplementedError
 
 
+class JudgeSkipPolicy:
+    """Protocol for policies that skip the judge on rule failures known to be final."""
+
+    def skip_confidence(self, rule_name: str, diagnostics: Mapping[str, Any]) -> Optional[float]:
+        """Return the confidence that the judge would FAIL, or ``None`` to call it."""
+
+        raise NotImplementedError
+
+
 CalibratorFactory = Callable[[Mapping[str, Any]], QuantitativeJudgeRegressor]
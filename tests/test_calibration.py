@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from hvt import HybridVerifier
+from hvt.calibration import (
+    CalibrationExample,
+    DiagnosticSkipPolicy,
+    QuantitativeJudgeRegressorImpl,
+    RecursiveLeastSquaresCalibrator,
+    SkipObservation,
+)
+from hvt.model_verifiers import StaticJudge
+from hvt.registry import clear_registry, get_task_config, register_task
+from hvt.rules.math import gsm8k_exact_match
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def test_skip_policy_skips_certain_failures():
+    numeric_mismatch = {"candidate_normalized": "13", "reference_normalized": "12"}
+    history = [
+        SkipObservation("gsm8k_exact_match", numeric_mismatch, judge_passed=False)
+        for _ in range(50)
+    ]
+    policy = DiagnosticSkipPolicy.train(history, min_support=10, min_confidence=0.95)
+    judge = StaticJudge(confidence=0.99)
+    register_task(
+        name="gsm8k_skip",
+        rule_fn=gsm8k_exact_match,
+        model_verifier=judge,
+        skip_policy=policy,
+    )
+    verifier = HybridVerifier(task_name="gsm8k_skip")
+
+    skipped = verifier.verify(prompt="Q", candidate_answer="7", metadata={"reference_answer": "12"})
+    assert skipped.verdict.name == "FAIL"
+    assert skipped.provenance.model_invoked is False
+    assert skipped.provenance.extra["judge_skipped"] is True
+    assert skipped.provenance.extra["skip_confidence"] >= 0.95
+
+    # A non-numeric candidate is an unseen pattern, so the judge still runs.
+    judged = verifier.verify(
+        prompt="Q", candidate_answer="twelve", metadata={"reference_answer": "12"}
+    )
+    assert judged.provenance.model_invoked is True
+    assert SkipObservation.from_result(judged).judge_passed is True
+
+
+def test_regressor_batch_prediction_and_npz_roundtrip(tmp_path):
+    examples = [
+        CalibrationExample(
+            judge_score=0.5,
+            human_score=0.1 * idx,
+            features={"prompt_length": float(idx), "candidate_length": float(idx % 3)},
+        )
+        for idx in range(10)
+    ]
+    regressor = QuantitativeJudgeRegressorImpl.train(examples)
+    rows = [ex.features for ex in examples]
+    batch = regressor.predict_batch([0.5] * len(rows), regressor.feature_matrix(rows))
+    single = [regressor.predict(0.5, row) for row in rows]
+    assert np.allclose(batch, single)
+
+    restored = QuantitativeJudgeRegressorImpl.load(regressor.save(tmp_path / "calibrator"))
+    assert restored.feature_order == regressor.feature_order
+    restored_batch = restored.predict_batch([0.5] * len(rows), regressor.feature_matrix(rows))
+    assert np.allclose(restored_batch, batch)
+    assert regressor.save(tmp_path / "calib.v2").name == "calib.v2.npz"
+    assert regressor.save(tmp_path / "calib.v2.npz").name == "calib.v2.npz"
+
+
+def test_verify_batch_matches_single_verify():
+    calibrator = QuantitativeJudgeRegressorImpl(
+        weights=np.array([0.0, 0.3]), bias=0.2, feature_order=["candidate_length", "prompt_length"]
+    )
+    register_task(
+        name="gsm8k_calibrated",
+        rule_fn=gsm8k_exact_match,
+        model_verifier=StaticJudge(confidence=0.9),
+        calibrator=calibrator,
+        thresholds={"judge_min": 0.8},
+    )
+    verifier = HybridVerifier(task_name="gsm8k_calibrated")
+    prompts = ["Q", "a longer prompt here", "Q"]
+    candidates = ["12", "13", "14"]
+    metadata = [{"reference_answer": "12"}] * 3
+    batch = verifier.verify_batch(prompts, candidates, metadata)
+    single = [
+        verifier.verify(prompt=p, candidate_answer=c, metadata=m)
+        for p, c, m in zip(prompts, candidates, metadata)
+    ]
+    assert [r.verdict for r in batch] == [r.verdict for r in single]
+    assert [r.score for r in batch] == pytest.approx([r.score for r in single])
+    assert batch[0].provenance.model_invoked is False
+    assert batch[1].verdict.name == "PASS" and batch[2].verdict.name == "FAIL"
+
+
+def test_online_calibrator_converges_and_hot_swaps(tmp_path):
+    rng = np.random.default_rng(0)
+    online = RecursiveLeastSquaresCalibrator(
+        ["prompt_length"], l2=1e-3, snapshot_path=tmp_path / "online", snapshot_every=50
+    )
+    for _ in range(200):
+        length = float(rng.integers(1, 20))
+        online.update(
+            CalibrationExample(
+                judge_score=0.5, human_score=0.02 * length + 0.3, features={"prompt_length": length}
+            )
+        )
+    assert online.weights[0] == pytest.approx(0.02, abs=1e-3)
+    assert online.bias == pytest.approx(0.3, abs=1e-2)
+    restored = QuantitativeJudgeRegressorImpl.load(tmp_path / "online.npz")
+    assert restored.bias == pytest.approx(online.bias)
+
+    register_task(
+        name="gsm8k_online",
+        rule_fn=gsm8k_exact_match,
+        model_verifier=StaticJudge(confidence=0.9),
+        thresholds={"judge_min": 0.5},
+    )
+    verifier = HybridVerifier(task_name="gsm8k_online")
+    meta = {"reference_answer": "12"}
+    assert verifier.verify(prompt="Q", candidate_answer="1", metadata=meta).score == 0.9
+    verifier.swap_calibrator(online)
+    swapped = verifier.verify(prompt="Q", candidate_answer="2", metadata=meta)
+    assert swapped.score == pytest.approx(0.32, abs=1e-2)
+
+    other = HybridVerifier(task_name="gsm8k_online")
+    assert other.verify(prompt="Q", candidate_answer="3", metadata=meta).score == 0.9
+    assert get_task_config("gsm8k_online").calibrator is None
+
+    other.swap_calibrator(online, stage=0)
+    staged = other.verify(prompt="Q", candidate_answer="4", metadata=meta)
+    assert staged.score == pytest.approx(0.32, abs=1e-2)
+    assert get_task_config("gsm8k_online").judge_stages()[0].calibrator is None
+
+
+def test_online_warm_start_keeps_batch_coefficients(tmp_path):
+    batch = QuantitativeJudgeRegressorImpl(
+        weights=np.array([0.02]), bias=0.3, feature_order=["prompt_length"]
+    )
+    outlier = CalibrationExample(judge_score=0.5, human_score=1.0, features={"prompt_length": 1.0})
+    drift = {}
+    for strength in (0.0, 100.0):
+        online = RecursiveLeastSquaresCalibrator.from_regressor(batch, prior_strength=strength)
+        online.update(outlier)
+        drift[strength] = abs(online.bias - 0.3)
+    assert drift[100.0] < 0.01 < drift[0.0]
+
+
+def test_online_concurrent_snapshots(tmp_path):
+    online = RecursiveLeastSquaresCalibrator(
+        ["prompt_length"], snapshot_path=tmp_path / "calib.v2", snapshot_every=1
+    )
+    example = CalibrationExample(judge_score=0.5, human_score=0.4, features={"prompt_length": 2.0})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: online.update(example), range(64)))
+    assert [path.name for path in tmp_path.iterdir()] == ["calib.v2.npz"]
+    restored = QuantitativeJudgeRegressorImpl.load(tmp_path / "calib.v2.npz")
+    assert restored.bias == pytest.approx(online.bias)
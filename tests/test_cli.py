@@ -90,3 +90,112 @@ def test_cli_synthesize(tmp_path, capsys):
     )
     payload = json.loads(capsys.readouterr().out.strip())
     assert Path(payload["output"]).exists()
+
+
+@pytest.mark.parametrize(
+    "extra",
+    [
+        ["--output", "syn.jsonl", "--workers", "2"],
+        ["--output", "syn.jsonl", "--batch-size", "0"],
+        ["--output-dir", "shards", "--passed-only"],
+        ["--output-dir", "shards", "--batch-size", "8"],
+        ["--output-dir", "shards", "--flush-every", "10"],
+    ],
+)
+def test_cli_synthesize_rejects_ignored_options(tmp_path, monkeypatch, extra):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(SystemExit) as excinfo:
+        main(["synthesize", "--tasks", "word_equations", "--count", "1", *extra])
+    assert excinfo.value.code != 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cli_sharded_eval_and_merge(tmp_path, capsys):
+    dataset_path = tmp_path / "dataset.jsonl"
+    with dataset_path.open("w", encoding="utf-8") as fh:
+        for idx in range(9):
+            payload = {
+                "prompt": "Q",
+                "candidate": str(idx),
+                "metadata": {"reference_answer": "3"},
+                "label": idx in (3, 4),
+            }
+            fh.write(json.dumps(payload) + "\n")
+
+    partials = []
+    for shard in range(2):
+        partial = tmp_path / f"part-{shard}.json"
+        argv = ["--use-builtins", "eval", "--task", "gsm8k_builtin", "--dataset", str(dataset_path)]
+        argv += ["--shard-index", str(shard), "--shard-count", "2", "--workers", "2"]
+        assert main(argv + ["--output", str(partial)]) == 0
+        capsys.readouterr()
+        partials.append(str(partial))
+
+    assert main(["eval-merge", *partials]) == 0
+    merged = json.loads(capsys.readouterr().out.strip())
+    assert merged["total"] == 9
+    assert (merged["tp"], merged["fn"], merged["tn"], merged["fp"]) == (1, 1, 7, 0)
+
+
+def test_cli_bench_against_baseline(tmp_path, capsys):
+    result_path = tmp_path / "bench.json"
+    argv = ["bench", "--tasks", "gsm8k_builtin", "logic_sat_builtin", "--count", "3"]
+    assert main(argv + ["--output", str(result_path)]) == 0
+    report = json.loads(capsys.readouterr().out.strip())
+    task_report = report["tasks"]["gsm8k_builtin"]
+    stages = task_report["stages"]
+    assert {"generate", "verify_cold", "verify_cached"} <= stages.keys()
+    assert {"cache_lookup", "rule", "cache_write", "cache_hit"} <= stages.keys()
+    assert 0 < task_report["unique_examples"] <= 3
+    assert stages["verify_cold"]["count"] == task_report["unique_examples"]
+    assert {"import_hvt", "verify_gsm8k"} <= report["startup"].keys()
+
+    baseline = json.loads(result_path.read_text())
+    for task in baseline["tasks"].values():
+        task["throughput"] = {key: value * 1000 for key, value in task["throughput"].items()}
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline))
+    assert main(argv + ["--baseline", str(baseline_path)]) == 1
+    regressions = json.loads(capsys.readouterr().out.strip())["regressions"]
+    assert any(item["metric"] == "throughput.cache_hit_per_s" for item in regressions)
+
+
+@pytest.mark.parametrize("extra", [[], ["--workers", "2", "--unordered"]])
+def test_cli_verify_batch_mixed_tasks(tmp_path, capsys, extra):
+    input_path = tmp_path / "records.jsonl"
+    records = [
+        {"id": "a", "prompt": "Q", "candidate": "4", "metadata": {"reference_answer": "4"}},
+        {"id": "b", "task": "logic_sat_builtin", "prompt": "Q", "candidate": "x=True",
+         "metadata": {"constraints": ["x"]}},
+        {"id": "c", "prompt": "Q", "candidate": "5", "metadata": {"reference_answer": "4"}},
+        {"id": "d", "task": "missing_task", "prompt": "Q", "candidate": "1"},
+        {"id": "e", "prompt": "Q", "candidate": "3", "metadata": {}},
+        {"id": "f", "prompt": "Q", "candidate": "3", "metadata": {"reference_answer": "3"}},
+    ]
+    lines = [json.dumps(record) for record in records] + ["{not json", "[1]"]
+    input_path.write_text("\n".join(lines) + "\n")
+    argv = ["--use-builtins", "verify-batch", "--input", str(input_path)]
+    argv += ["--task", "gsm8k_builtin", "--batch-size", "2", "--no-provenance", *extra]
+    assert main(argv) == 0
+    lines = [json.loads(line) for line in capsys.readouterr().out.strip().splitlines()]
+    if not extra:
+        assert [line["index"] for line in lines] == [0, 1, 2, 3, 4, 5, 6, 7]
+    by_index = {line["index"]: line for line in lines}
+    assert by_index[6]["error"].startswith("invalid JSON")
+    assert by_index[7]["error"] == "record is not a JSON object"
+    by_id = {line["id"]: line for line in lines if "id" in line}
+    assert by_id["a"]["verdict"] == "PASS" and by_id["a"]["task"] == "gsm8k_builtin"
+    assert by_id["b"]["verdict"] == "PASS" and by_id["b"]["task"] == "logic_sat_builtin"
+    assert by_id["c"]["verdict"] == "FAIL"
+    assert "not registered" in by_id["d"]["error"]
+    assert by_id["e"]["error"].startswith("ValueError")
+    assert by_id["f"]["verdict"] == "PASS" and "error" not in by_id["f"]
+    assert "provenance" not in by_id["a"]
+
+
+def test_cli_verify_batch_rejects_empty_batches(tmp_path, capsys):
+    input_path = tmp_path / "records.jsonl"
+    input_path.write_text(json.dumps({"prompt": "Q", "candidate": "4"}) + "\n")
+    with pytest.raises(SystemExit):
+        main(["verify-batch", "--input", str(input_path), "--batch-size", "0"])
+    assert "positive integer" in capsys.readouterr().err
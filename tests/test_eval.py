@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+import gzip
 import json
+import random
+from dataclasses import asdict
 
 import pytest
 
 from hvt import HybridVerifier
-from hvt.eval import EvalExample, evaluate_dataset, load_jsonl_dataset
+from hvt.builtins import register_builtin_tasks
+from hvt.eval import (
+    EvalExample,
+    JsonlDataset,
+    MutationEngine,
+    bench_startup,
+    collect_scores,
+    compare_to_baseline,
+    evaluate_dataset,
+    evaluate_sampled,
+    evaluate_stream,
+    iter_jsonl_dataset,
+    load_jsonl_dataset,
+    run_mutation_suite,
+    threshold_sweep,
+    wilson_interval,
+)
+from hvt.eval.perf import bench_task
+from hvt.model_verifiers import StaticJudge
 from hvt.registry import clear_registry, register_task
+from hvt.rules.code import PythonUnitTestRule
 from hvt.rules.math import gsm8k_exact_match
+from hvt.synlogic import FunctionImplementationTask, WordEquationTask
 
 
 @pytest.fixture(autouse=True)
@@ -52,3 +75,164 @@ def test_evaluation_metrics(tmp_path):
     loaded = load_jsonl_dataset(dataset_path)
     assert len(loaded) == len(dataset)
     assert loaded[0].metadata["reference_answer"] == "12"
+
+    for run in (evaluate_stream, collect_scores):
+        with pytest.raises(ValueError):
+            run(verifier, dataset, batch_size=0)
+
+
+def test_streaming_evaluation_from_gzip(tmp_path):
+    register_task(name="gsm8k_stream", rule_fn=gsm8k_exact_match)
+    verifier = HybridVerifier(task_name="gsm8k_stream")
+    dataset_path = tmp_path / "data.jsonl.gz"
+    with gzip.open(dataset_path, "wt", encoding="utf-8") as fh:
+        for idx in range(10):
+            fh.write(
+                json.dumps(
+                    {
+                        "prompt": "Q",
+                        "candidate": str(idx),
+                        "metadata": {"reference_answer": "4"},
+                        "label": idx == 4,
+                    }
+                )
+                + "\n"
+            )
+
+    partials = []
+    metrics = evaluate_stream(
+        verifier,
+        iter_jsonl_dataset(dataset_path),
+        batch_size=3,
+        report_every=4,
+        on_progress=partials.append,
+    )
+    assert metrics.total == 10
+    assert metrics.true_positive == 1 and metrics.true_negative == 9
+    assert [partial.total for partial in partials] == [6, 9]
+
+
+def test_threshold_sweep_matches_reevaluation():
+    class _LengthJudge(StaticJudge):
+        def score(self, prompt, candidate, metadata=None):
+            return len(candidate) / 10
+
+    examples = [
+        EvalExample(prompt="Q", candidate=cand, metadata={"reference_answer": "1"}, label=label)
+        for cand, label in [
+            ("1", True),
+            ("xxxxxxxxx", True),
+            ("xxxxxxx", True),
+            ("xxxxxx", False),
+            ("xxx", False),
+            ("xxxxxxxx", False),
+        ]
+    ]
+    records = None
+    for judge_min in (0.3, 0.65, 0.85):
+        clear_registry()
+        register_task(
+            name="gsm8k_sweep",
+            rule_fn=gsm8k_exact_match,
+            model_verifier=_LengthJudge(),
+            thresholds={"judge_min": judge_min},
+        )
+        verifier = HybridVerifier(task_name="gsm8k_sweep")
+        if records is None:
+            records = collect_scores(verifier, examples)
+        expected = evaluate_dataset(verifier, examples)
+        sweep = threshold_sweep(records, thresholds=[judge_min])
+        assert sweep.row(0)["tp"] == expected.true_positive
+        assert sweep.row(0)["fp"] == expected.false_positive
+        assert sweep.row(0)["precision"] == pytest.approx(expected.precision)
+
+    recommended = threshold_sweep(records).recommend(1.0)
+    assert recommended["threshold"] == pytest.approx(0.9)
+    assert recommended["recall"] == pytest.approx(2 / 3)
+
+
+def test_sampled_evaluation_stops_once_intervals_are_tight(tmp_path):
+    register_task(name="gsm8k_sampled", rule_fn=gsm8k_exact_match)
+    verifier = HybridVerifier(task_name="gsm8k_sampled")
+    dataset = [
+        EvalExample(
+            prompt="Q",
+            candidate="1" if idx % 10 else "2",
+            metadata={"reference_answer": "1"},
+            label=idx % 2 == 0,
+            task="even" if idx % 4 else "odd",
+        )
+        for idx in range(20000)
+    ]
+    result = evaluate_sampled(verifier, dataset, ci_width=0.05, batch_size=500, seed=3)
+    assert result.converged
+    assert result.metrics.total < len(dataset)
+    full = evaluate_dataset(verifier, dataset)
+    for name in ("precision", "recall"):
+        lo, hi = result.intervals[name]
+        assert hi - lo <= 0.05
+        assert lo <= getattr(full, name) <= hi
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+    path = tmp_path / "sampled.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        for example in dataset:
+            fh.write(json.dumps(asdict(example)) + "\n\n")
+    indexed = JsonlDataset(path)
+    assert len(indexed) == len(dataset)
+    assert indexed[-1] == dataset[-1] and indexed[5:7] == dataset[5:7]
+    streamed = evaluate_sampled(verifier, indexed, ci_width=0.05, batch_size=500, seed=3)
+    assert streamed.to_dict() == result.to_dict()
+
+
+def test_mutation_suite_reports_false_positive_rates_per_family():
+    register_task(name="gsm8k_builtin", rule_fn=gsm8k_exact_match)
+    register_task(name="code_exec_builtin", rule_fn=PythonUnitTestRule(timeout=10.0))
+    lookup = {
+        name: HybridVerifier(task_name=name) for name in ("gsm8k_builtin", "code_exec_builtin")
+    }
+    rng = random.Random(0)
+    examples = [WordEquationTask().generate(rng) for _ in range(5)]
+    examples.append(FunctionImplementationTask().generate(rng))
+
+    samples = list(MutationEngine().generate(examples, seed=1))
+    assert {sample.family for sample in samples} >= {"numeric_off_by_one", "code_sys_exit"}
+    assert all(sample.candidate != sample.metadata.get("reference_answer") for sample in samples)
+
+    report = run_mutation_suite(lookup, samples, batch_size=4, workers=2)
+    families = report["families"]
+    assert report["total"] == len(samples)
+    assert families["numeric_off_by_one"]["false_positive_rate"] == 0.0
+    assert families["code_wrong_return"]["false_positive_rate"] == 0.0
+    # `sys.exit(0)` before the tests makes the sandbox report success.
+    assert families["code_sys_exit"]["false_positives"] == 1
+
+
+def test_startup_probes_do_not_load_heavy_dependencies():
+    report = bench_startup(repeats=1)
+    assert report["import_hvt"]["heavy_modules"] == []
+    assert report["verify_gsm8k"]["heavy_modules"] == []
+    assert report["verify_gsm8k"]["p50_ms"] > 0
+
+
+def test_baseline_comparison_flags_tail_latency():
+    stage = {"p50_ms": 1.0, "p95_ms": 2.0, "p99_ms": 3.0}
+    baseline = {"tasks": {"gsm8k_builtin": {"stages": {"verify_cold": stage}}}}
+    current = {
+        "tasks": {"gsm8k_builtin": {"stages": {"verify_cold": {**stage, "p99_ms": 9.0}}}}
+    }
+    regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+    assert [item["metric"] for item in regressions] == ["verify_cold.p99_ms"]
+
+
+
+def test_bench_task_times_each_unique_example_as_a_cache_miss(tmp_path):
+    register_builtin_tasks()
+    rng = random.Random(0)
+    examples = [WordEquationTask().generate(rng) for _ in range(3)]
+    report = bench_task("gsm8k_builtin", examples * 4, cache_dir=str(tmp_path))
+    stages = report["stages"]
+    assert report["unique_examples"] == len({ex.prompt for ex in examples})
+    assert stages["verify_cold"]["count"] == report["unique_examples"]
+    assert stages["cache_write"]["count"] == report["unique_examples"]
+    assert stages["cache_hit"]["count"] == report["unique_examples"]
@@ -1,9 +1,28 @@
 from __future__ import annotations
 
+import json
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
-from hvt import HybridVerifier, register_task
+from hvt import (
+    ComponentSpec,
+    HybridVerifier,
+    JudgeStage,
+    JudgeStageSpec,
+    MultiTaskVerifier,
+    TaskSpec,
+    register_task,
+    register_task_spec,
+    restore_registry,
+    snapshot_registry,
+)
+from hvt.bulk import verify_chunk, verify_records
+from hvt.metrics import MetricsRegistry
 from hvt.registry import clear_registry
+from hvt.types import Verdict
 from hvt.rules.math import gsm8k_exact_match
 from hvt.rules.code import PythonUnitTestRule
 from hvt.rules.logic import LogicSATRule
@@ -109,3 +128,179 @@ def test_logic_rule(tmp_path):
         metadata={"constraints": ["x", "Not(y)"]},
     )
     assert res.verdict.name == "PASS"
+
+
+class _CountingJudge(StaticJudge):
+    def __init__(self, confidence: float, model_name: str) -> None:
+        super().__init__(confidence=confidence, model_name=model_name)
+        self.calls = 0
+
+    def score(self, prompt, candidate, metadata=None):
+        self.calls += 1
+        return super().score(prompt, candidate, metadata)
+
+
+def test_judge_cascade_stops_when_confident():
+    cheap = _CountingJudge(confidence=0.99, model_name="cheap")
+    expensive = _CountingJudge(confidence=0.1, model_name="expensive")
+    register_task(
+        name="cascade",
+        rule_fn=gsm8k_exact_match,
+        judges=[cheap, expensive],
+        thresholds={"judge_min": 0.8, "judge_margin": 0.1},
+    )
+    result = HybridVerifier(task_name="cascade").verify(
+        prompt="Q", candidate_answer="13", metadata={"reference_answer": "12"}
+    )
+    assert result.verdict.name == "PASS"
+    assert result.provenance.model_name == "cheap"
+    assert expensive.calls == 0
+
+
+def test_judge_cascade_escalates_uncertain_band():
+    cheap = _CountingJudge(confidence=0.75, model_name="cheap")
+    expensive = _CountingJudge(confidence=0.2, model_name="expensive")
+    register_task(
+        name="cascade",
+        rule_fn=gsm8k_exact_match,
+        judges=[cheap, JudgeStage(verifier=expensive)],
+        thresholds={"judge_min": 0.8, "judge_margin": 0.1},
+    )
+    result = HybridVerifier(task_name="cascade").verify(
+        prompt="Q", candidate_answer="13", metadata={"reference_answer": "12"}
+    )
+    assert result.verdict.name == "FAIL"
+    assert result.provenance.model_name == "expensive"
+    assert [step["model_name"] for step in result.provenance.extra["judge_cascade"]] == [
+        "cheap",
+        "expensive",
+    ]
+
+
+def test_multitask_verifier_routes_and_preserves_order(tmp_path):
+    register_task(name="mt_gsm8k", rule_fn=gsm8k_exact_match)
+    register_task(name="mt_logic", rule_fn=LogicSATRule())
+    metrics = MetricsRegistry()
+    router = MultiTaskVerifier(cache_dir=str(tmp_path), metrics=metrics, workers=2)
+    tasks = ["mt_gsm8k", "mt_logic", "mt_gsm8k", "mt_logic"]
+    candidates = ["4", "x=True", "5", "x=False"]
+    metadata = [
+        {"reference_answer": "4"},
+        {"constraints": ["x"]},
+        {"reference_answer": "4"},
+        {"constraints": ["x"]},
+    ]
+    results = router.verify_batch(tasks, ["Q"] * 4, candidates, metadata)
+    assert [result.verdict for result in results] == [
+        Verdict.PASS,
+        Verdict.PASS,
+        Verdict.FAIL,
+        Verdict.FAIL,
+    ]
+    assert [result.provenance.task_name for result in results] == tasks
+    assert router["mt_gsm8k"].cache is router["mt_logic"].cache
+    assert router["mt_gsm8k"].metrics is metrics
+    again = router.verify_batch(tasks, ["Q"] * 4, candidates, metadata)
+    assert all(result.provenance.cache_hit for result in again)
+    with pytest.raises(KeyError):
+        router.verify_batch(["unknown"], ["Q"], ["1"])
+
+
+def test_multitask_mapping_is_lazy():
+    register_task(name="lazy_a", rule_fn=gsm8k_exact_match)
+    register_task(name="lazy_b", rule_fn=gsm8k_exact_match)
+    router = MultiTaskVerifier()
+    assert "lazy_a" not in router and len(router) == 0
+    assert router.get("missing") is None
+    assert router.get("lazy_a") is router["lazy_a"]
+    assert "lazy_a" in router and "lazy_b" not in router
+    assert list(router) == ["lazy_a"]
+
+
+def test_verify_records_sees_re_registered_tasks():
+    def _pass(candidate, metadata):
+        return True, {}
+
+    def _fail(candidate, metadata):
+        return False, {}
+
+    records = [(0, {"task": "rebound", "candidate": "x"})]
+    register_task(name="rebound", rule_fn=_pass)
+    assert [out["verdict"] for out in verify_records(records)] == ["PASS"]
+    register_task(name="rebound", rule_fn=_fail)
+    assert [out["verdict"] for out in verify_records(records)] == ["FAIL"]
+    clear_registry()
+    [output] = verify_records(records)
+    assert "error" in output
+    with pytest.raises(ValueError):
+        next(verify_records(records, batch_size=0))
+
+
+def test_registry_snapshot_bootstraps_spawned_workers():
+    register_task_spec(
+        TaskSpec(
+            name="spec_gsm8k",
+            rule=ComponentSpec("hvt.rules.math:gsm8k_exact_match", call=False),
+            judges=[
+                JudgeStageSpec(
+                    ComponentSpec("hvt.model_verifiers:StaticJudge", kwargs={"confidence": 0.9})
+                )
+            ],
+        )
+    )
+    register_task(name="plain_logic", rule_fn=LogicSATRule())
+    register_task(name="bound_rule", rule_fn=PythonUnitTestRule().__call__)
+    with pytest.raises(ValueError):
+        snapshot_registry(strict=True)
+    with pytest.warns(UserWarning, match="plain_logic, bound_rule"):
+        snapshot = snapshot_registry()
+    assert [spec.name for spec in snapshot] == ["spec_gsm8k"]
+    payloads = json.loads(json.dumps([spec.to_dict() for spec in snapshot]))
+    restored = [TaskSpec.from_dict(payload) for payload in payloads]
+    assert restored == pickle.loads(pickle.dumps(snapshot))
+
+    record = {"task": "spec_gsm8k", "candidate": "7", "metadata": {"reference_answer": "7"}}
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=restore_registry,
+        initargs=(snapshot,),
+    ) as pool:
+        [output] = pool.submit(verify_chunk, [(0, record)]).result()
+    assert output["verdict"] == "PASS"
+
+
+def test_verify_columns_matches_materialized_results(tmp_path):
+    register_task(
+        name="columns",
+        rule_fn=gsm8k_exact_match,
+        judges=[StaticJudge(confidence=0.9, model_name="judge")],
+        cache_dir=str(tmp_path),
+    )
+    verifier = HybridVerifier(task_name="columns")
+    candidates = ["4", "5", "4"]
+    metadata = [{"reference_answer": "4"}] * 3
+    batch = verifier.verify_columns(["Q", "Q", "Other"], candidates, metadata)
+    assert batch.passed.tolist() == [True, True, True]
+    assert batch.rule_passed.tolist() == [True, False, True]
+    assert batch.judge_invoked.tolist() == [False, True, False]
+    assert batch.scores.tolist() == pytest.approx([1.0, 0.9, 1.0])
+    assert batch.stage_seconds.shape == (3, 5)
+
+    judged = batch[1]
+    assert judged is batch[1]
+    assert judged.provenance.model_name == "judge"
+    assert judged.provenance.model_confidence == pytest.approx(0.9)
+    assert judged.diagnostics["judge_score"] == pytest.approx(0.9)
+    assert set(judged.provenance.extra["timings"]) == {
+        "cache_lookup",
+        "rule",
+        "judge",
+        "calibration",
+        "cache_write",
+    }
+
+    again = verifier.verify_columns(["Q", "Q", "Other"], candidates, metadata)
+    assert again.cache_hit.all()
+    assert again.judge_invoked.tolist() == [False, True, False]
+    assert [result.verdict for result in again] == [result.verdict for result in batch]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from hvt import HybridVerifier
+from hvt.metrics import MetricsRegistry
+from hvt.model_verifiers import StaticJudge
+from hvt.registry import clear_registry, register_task
+from hvt.rules.math import gsm8k_exact_match
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def test_stage_metrics_and_prometheus_export(tmp_path):
+    registry = MetricsRegistry()
+    register_task(
+        name="gsm8k_metrics",
+        rule_fn=gsm8k_exact_match,
+        model_verifier=StaticJudge(confidence=0.9),
+        cache_dir=str(tmp_path / "cache"),
+    )
+    verifier = HybridVerifier(task_name="gsm8k_metrics", metrics=registry)
+    meta = {"reference_answer": "12"}
+    verifier.verify(prompt="Q", candidate_answer="12", metadata=meta)
+    judged = verifier.verify(prompt="Q", candidate_answer="13", metadata=meta)
+    cached = verifier.verify(prompt="Q", candidate_answer="13", metadata=meta)
+
+    stages = judged.provenance.extra["timings"].keys()
+    assert {"cache_lookup", "rule", "judge", "calibration"} <= stages
+    assert set(cached.provenance.extra["timings"]) == {"cache_lookup"}
+
+    counters = {
+        name: series[0]["value"] for name, series in registry.snapshot()["counters"].items()
+    }
+    assert counters["hvt_verifications_total"] == 3
+    assert counters["hvt_cache_hits_total"] == 1
+    assert counters["hvt_rule_passes_total"] == 1
+    assert counters["hvt_judge_invocations_total"] == 1
+
+    text = registry.render_prometheus()
+    assert "# TYPE hvt_stage_duration_seconds histogram" in text
+    assert 'hvt_stage_duration_seconds_count{stage="rule",task="gsm8k_metrics"} 2' in text
+    assert 'hvt_cache_hits_total{task="gsm8k_metrics"} 1.0' in text
+
+    registry.reset()
+    assert registry.snapshot()["counters"]["hvt_verifications_total"][0]["value"] == 0
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hvt.integrations import VerificationClient, build_remote_reward_fn
+from hvt.metrics import MetricsRegistry
+from hvt.registry import clear_registry, register_task
+from hvt.rules.math import gsm8k_exact_match
+from hvt.server import VerificationService, make_server
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+@pytest.fixture
+def server():
+    register_task(name="served_gsm8k", rule_fn=gsm8k_exact_match)
+    metrics = MetricsRegistry()
+    service = VerificationService(max_batch_size=32, max_wait=0.05, metrics=metrics)
+    httpd = make_server("127.0.0.1", 0, service=service)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+    service.close()
+
+
+def test_service_micro_batches_concurrent_requests(server):
+    client = VerificationClient(server.url)
+    assert client.health()
+
+    def _request(answer: str) -> str:
+        results = client.verify("served_gsm8k", ["Q"], [answer], [{"reference_answer": "4"}])
+        return results[0]["verdict"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        verdicts = list(pool.map(_request, ["4", "5"] * 8))
+    assert verdicts == ["PASS", "FAIL"] * 8
+    sizes = server.service.metrics.snapshot()["histograms"]["hvt_server_batch_size"][0]
+    assert sizes["sum"] == 16
+    assert sizes["count"] < 16
+
+    reward_fn = build_remote_reward_fn(client, "served_gsm8k")
+    samples = [
+        {"prompt": "Q", "completion": answer, "metadata": {"reference_answer": "4"}}
+        for answer in ("4", "3")
+    ]
+    assert reward_fn(samples) == [1.0, 0.0]
+    with pytest.raises(RuntimeError, match="404"):
+        client.verify("missing_task", ["Q"], ["1"])
+
+
+def test_bad_item_does_not_fail_concurrent_requests(server):
+    client = VerificationClient(server.url)
+    barrier = threading.Barrier(2)
+
+    def _request(metadata: dict) -> dict:
+        barrier.wait()
+        return client.verify("served_gsm8k", ["Q"], ["4"], [metadata])[0]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        bad = pool.submit(_request, {})
+        good = pool.submit(_request, {"reference_answer": "4"})
+        bad_result, good_result = bad.result(), good.result()
+    assert good_result["verdict"] == "PASS"
+    assert bad_result["error"].startswith("ValueError")
+    sizes = server.service.metrics.snapshot()["histograms"]["hvt_server_batch_size"][0]
+    assert sizes["count"] == 1  # both requests shared one micro-batch
@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import random
+
 import pytest
+import sympy as sp
 
 from hvt import HybridVerifier
 from hvt.registry import clear_registry, register_task
 from hvt.rules import LogicSATRule, gsm8k_exact_match, sympy_equivalence
-from hvt.synlogic import default_tasks, export_jsonl, load_synlogic_dataset, synthesize_dataset
+from hvt.builtins import register_builtin_tasks
+from hvt.synlogic import (
+    AuditStats,
+    BloomDeduper,
+    ExactDeduper,
+    TemplateExpressionTask,
+    TrustPolicy,
+    audit_examples,
+    canonical_key,
+    default_tasks,
+    export_jsonl,
+    generate_examples,
+    load_synlogic_dataset,
+    stream_synthesis,
+    synthesize_dataset,
+    synthesize_parallel,
+    task_space_size,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -30,3 +50,152 @@ def test_synlogic_export(tmp_path):
     loaded = load_synlogic_dataset(output_path)
     assert len(loaded) == len(dataset)
     assert all(example.reward in (0.0, 1.0) for example in loaded)
+
+
+def test_parallel_synthesis_is_worker_count_invariant(tmp_path):
+    register_builtin_tasks()
+    outputs = {}
+    for workers in (1, 2):
+        out_dir = tmp_path / f"workers-{workers}"
+        summary = synthesize_parallel(
+            default_tasks(),
+            out_dir,
+            per_task=6,
+            seed=11,
+            workers=workers,
+            chunk_size=2,
+            chunks_per_shard=4,
+            cache_dir=str(tmp_path / f"cache-{workers}"),
+            initializer=register_builtin_tasks,
+        )
+        assert summary["num_examples"] == 6 * len(default_tasks())
+        outputs[workers] = {
+            path.name: path.read_bytes() for path in sorted(out_dir.glob("part-*.jsonl"))
+        }
+    assert len(outputs[1]) > 1
+    assert outputs[1] == outputs[2]
+
+
+def _reject_all(candidate, metadata):
+    return False, {}
+
+
+def test_in_process_synthesis_sees_reregistered_tasks(tmp_path):
+    register_builtin_tasks()
+    kwargs = dict(per_task=4, seed=3, workers=1, chunk_size=2)
+    tasks = [task for task in default_tasks() if task.name == "word_equations"]
+    assert synthesize_parallel(tasks, tmp_path / "first", **kwargs)["num_passed"] == 4
+    register_task(name="gsm8k_builtin", rule_fn=_reject_all)
+    assert synthesize_parallel(tasks, tmp_path / "second", **kwargs)["num_passed"] == 0
+
+
+def test_parallel_synthesis_replaces_stale_shards(tmp_path):
+    register_builtin_tasks()
+    tasks = [task for task in default_tasks() if task.name == "word_equations"]
+    kwargs = dict(seed=3, chunk_size=1, chunks_per_shard=1)
+    with pytest.raises(ValueError):
+        synthesize_parallel(tasks, tmp_path, per_task=1, seed=3, chunks_per_shard=0)
+    assert len(synthesize_parallel(tasks, tmp_path, per_task=3, **kwargs)["shards"]) == 3
+    summary = synthesize_parallel(tasks, tmp_path, per_task=1, **kwargs)
+    assert sorted(path.name for path in tmp_path.glob("part-*.jsonl")) == ["part-00000.jsonl"]
+    assert summary["shards"] == [str(tmp_path / "part-00000.jsonl")]
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".zst"])
+def test_stream_synthesis_matches_materialized_export(tmp_path, suffix):
+    if suffix == ".zst":
+        pytest.importorskip("zstandard")
+    register_builtin_tasks()
+    lookup = {
+        name: HybridVerifier(task_name=name)
+        for name in ("logic_sat_builtin", "gsm8k_builtin", "math_expr_builtin")
+    }
+    eager_path = tmp_path / "eager.jsonl"
+    export_jsonl(synthesize_dataset(default_tasks(), lookup, per_task=3, seed=5), eager_path)
+    stream_path = tmp_path / f"stream.jsonl{suffix}"
+    summary = stream_synthesis(
+        default_tasks(), lookup, stream_path, per_task=3, seed=5, batch_size=2, flush_every=1
+    )
+    assert summary["num_examples"] == summary["num_generated"] == 3 * len(default_tasks())
+    assert load_synlogic_dataset(stream_path) == load_synlogic_dataset(eager_path)
+    with pytest.raises(ValueError):
+        stream_synthesis(default_tasks(), lookup, tmp_path / "empty.jsonl", batch_size=0)
+    assert not (tmp_path / "empty.jsonl").exists()
+
+
+@pytest.mark.parametrize("deduper", [ExactDeduper(), BloomDeduper(capacity=1000, error_rate=0.01)])
+def test_stream_synthesis_dedupes_before_verification(tmp_path, deduper):
+    register_builtin_tasks()
+    lookup = {name: HybridVerifier(task_name=name) for name in ("gsm8k_builtin",)}
+    tasks = [task for task in default_tasks() if task.name == "word_equations"]
+    summary = stream_synthesis(
+        tasks, lookup, tmp_path / "dedup.jsonl", per_task=400, seed=3, deduper=deduper
+    )
+    report = summary["dedup"]["word_equations"]
+    assert report["generated"] == 400
+    assert report["unique"] == summary["num_verified"] == summary["num_examples"] < 400
+    assert report["space_size_exact"] and report["space_size"] == 120
+    assert report["unique"] <= 120
+    prompts = [example.prompt for example in load_synlogic_dataset(tmp_path / "dedup.jsonl")]
+    assert len(set(prompts)) == len(prompts)
+
+
+def test_task_space_sizes_match_enumeration():
+    rng = random.Random(0)
+    for task in default_tasks():
+        if task.name == "boolean_constraints":
+            continue  # 69k combinations; too slow to saturate here
+        seen = {canonical_key(task.generate(rng)) for _ in range(5000)}
+        assert len(seen) == task_space_size(task)
+    assert task_space_size(TemplateExpressionTask()) is None
+
+
+def test_trusted_synthesis_audits_a_sample(tmp_path):
+    register_builtin_tasks()
+    lookup = {
+        name: HybridVerifier(task_name=name)
+        for name in ("logic_sat_builtin", "gsm8k_builtin", "math_expr_builtin")
+    }
+    policy = TrustPolicy(audit_rate=0.0, audit_first=3, tasks={"word_equations"})
+    summary = stream_synthesis(
+        default_tasks(), lookup, tmp_path / "trusted.jsonl", per_task=10, seed=1, trust=policy
+    )
+    audit = summary["audit"]
+    assert set(audit) == {"word_equations"}
+    assert audit["word_equations"]["audited"] == 3
+    assert audit["word_equations"]["audit_rate"] == pytest.approx(0.3)
+    assert summary["num_verified"] == 3 + 2 * 10
+    loaded = [
+        example
+        for example in load_synlogic_dataset(tmp_path / "trusted.jsonl")
+        if example.task_name == "word_equations"
+    ]
+    assert [example.extra.get("audited", False) for example in loaded] == [True] * 3 + [False] * 7
+    assert all(example.extra["verdict"] == "TRUSTED" for example in loaded[3:])
+
+
+def test_audit_keeps_a_bounded_sample_of_failures():
+    register_builtin_tasks()
+    lookup = {"logic_sat_builtin": HybridVerifier(task_name="logic_sat_builtin")}
+    tasks = [task for task in default_tasks() if task.name == "boolean_constraints"]
+    stats = AuditStats(max_failures_kept=2)
+    policy = TrustPolicy(audit_rate=1.0)
+    examples = generate_examples(tasks, per_task=60, seed=2)
+    list(audit_examples(examples, lookup, policy, stats=stats))
+    report = stats.to_dict()["boolean_constraints"]
+    assert report["failed"] > 2
+    assert len(stats.failures["boolean_constraints"]) == 2
+    assert len(report["failure_examples"]) == 2
+
+
+@pytest.mark.parametrize("difficulty", ["easy", "medium", "hard"])
+def test_template_expressions_are_correct_by_construction(difficulty):
+    task = TemplateExpressionTask()
+    rng = random.Random(difficulty)
+    templates = set()
+    for _ in range(60):
+        example = task.generate(rng, difficulty)
+        templates.add(example.metadata["template"])
+        expression = example.prompt.split(": ", 1)[1]
+        assert sp.simplify(sp.sympify(expression) - sp.sympify(example.canonical_answer)) == 0
+    assert len(templates) == len(task.templates)
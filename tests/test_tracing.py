@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from hvt import HybridVerifier
+from hvt.model_verifiers import StaticJudge
+from hvt.registry import clear_registry, register_task
+from hvt.rules.math import gsm8k_exact_match
+from hvt.tracing import ChromeTraceCollector, Tracer, set_tracer
+
+
+@pytest.fixture(autouse=True)
+def _clear_registry():
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def test_chrome_trace_collector_records_stage_spans(tmp_path):
+    collector = ChromeTraceCollector(tmp_path / "trace.json")
+    previous = set_tracer(Tracer([collector]))
+    try:
+        register_task(
+            name="gsm8k_trace",
+            rule_fn=gsm8k_exact_match,
+            model_verifier=StaticJudge(confidence=0.9),
+        )
+        verifier = HybridVerifier(task_name="gsm8k_trace")
+        verifier.verify(prompt="Q", candidate_answer="13", metadata={"reference_answer": "12"})
+
+        set_tracer(Tracer([collector], sample_rate=0.0))
+        verifier.verify(prompt="Q", candidate_answer="14", metadata={"reference_answer": "12"})
+    finally:
+        set_tracer(previous)
+
+    trace = json.loads(collector.write().read_text())
+    events = trace["traceEvents"]
+    names = [event["name"] for event in events if event["ph"] == "B"]
+    assert names == ["verify_batch", "cache_lookup", "rule", "judge", "calibration", "cache_write"]
+    assert len([event for event in events if event["ph"] == "E"]) == len(names)
+    rule_start = next(e for e in events if e["name"] == "rule" and e["ph"] == "B")
+    assert rule_start["args"]["candidate_length"] == 2
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import threading
+
+import numpy as np
 import pytest
 
 from hvt import HybridVerifier
-from hvt.integrations import VerifierRewardAdapter, build_trl_reward_fn
+from hvt.integrations import AsyncRewardComputer, VerifierRewardAdapter, build_trl_reward_fn
 from hvt.registry import clear_registry, register_task
 from hvt.rules.math import gsm8k_exact_match
 
@@ -34,3 +37,77 @@ def test_trl_adapter():
         }
     ])
     assert rewards == [0.0]
+
+
+class _CountingRule:
+    __name__ = "counting_gsm8k"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, candidate, metadata):
+        self.calls += 1
+        return gsm8k_exact_match(candidate, metadata)
+
+
+def test_group_rewards_dedupe_completions(tmp_path):
+    rule = _CountingRule()
+    register_task(name="trl_group", rule_fn=rule)
+    adapter = VerifierRewardAdapter(HybridVerifier(task_name="trl_group", cache_dir=str(tmp_path)))
+    meta_a, meta_b = {"reference_answer": "12"}, {"reference_answer": "7"}
+    prompts = ["A"] * 4 + ["B"] * 4
+    completions = ["12", "11", "12", "12", "7", "7", "8", "7"]
+    metadata = [meta_a] * 4 + [meta_b] * 4
+
+    rewards = adapter.rewards(prompts, completions, metadata)
+    assert isinstance(rewards, np.ndarray)
+    assert rewards.tolist() == [1.0, 0.0, 1.0, 1.0, 1.0, 1.0, 0.0, 1.0]
+    assert rule.calls == 4
+
+    records = adapter(prompts, completions, metadata, include_provenance=False)
+    assert [record.reward for record in records] == rewards.tolist()
+    assert "provenance" not in records[0].metadata
+    assert records[0] is not records[2]
+    assert records[0].metadata is not records[2].metadata
+    first, _, third = adapter(prompts, completions, metadata)[:3]
+    assert first.metadata["provenance"] is not third.metadata["provenance"]
+
+
+def test_reward_list_keeps_exact_reward_values():
+    register_task(name="trl_exact", rule_fn=gsm8k_exact_match)
+    adapter = VerifierRewardAdapter(
+        HybridVerifier(task_name="trl_exact"), reward_pass=0.1, reward_fail=-0.3
+    )
+    samples = [
+        {"prompt": "Q", "completion": "12", "metadata": {"reference_answer": "12"}},
+        {"prompt": "Q", "completion": "11", "metadata": {"reference_answer": "12"}},
+    ]
+    assert build_trl_reward_fn(adapter)(samples) == [0.1, -0.3]
+    assert build_trl_reward_fn(adapter, as_array=True)(samples).dtype == np.float32
+
+
+def test_async_rewards_default_stragglers_at_deadline():
+    release = threading.Event()
+
+    def rule(candidate, metadata):
+        if candidate == "hang":
+            release.wait(5)
+        return gsm8k_exact_match(candidate, metadata)
+
+    register_task(name="trl_async", rule_fn=rule)
+    adapter = VerifierRewardAdapter(HybridVerifier(task_name="trl_async"))
+    samples = [
+        {"prompt": "Q", "completion": answer, "metadata": {"reference_answer": "3"}}
+        for answer in ("3", "4", "hang", "3")
+    ]
+    with AsyncRewardComputer(adapter, chunk_size=2, deadline=0.5, default_reward=-1.0) as pool:
+        future = pool.submit(samples)
+        rewards = future.result()
+        release.set()
+    assert rewards.tolist() == [1.0, 0.0, -1.0, -1.0]
+    assert [record.metadata["deadline_exceeded"] for record in future.records()] == [
+        False,
+        False,
+        True,
+        True,
+    ]